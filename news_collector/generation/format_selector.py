@@ -18,6 +18,7 @@ from news_collector.models.generated_news import (
 from news_collector.models.analyzed_news import (
     EnrichedNews,
     AnalyzedNews,
+    EntityType,
     TextComplexity,
 )
 from news_collector.models.news import NewsWithScores
@@ -234,8 +235,8 @@ class FormatSelector:
 
         # 장소/인물 엔티티 많음
         if analysis:
-            loc_entities = sum(1 for e in analysis.entities if e.type.value == "LOC")
-            person_entities = sum(1 for e in analysis.entities if e.type.value == "PERSON")
+            loc_entities = sum(1 for e in analysis.entities if e.type is EntityType.LOC)
+            person_entities = sum(1 for e in analysis.entities if e.type is EntityType.PERSON)
 
             if loc_entities >= 2:
                 score += 0.1  # 지도/사진 가능
@@ -397,7 +398,7 @@ class FormatSelector:
         spec = self.format_specs.get(fmt)
 
         if spec:
-            required = spec.structure.copy()
+            required = list(spec.structure)
             optional = ["image", "quote", "background"]
         else:
             required = ["title", "body"]
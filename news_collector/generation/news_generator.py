@@ -21,6 +21,7 @@ from news_collector.models.generated_news import (
     GenerationRequest,
     GenerationResponse,
     FORMAT_SPECS,
+    to_format,
 )
 from news_collector.models.analyzed_news import EnrichedNews
 from news_collector.models.news import NewsWithScores
@@ -680,7 +681,7 @@ class NewsGenerator:
         if target_format is None and enriched_news.generation_suitability:
             recommended = enriched_news.generation_suitability.recommended_formats
             if recommended:
-                target_format = NewsFormat(recommended[0])
+                target_format = to_format(recommended[0])
 
         return self.generate(
             source_news=[enriched_news.news],
@@ -1,12 +1,10 @@
 """API 기반 수집 커넥터"""
 
-import json
 import time
+from datetime import datetime
 from typing import List, Optional
-from urllib.request import urlopen, Request
-from urllib.parse import urlencode
 
-from news_collector.ingestion.base_connector import BaseConnector
+from news_collector.ingestion.base_connector import BaseConnector, parse_json
 from news_collector.models.raw_news import RawNewsRecord
 from news_collector.models.source import NewsSource
 from news_collector.utils.logger import get_logger
@@ -29,23 +27,22 @@ class APIConnector(BaseConnector):
 
         query = " ".join(keywords) if keywords else ""
         params = {"query": query, "display": min(limit, 100), "start": 1, "sort": "date"}
-        url = f"{self.source.base_url}?{urlencode(params)}"
 
-        headers = {"User-Agent": self.source.user_agent}
+        headers = {}
         if self._api_key:
             headers["X-Naver-Client-Id"] = self._api_key
             headers["X-Naver-Client-Secret"] = self._api_secret
 
         try:
-            req = Request(url, headers=headers)
-            with urlopen(req, timeout=15) as resp:
-                status = resp.status
-                data = json.loads(resp.read().decode("utf-8"))
+            resp = await self._http_get(self.source.base_url, params=params, headers=headers)
+            status = resp.status_code
+            data = parse_json(resp.content)
         except Exception as e:
             logger.error("API 수집 실패: %s - %s", self.source.id, e)
             return []
 
         elapsed_ms = int((time.time() - start) * 1000)
+        fetched_at = datetime.now()
         records: List[RawNewsRecord] = []
 
         items = data.get("items", data.get("articles", []))
@@ -60,6 +57,7 @@ class APIConnector(BaseConnector):
                 page_language=self.source.default_locale[:2],
                 http_status=status,
                 response_time_ms=elapsed_ms,
+                fetch_timestamp=fetched_at,
             )
             records.append(record)
 
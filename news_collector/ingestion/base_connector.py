@@ -1,11 +1,85 @@
 """수집 커넥터 베이스 클래스"""
 
+import asyncio
+import json
+import threading
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Any, Awaitable, Dict, List, Optional, TypeVar
+
+import requests
+from requests.adapters import HTTPAdapter
 
 from news_collector.models.raw_news import RawNewsRecord
 from news_collector.models.source import NewsSource
 
+try:
+    import orjson  # 선택적 의존성: 빠른 JSON 파싱
+except ImportError:
+    orjson = None
+
+# HTTP 커넥션 풀 설정 (keep-alive 소켓 재사용)
+HTTP_POOL_CONNECTIONS = 20
+HTTP_POOL_MAXSIZE = 100
+HTTP_TIMEOUT = 15.0
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+_background_loop: Optional[asyncio.AbstractEventLoop] = None
+_background_loop_lock = threading.Lock()
+
+T = TypeVar("T")
+
+
+def get_http_session() -> requests.Session:
+    """모든 커넥터가 공유하는 HTTP 세션 (지연 생성)."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=HTTP_POOL_CONNECTIONS,
+                    pool_maxsize=HTTP_POOL_MAXSIZE,
+                )
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                _session = session
+    return _session
+
+
+def parse_json(content: bytes) -> Any:
+    """응답 바이트를 str 디코딩 없이 바로 JSON 파싱 (orjson 우선)."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def _get_background_loop() -> asyncio.AbstractEventLoop:
+    """동기 호출용 공유 이벤트 루프 (데몬 스레드에서 실행, 지연 생성)."""
+    global _background_loop
+    if _background_loop is None:
+        with _background_loop_lock:
+            if _background_loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=loop.run_forever, name="news-collector-loop", daemon=True
+                )
+                thread.start()
+                _background_loop = loop
+    return _background_loop
+
+
+def run_sync(coro: Awaitable[T]) -> T:
+    """
+    코루틴을 공유 백그라운드 루프에서 실행하고 결과를 기다림.
+
+    호출마다 이벤트 루프를 새로 만들지 않으며, 호출 측에 이미 실행 중인
+    루프가 있어도 (Jupyter 등) 그대로 사용할 수 있다.
+    공유 루프 위에서 실행 중인 코루틴 안에서는 호출하지 말 것 (교착).
+    """
+    return asyncio.run_coroutine_threadsafe(coro, _get_background_loop()).result()
+
 
 class BaseConnector(ABC):
     """모든 수집 커넥터의 추상 베이스."""
@@ -17,3 +91,29 @@ class BaseConnector(ABC):
     async def fetch(self, keywords: List[str] = None, limit: int = 20) -> List[RawNewsRecord]:
         """소스에서 뉴스 수집."""
         ...
+
+    async def _http_get(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: float = HTTP_TIMEOUT,
+    ) -> requests.Response:
+        """
+        공유 세션으로 GET 요청 (이벤트 루프를 막지 않도록 스레드에서 실행).
+
+        Raises:
+            requests.RequestException: 네트워크 오류 또는 4xx/5xx 응답.
+        """
+        request_headers = {"User-Agent": self.source.user_agent}
+        if headers:
+            request_headers.update(headers)
+        resp = await asyncio.to_thread(
+            get_http_session().get,
+            url,
+            params=params,
+            headers=request_headers,
+            timeout=timeout,
+        )
+        resp.raise_for_status()
+        return resp
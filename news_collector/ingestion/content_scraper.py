@@ -23,6 +23,17 @@ DEFAULT_TIMEOUT = 10  # 초
 REQUEST_DELAY = 0.5  # 요청 간 지연 (초)
 USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
 
+# 이미지 추출용 패턴 (페이지마다 호출되므로 미리 컴파일)
+_IMG_TAG_PATTERN = re.compile(r'<img[^>]+>', re.IGNORECASE)
+_IMG_SRC_ATTR_PATTERN = re.compile(r'src=["\']([^"\']+)["\']', re.IGNORECASE)
+_IMG_ALT_ATTR_PATTERN = re.compile(r'alt=["\']([^"\']*)["\']', re.IGNORECASE)
+_IMG_TITLE_ATTR_PATTERN = re.compile(r'title=["\']([^"\']*)["\']', re.IGNORECASE)
+_IMG_CLASS_ATTR_PATTERN = re.compile(r'class=["\']([^"\']*)["\']', re.IGNORECASE)
+_OG_IMAGE_PATTERNS = (
+    re.compile(r'<meta[^>]+property=["\']og:image["\'][^>]+content=["\']([^"\']+)["\']', re.IGNORECASE),
+    re.compile(r'<meta[^>]+content=["\']([^"\']+)["\'][^>]+property=["\']og:image["\']', re.IGNORECASE),
+)
+
 
 @dataclass
 class ImageInfo:
@@ -333,12 +344,11 @@ class ContentScraper:
         try:
             # 정규식으로 img 태그 전체 추출 (src + 속성들)
             # <img ... src="..." alt="..." title="..." class="..." ...>
-            img_tag_pattern = r'<img[^>]+>'
-            img_tags = re.findall(img_tag_pattern, html, re.IGNORECASE)
+            img_tags = _IMG_TAG_PATTERN.findall(html)
 
             for img_tag in img_tags:
                 # src 추출
-                src_match = re.search(r'src=["\']([^"\']+)["\']', img_tag, re.IGNORECASE)
+                src_match = _IMG_SRC_ATTR_PATTERN.search(img_tag)
                 if not src_match:
                     continue
 
@@ -350,15 +360,15 @@ class ContentScraper:
                     continue
 
                 # alt 추출
-                alt_match = re.search(r'alt=["\']([^"\']*)["\']', img_tag, re.IGNORECASE)
+                alt_match = _IMG_ALT_ATTR_PATTERN.search(img_tag)
                 alt_text = alt_match.group(1) if alt_match else ""
 
                 # title 추출
-                title_match = re.search(r'title=["\']([^"\']*)["\']', img_tag, re.IGNORECASE)
+                title_match = _IMG_TITLE_ATTR_PATTERN.search(img_tag)
                 title_text = title_match.group(1) if title_match else ""
 
                 # class 추출
-                class_match = re.search(r'class=["\']([^"\']*)["\']', img_tag, re.IGNORECASE)
+                class_match = _IMG_CLASS_ATTR_PATTERN.search(img_tag)
                 class_text = class_match.group(1) if class_match else ""
 
                 # ImageInfo 생성
@@ -376,13 +386,8 @@ class ContentScraper:
                 position += 1
 
             # og:image도 추가 (메타데이터는 없지만 대표 이미지이므로 position 0으로)
-            og_patterns = [
-                r'<meta[^>]+property=["\']og:image["\'][^>]+content=["\']([^"\']+)["\']',
-                r'<meta[^>]+content=["\']([^"\']+)["\'][^>]+property=["\']og:image["\']',
-            ]
-
-            for pattern in og_patterns:
-                matches = re.findall(pattern, html, re.IGNORECASE)
+            for pattern in _OG_IMAGE_PATTERNS:
+                matches = pattern.findall(html)
                 for match in matches:
                     img_url = self._normalize_image_url(match, base_url)
                     if img_url and self._is_valid_news_image(img_url) and img_url not in seen_urls:
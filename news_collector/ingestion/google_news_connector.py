@@ -5,17 +5,20 @@ import re
 import time
 from datetime import datetime, timedelta
 from typing import List, Optional
-from urllib.request import urlopen, Request
 from urllib.parse import urlencode, quote
 from xml.etree import ElementTree
 
-from news_collector.ingestion.base_connector import BaseConnector
+from news_collector.ingestion.base_connector import BaseConnector, run_sync
 from news_collector.models.raw_news import RawNewsRecord
 from news_collector.models.source import NewsSource, RateLimit
+from news_collector.utils.html_utils import strip_tags
 from news_collector.utils.logger import get_logger
+from news_collector.utils.xml_utils import iter_xml_elements
 
 logger = get_logger(__name__)
 
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
 # Google News RSS 정책
 # - 최대 100건 반환
 # - 날짜 검색: after:YYYY-MM-DD, before:YYYY-MM-DD
@@ -23,6 +26,17 @@ logger = get_logger(__name__)
 GOOGLE_NEWS_BASE_URL = "https://news.google.com/rss/search"
 GOOGLE_NEWS_MAX_RESULTS = 100
 
+# 소스 이름별 신뢰도 tier
+TIER1_SOURCES = frozenset({
+    "연합뉴스", "KBS", "MBC", "SBS", "조선일보", "중앙일보",
+    "한겨레", "동아일보", "YTN", "JTBC", "Reuters", "AP",
+    "Bloomberg", "BBC", "CNN",
+})
+TIER2_SOURCES = frozenset({
+    "매일경제", "한국경제", "뉴시스", "뉴스1", "아시아경제",
+    "서울신문", "경향신문", "한국일보",
+})
+
 
 class GoogleNewsConnector(BaseConnector):
     """
@@ -108,13 +122,14 @@ class GoogleNewsConnector(BaseConnector):
 
         start_time = time.time()
         try:
-            xml_text = self._fetch_feed(url)
-            entries = self._parse_feed(xml_text)
+            xml_bytes = await self._fetch_feed(url)
+            entries = self._parse_feed(xml_bytes)
         except Exception as e:
             logger.error("Google News 수집 실패: %s", e)
             return []
 
         elapsed_ms = int((time.time() - start_time) * 1000)
+        fetched_at = datetime.now()
         records: List[RawNewsRecord] = []
 
         for entry in entries[:min(limit, GOOGLE_NEWS_MAX_RESULTS)]:
@@ -137,6 +152,7 @@ class GoogleNewsConnector(BaseConnector):
                 page_language=self._language,
                 http_status=200,
                 response_time_ms=elapsed_ms,
+                fetch_timestamp=fetched_at,
             )
             records.append(record)
 
@@ -179,67 +195,50 @@ class GoogleNewsConnector(BaseConnector):
         }
         return f"{GOOGLE_NEWS_BASE_URL}?{urlencode(params, quote_via=quote)}"
 
-    def _fetch_feed(self, url: str) -> str:
-        """HTTP로 RSS 피드 XML 가져오기."""
-        req = Request(url, headers={"User-Agent": self.source.user_agent})
-        with urlopen(req, timeout=15) as resp:
-            return resp.read().decode("utf-8", errors="replace")
+    async def _fetch_feed(self, url: str) -> bytes:
+        """HTTP로 RSS 피드 XML 가져오기.
+
+        인코딩은 XML 선언을 따르도록 파서에 바이트 그대로 전달한다.
+        """
+        resp = await self._http_get(url)
+        return resp.content
 
-    def _parse_feed(self, xml_text: str) -> List[dict]:
+    def _parse_feed(self, xml_bytes: bytes) -> List[dict]:
         """RSS XML 파싱."""
         entries = []
         try:
-            root = ElementTree.fromstring(xml_text)
+            for item in iter_xml_elements(xml_bytes, ("item",)):
+                # Google News RSS는 source 태그에 원본 출처 포함
+                source_name = item.findtext("source") or "Unknown"
+
+                entries.append({
+                    "title": item.findtext("title", "").strip(),
+                    "link": item.findtext("link", "").strip(),
+                    "description": item.findtext("description", "").strip(),
+                    "pubDate": item.findtext("pubDate", "").strip(),
+                    "source": source_name,
+                    "guid": item.findtext("guid", "").strip(),
+                })
         except ElementTree.ParseError as e:
             logger.warning("XML 파싱 실패: %s", e)
             return []
 
-        for item in root.iter("item"):
-            # Google News RSS는 source 태그에 원본 출처 포함
-            source_el = item.find("source")
-            source_name = source_el.text if source_el is not None and source_el.text else "Unknown"
-
-            entries.append({
-                "title": self._text(item, "title"),
-                "link": self._text(item, "link"),
-                "description": self._text(item, "description"),
-                "pubDate": self._text(item, "pubDate"),
-                "source": source_name,
-                "guid": self._text(item, "guid"),
-            })
-
         return entries
 
-    @staticmethod
-    def _text(element, tag: str) -> str:
-        """XML 요소에서 텍스트 추출."""
-        el = element.find(tag)
-        return el.text.strip() if el is not None and el.text else ""
-
     def _clean_html(self, text: str) -> str:
         """HTML 엔티티 디코딩 및 태그 제거."""
         if not text:
             return ""
         text = html.unescape(text)
-        text = re.sub(r"<[^>]+>", "", text)
-        text = re.sub(r"\s+", " ", text).strip()
+        text = strip_tags(text)
+        text = _WHITESPACE_PATTERN.sub(" ", text).strip()
         return text
 
     def _infer_tier(self, source_name: str) -> str:
         """소스 이름으로 신뢰도 tier 추론."""
-        tier1_sources = {
-            "연합뉴스", "KBS", "MBC", "SBS", "조선일보", "중앙일보",
-            "한겨레", "동아일보", "YTN", "JTBC", "Reuters", "AP",
-            "Bloomberg", "BBC", "CNN",
-        }
-        tier2_sources = {
-            "매일경제", "한국경제", "뉴시스", "뉴스1", "아시아경제",
-            "서울신문", "경향신문", "한국일보",
-        }
-
-        if source_name in tier1_sources:
+        if source_name in TIER1_SOURCES:
             return "tier1"
-        if source_name in tier2_sources:
+        if source_name in TIER2_SOURCES:
             return "tier2"
         return "tier3"
 
@@ -267,22 +266,5 @@ def fetch_google_news_sync(
     Returns:
         RawNewsRecord 리스트
     """
-    import asyncio
-
     connector = GoogleNewsConnector(language=language, country=country)
-
-    try:
-        loop = asyncio.get_running_loop()
-    except RuntimeError:
-        loop = None
-
-    if loop and loop.is_running():
-        import concurrent.futures
-        with concurrent.futures.ThreadPoolExecutor() as pool:
-            future = pool.submit(
-                asyncio.run,
-                connector.fetch(keywords, limit, date_from, date_to)
-            )
-            return future.result()
-    else:
-        return asyncio.run(connector.fetch(keywords, limit, date_from, date_to))
+    return run_sync(connector.fetch(keywords, limit, date_from, date_to))
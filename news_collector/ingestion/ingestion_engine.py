@@ -1,9 +1,10 @@
 """Module 3: Ingestion Engine - 다중 소스 병렬 수집 오케스트레이터"""
 
 import asyncio
-from typing import Any, Dict, List, Optional
+from typing import Dict, List, Optional
+from urllib.parse import urlparse
 
-from news_collector.ingestion.base_connector import BaseConnector
+from news_collector.ingestion.base_connector import BaseConnector, run_sync
 from news_collector.ingestion.api_connector import APIConnector
 from news_collector.ingestion.rss_connector import RSSConnector
 from news_collector.ingestion.google_news_connector import GoogleNewsConnector
@@ -16,6 +17,9 @@ from news_collector.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# 동일 호스트에 동시에 보낼 수 있는 최대 요청 수
+MAX_CONCURRENCY_PER_HOST = 8
+
 
 class IngestionEngine:
     """
@@ -30,14 +34,17 @@ class IngestionEngine:
         self,
         registry: SourceRegistry,
         api_credentials: Optional[Dict[str, Dict[str, str]]] = None,
+        max_concurrency_per_host: int = MAX_CONCURRENCY_PER_HOST,
     ) -> None:
         """
         Args:
             registry: 소스 레지스트리.
             api_credentials: {"source_id": {"api_key": "...", "api_secret": "..."}}
+            max_concurrency_per_host: 호스트별 동시 수집 상한.
         """
         self._registry = registry
         self._api_credentials = api_credentials or {}
+        self._max_concurrency_per_host = max(1, max_concurrency_per_host)
 
     def collect(self, query_spec: QuerySpec) -> List[RawNewsRecord]:
         """
@@ -58,25 +65,8 @@ class IngestionEngine:
 
         logger.info("수집 시작: %d개 소스 → %s", len(sources), [s.id for s in sources])
 
-        # 비동기 수집 실행
-        try:
-            # Python 3.10+에서도 안전한 이벤트 루프 감지
-            try:
-                loop = asyncio.get_running_loop()
-            except RuntimeError:
-                loop = None
-
-            if loop and loop.is_running():
-                # 이미 이벤트 루프가 실행 중이면 (Jupyter 등)
-                import concurrent.futures
-                with concurrent.futures.ThreadPoolExecutor() as pool:
-                    results = pool.submit(
-                        asyncio.run, self._collect_all(sources, query_spec)
-                    ).result()
-            else:
-                results = asyncio.run(self._collect_all(sources, query_spec))
-        except RuntimeError:
-            results = asyncio.run(self._collect_all(sources, query_spec))
+        # 비동기 수집 실행 (공유 백그라운드 루프)
+        results = run_sync(self._collect_all(sources, query_spec))
 
         logger.info("수집 완료: 총 %d건", len(results))
         return results
@@ -84,13 +74,20 @@ class IngestionEngine:
     async def _collect_all(
         self, sources: List[NewsSource], query_spec: QuerySpec
     ) -> List[RawNewsRecord]:
-        """모든 소스에서 병렬 수집."""
+        """모든 소스에서 병렬 수집 (호스트별 동시 요청 수 제한)."""
+        # 세마포어는 실행 중인 이벤트 루프에 묶이므로 호출마다 생성
+        host_semaphores: Dict[str, asyncio.Semaphore] = {}
         tasks = []
         task_sources: List[NewsSource] = []  # task와 source를 1:1 매핑
         for source in sources:
             connector = self._create_connector(source)
             if connector:
-                tasks.append(self._collect_from_source(connector, source, query_spec))
+                host = urlparse(source.base_url).netloc
+                semaphore = host_semaphores.get(host)
+                if semaphore is None:
+                    semaphore = asyncio.Semaphore(self._max_concurrency_per_host)
+                    host_semaphores[host] = semaphore
+                tasks.append(self._collect_limited(semaphore, connector, source, query_spec))
                 task_sources.append(source)
 
         if not tasks:
@@ -98,18 +95,32 @@ class IngestionEngine:
 
         results = await asyncio.gather(*tasks, return_exceptions=True)
 
-        all_records: List[RawNewsRecord] = []
-        for i, result in enumerate(results):
-            source = task_sources[i]
+        # 결과 총량을 먼저 계산해 리스트를 한 번에 할당 (반복 확장 방지)
+        total = sum(len(r) for r in results if isinstance(r, list))
+        all_records: List[RawNewsRecord] = [None] * total
+        pos = 0
+        for source, result in zip(task_sources, results):
             if isinstance(result, Exception):
                 logger.error("소스 수집 실패: %s - %s", source.id, result)
                 self._registry.record_failure(source.id)
             elif isinstance(result, list):
-                all_records.extend(result)
+                all_records[pos:pos + len(result)] = result
+                pos += len(result)
                 self._registry.record_success(source.id)
 
         return all_records
 
+    async def _collect_limited(
+        self,
+        semaphore: asyncio.Semaphore,
+        connector: BaseConnector,
+        source: NewsSource,
+        query_spec: QuerySpec,
+    ) -> List[RawNewsRecord]:
+        """호스트 세마포어를 획득한 뒤 단일 소스 수집."""
+        async with semaphore:
+            return await self._collect_from_source(connector, source, query_spec)
+
     async def _collect_from_source(
         self, connector: BaseConnector, source: NewsSource, query_spec: QuerySpec
     ) -> List[RawNewsRecord]:
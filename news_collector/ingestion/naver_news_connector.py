@@ -1,7 +1,9 @@
 """Naver News API 커넥터 - 네이버 뉴스 검색 API 통합"""
 
+import asyncio
+import functools
 import html
-import json
+import math
 import os
 import re
 import time
@@ -9,16 +11,19 @@ from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from email.utils import parsedate_to_datetime
 from typing import Dict, List, Optional
-from urllib.request import urlopen, Request
-from urllib.parse import urlencode, quote
+from urllib.parse import urlsplit
 
-from news_collector.ingestion.base_connector import BaseConnector
+from news_collector.ingestion.base_connector import BaseConnector, parse_json, run_sync
 from news_collector.models.raw_news import RawNewsRecord
 from news_collector.models.source import NewsSource, RateLimit
+from news_collector.utils.html_utils import strip_tags
 from news_collector.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+_unescape = html.unescape
+
 
 # 네이버 뉴스 API 정책
 # - 일일 호출 제한: 25,000회
@@ -29,21 +34,89 @@ NAVER_API_DAILY_QUOTA = 25000
 NAVER_API_MAX_DISPLAY = 100
 NAVER_API_MAX_START = 1000
 NAVER_API_BASE_URL = "https://openapi.naver.com/v1/search/news.json"
+NAVER_API_MAX_CONCURRENCY = 5  # 동시 페이지 요청 상한
+
+# 소스 이름별 신뢰도 tier
+TIER1_SOURCES = frozenset({
+    "연합뉴스", "KBS", "MBC", "SBS", "조선일보", "중앙일보",
+    "한겨레", "동아일보", "YTN", "JTBC",
+})
+TIER2_SOURCES = frozenset({
+    "매일경제", "한국경제", "뉴시스", "뉴스1", "아시아경제",
+})
+
+# 알려진 소스 매핑 (www. 제거된 도메인 사용)
+DOMAIN_TO_NAME = {
+    "news.yna.co.kr": "연합뉴스",
+    "yna.co.kr": "연합뉴스",
+    "news.kbs.co.kr": "KBS",
+    "imnews.imbc.com": "MBC",
+    "news.sbs.co.kr": "SBS",
+    "chosun.com": "조선일보",
+    "joongang.co.kr": "중앙일보",
+    "hani.co.kr": "한겨레",
+    "donga.com": "동아일보",
+    "mk.co.kr": "매일경제",
+    "hankyung.com": "한국경제",
+    "ytn.co.kr": "YTN",
+    "jtbc.co.kr": "JTBC",
+}
+
+
+def _extract_source_name(url: str) -> str:
+    """URL에서 소스 이름 추출."""
+    if not url:
+        return "네이버 뉴스"
+
+    # 도메인 추출
+    host = urlsplit(url).netloc
+    if not host:
+        return "Unknown"
+    return _source_name_for_host(host)
+
+
+@functools.lru_cache(maxsize=1024)
+def _source_name_for_host(host: str) -> str:
+    """도메인 → 소스 이름 (www. 제거, 같은 언론사 기사가 반복되므로 캐시)."""
+    host = host.removeprefix("www.")
+    return DOMAIN_TO_NAME.get(host, host)
+
+
+@functools.lru_cache(maxsize=1024)
+def _infer_tier(source_name: str) -> str:
+    """소스 이름으로 신뢰도 tier 추론."""
+    if source_name in TIER1_SOURCES:
+        return "tier1"
+    if source_name in TIER2_SOURCES:
+        return "tier2"
+    return "tier3"
 
 
 @dataclass
 class NaverAPIRateLimiter:
-    """Naver API 호출 제한 관리."""
+    """
+    Naver API 호출 제한 관리 (토큰 버킷).
+
+    유휴 시간 동안 최대 burst개까지 토큰이 쌓이므로 짧은 버스트는 즉시 통과하고,
+    이후에는 requests_per_second 속도로 제한된다.
+    """
 
     requests_per_second: float = 5.0  # 안전 마진 (실제: ~10/sec)
+    burst: int = 5  # 버킷 용량
     daily_quota: int = NAVER_API_DAILY_QUOTA
 
     # 상태 추적
-    _last_request_time: float = field(default=0.0, repr=False)
+    _tokens: float = field(default=-1.0, repr=False)
+    _last_refill: float = field(default=0.0, repr=False)
     _daily_count: int = field(default=0, repr=False)
     _daily_reset_date: str = field(default="", repr=False)
 
-    def wait_if_needed(self) -> None:
+    def __post_init__(self) -> None:
+        if self._tokens < 0:
+            self._tokens = float(self.burst)
+        self._last_refill = time.monotonic()
+
+    async def wait_if_needed(self) -> None:
         """레이트 리밋 준수를 위해 대기."""
         # 일일 쿼터 리셋 체크
         today = datetime.now().strftime("%Y-%m-%d")
@@ -55,15 +128,19 @@ class NaverAPIRateLimiter:
         if self._daily_count >= self.daily_quota:
             raise RuntimeError(f"Naver API 일일 쿼터 초과: {self.daily_quota}회")
 
-        # 초당 요청 제한
-        now = time.time()
-        min_interval = 1.0 / self.requests_per_second
-        elapsed = now - self._last_request_time
-        if elapsed < min_interval:
-            time.sleep(min_interval - elapsed)
+        # 경과 시간만큼 토큰 보충 (용량 상한)
+        now = time.monotonic()
+        self._tokens = min(
+            float(self.burst),
+            self._tokens + (now - self._last_refill) * self.requests_per_second,
+        )
+        self._last_refill = now
 
-        self._last_request_time = time.time()
+        # 대기 전에 토큰을 차감해 동시 호출이 각자 다른 슬롯을 예약하도록 함
+        self._tokens -= 1
         self._daily_count += 1
+        if self._tokens < 0:
+            await asyncio.sleep(-self._tokens / self.requests_per_second)
 
     @property
     def remaining_quota(self) -> int:
@@ -176,13 +253,35 @@ class NaverNewsConnector(BaseConnector):
         all_records: List[RawNewsRecord] = []
         start = 1
         display = min(NAVER_API_MAX_DISPLAY, limit)
+        semaphore = asyncio.Semaphore(NAVER_API_MAX_CONCURRENCY)
+        exhausted = False
+
+        while not exhausted and len(all_records) < limit and start <= NAVER_API_MAX_START:
+            # 남은 건수를 채우는 데 필요한 페이지를 한 번에 병렬 요청
+            pages_needed = math.ceil((limit - len(all_records)) / display)
+            offsets = list(range(start, NAVER_API_MAX_START + 1, display))[:pages_needed]
+            start = offsets[-1] + display
+
+            pages = await asyncio.gather(
+                *(
+                    self._fetch_page_limited(semaphore, query, display, offset, sort)
+                    for offset in offsets
+                ),
+                return_exceptions=True,
+            )
 
-        while len(all_records) < limit and start <= NAVER_API_MAX_START:
-            try:
-                self._rate_limiter.wait_if_needed()
-
-                records = self._fetch_page(query, display, start, sort)
+            # 페이지 순서대로 병합 (빈 페이지/오류 이후는 버림)
+            for records in pages:
+                if isinstance(records, RuntimeError):
+                    logger.error("Naver API 호출 중단: %s", records)
+                    exhausted = True
+                    break
+                if isinstance(records, Exception):
+                    logger.error("Naver API 수집 오류: %s", records)
+                    exhausted = True
+                    break
                 if not records:
+                    exhausted = True
                     break
 
                 # 날짜 필터링
@@ -190,32 +289,39 @@ class NaverNewsConnector(BaseConnector):
                     if len(all_records) >= limit:
                         break
 
-                    pub_date = self._parse_pub_date(record.raw_data.get("pubDate", ""))
+                    pub_date = record.raw_data.get("_parsed_pub_date")
 
                     if date_from and pub_date and pub_date < date_from:
                         continue
                     if date_to and pub_date and pub_date > date_to:
                         continue
 
-                    # 본문 스크래핑 (옵션)
-                    if self._fetch_full_body:
-                        record = self._enrich_with_full_body(record)
-
                     all_records.append(record)
 
-                start += display
+                if len(all_records) >= limit:
+                    break
 
-            except RuntimeError as e:
-                logger.error("Naver API 호출 중단: %s", e)
-                break
-            except Exception as e:
-                logger.error("Naver API 수집 오류: %s", e)
-                break
+        # 본문 스크래핑 (옵션): 모든 원문을 동시에 다운로드
+        if self._fetch_full_body and all_records:
+            await self._enrich_all_with_full_body(all_records)
 
         logger.info("Naver News API 수집 완료: %d건", len(all_records))
         return all_records
 
-    def _fetch_page(
+    async def _fetch_page_limited(
+        self,
+        semaphore: asyncio.Semaphore,
+        query: str,
+        display: int,
+        start: int,
+        sort: str,
+    ) -> List[RawNewsRecord]:
+        """동시 요청 수와 레이트 리밋을 지키며 단일 페이지 조회."""
+        async with semaphore:
+            await self._rate_limiter.wait_if_needed()
+            return await self._fetch_page(query, display, start, sort)
+
+    async def _fetch_page(
         self,
         query: str,
         display: int,
@@ -229,25 +335,23 @@ class NaverNewsConnector(BaseConnector):
             "start": start,
             "sort": sort,
         }
-        url = f"{NAVER_API_BASE_URL}?{urlencode(params, quote_via=quote)}"
 
         headers = {
             "X-Naver-Client-Id": self._client_id,
             "X-Naver-Client-Secret": self._client_secret,
-            "User-Agent": self.source.user_agent,
         }
 
         start_time = time.time()
         try:
-            req = Request(url, headers=headers)
-            with urlopen(req, timeout=15) as resp:
-                status = resp.status
-                data = json.loads(resp.read().decode("utf-8"))
+            resp = await self._http_get(NAVER_API_BASE_URL, params=params, headers=headers)
+            status = resp.status_code
+            data = parse_json(resp.content)
         except Exception as e:
             logger.error("Naver API 요청 실패: %s", e)
             return []
 
         elapsed_ms = int((time.time() - start_time) * 1000)
+        fetched_at = datetime.now()
 
         items = data.get("items", [])
         records: List[RawNewsRecord] = []
@@ -263,7 +367,7 @@ class NaverNewsConnector(BaseConnector):
             url = original_link or naver_link
 
             # 소스 이름 추출 (URL 도메인에서)
-            source_name = self._extract_source_name(original_link)
+            source_name = _extract_source_name(original_link)
 
             record = RawNewsRecord(
                 source_id="naver_news",
@@ -272,7 +376,9 @@ class NaverNewsConnector(BaseConnector):
                     **item,
                     "title": title,  # 정제된 버전
                     "description": description,
-                    "source_tier": self._infer_tier(source_name),
+                    "source_tier": _infer_tier(source_name),
+                    # 날짜 필터 등에서 재파싱하지 않도록 한 번만 파싱해 보관
+                    "_parsed_pub_date": self._parse_pub_date(item.get("pubDate", "")),
                 },
                 raw_html=item.get("description", ""),
                 extracted_text=f"{title} {description}",
@@ -280,6 +386,7 @@ class NaverNewsConnector(BaseConnector):
                 page_language="ko",
                 http_status=status,
                 response_time_ms=elapsed_ms,
+                fetch_timestamp=fetched_at,
             )
             records.append(record)
 
@@ -289,12 +396,14 @@ class NaverNewsConnector(BaseConnector):
         """HTML 엔티티 디코딩 및 태그 제거."""
         if not text:
             return ""
-        # HTML 엔티티 디코딩
-        text = html.unescape(text)
+        # HTML 엔티티 디코딩 (엔티티가 없는 대부분의 문자열은 건너뜀)
+        if "&" in text:
+            text = _unescape(text)
         # HTML 태그 제거
-        text = re.sub(r"<[^>]+>", "", text)
+        if "<" in text:
+            text = strip_tags(text)
         # 연속 공백 정리
-        text = re.sub(r"\s+", " ", text).strip()
+        text = _WHITESPACE_PATTERN.sub(" ", text).strip()
         return text
 
     def _parse_pub_date(self, pub_date_str: str) -> Optional[datetime]:
@@ -307,92 +416,62 @@ class NaverNewsConnector(BaseConnector):
         except Exception:
             return None
 
-    def _extract_source_name(self, url: str) -> str:
-        """URL에서 소스 이름 추출."""
-        if not url:
-            return "네이버 뉴스"
-
-        # 도메인 추출
-        match = re.search(r"https?://(?:www\.)?([^/]+)", url)
-        if not match:
-            return "Unknown"
-
-        domain = match.group(1)
-
-        # 알려진 소스 매핑 (www. 제거된 도메인 사용)
-        domain_to_name = {
-            "news.yna.co.kr": "연합뉴스",
-            "yna.co.kr": "연합뉴스",
-            "news.kbs.co.kr": "KBS",
-            "imnews.imbc.com": "MBC",
-            "news.sbs.co.kr": "SBS",
-            "chosun.com": "조선일보",
-            "joongang.co.kr": "중앙일보",
-            "hani.co.kr": "한겨레",
-            "donga.com": "동아일보",
-            "mk.co.kr": "매일경제",
-            "hankyung.com": "한국경제",
-            "ytn.co.kr": "YTN",
-            "jtbc.co.kr": "JTBC",
-        }
-
-        return domain_to_name.get(domain, domain)
-
-    def _infer_tier(self, source_name: str) -> str:
-        """소스 이름으로 신뢰도 tier 추론."""
-        tier1_sources = {
-            "연합뉴스", "KBS", "MBC", "SBS", "조선일보", "중앙일보",
-            "한겨레", "동아일보", "YTN", "JTBC",
-        }
-        tier2_sources = {
-            "매일경제", "한국경제", "뉴시스", "뉴스1", "아시아경제",
-        }
-
-        if source_name in tier1_sources:
-            return "tier1"
-        if source_name in tier2_sources:
-            return "tier2"
-        return "tier3"
-
-    def _enrich_with_full_body(self, record: RawNewsRecord) -> RawNewsRecord:
+    async def _enrich_all_with_full_body(self, records: List[RawNewsRecord]) -> None:
         """
-        원본 기사 URL에서 본문 전체 스크래핑.
+        원본 기사 URL에서 본문 전체를 병렬로 스크래핑.
 
         주의: trafilatura 설치 필요 (pip install trafilatura)
         """
-        original_link = record.raw_data.get("originallink", "")
-        if not original_link:
-            return record
-
         try:
             # trafilatura 동적 임포트 (선택적 의존성)
-            import trafilatura
-
-            # 본문 추출 시도
-            downloaded = trafilatura.fetch_url(original_link)
-            if downloaded:
-                full_body = trafilatura.extract(
-                    downloaded,
-                    include_comments=False,
-                    include_tables=True,
-                )
-                if full_body:
-                    # 기존 description 대신 전체 본문 사용
-                    title = record.raw_data.get("title", "")
-                    record.raw_data["full_body"] = full_body
-                    record.extracted_text = f"{title} {full_body}"
-                    logger.debug("본문 추출 성공: %s (%d자)", original_link[:50], len(full_body))
-
+            import trafilatura  # noqa: F401
         except ImportError:
             logger.warning(
                 "trafilatura 미설치. 본문 스크래핑 불가. "
                 "설치: pip install trafilatura"
             )
+            return
+
+        await asyncio.gather(*(self._enrich_with_full_body(r) for r in records))
+
+    async def _enrich_with_full_body(self, record: RawNewsRecord) -> RawNewsRecord:
+        """원본 기사 URL에서 본문 전체 스크래핑 (다운로드는 공유 세션 사용)."""
+        original_link = record.raw_data.get("originallink", "")
+        if not original_link:
+            return record
+
+        try:
+            downloaded = await self._download_body(original_link)
+            full_body = await asyncio.to_thread(self._extract_body, downloaded)
+            if full_body:
+                # 기존 description 대신 전체 본문 사용
+                title = record.raw_data.get("title", "")
+                record.raw_data["full_body"] = full_body
+                record.extracted_text = f"{title} {full_body}"
+                logger.debug("본문 추출 성공: %s (%d자)", original_link[:50], len(full_body))
         except Exception as e:
             logger.debug("본문 추출 실패: %s - %s", original_link[:50], e)
 
         return record
 
+    async def _download_body(self, url: str) -> bytes:
+        """원본 기사 HTML 다운로드."""
+        resp = await self._http_get(url)
+        return resp.content
+
+    @staticmethod
+    def _extract_body(downloaded: bytes) -> Optional[str]:
+        """다운로드한 HTML에서 본문 추출 (CPU 작업)."""
+        import trafilatura
+
+        if not downloaded:
+            return None
+        return trafilatura.extract(
+            downloaded,
+            include_comments=False,
+            include_tables=True,
+        )
+
     @property
     def remaining_quota(self) -> int:
         """남은 일일 API 쿼터."""
@@ -422,8 +501,6 @@ def fetch_naver_news_sync(
     Returns:
         RawNewsRecord 리스트
     """
-    import asyncio
-
     connector = NaverNewsConnector(
         client_id=client_id,
         client_secret=client_secret,
@@ -441,20 +518,5 @@ def fetch_naver_news_sync(
         except ValueError:
             pass
 
-    # async 함수 실행
-    try:
-        loop = asyncio.get_running_loop()
-    except RuntimeError:
-        loop = None
-
-    if loop and loop.is_running():
-        # 이미 이벤트 루프가 있으면 새 태스크 생성
-        import concurrent.futures
-        with concurrent.futures.ThreadPoolExecutor() as pool:
-            future = pool.submit(
-                asyncio.run,
-                connector.fetch(keywords, limit, date_from, date_to)
-            )
-            return future.result()
-    else:
-        return asyncio.run(connector.fetch(keywords, limit, date_from, date_to))
+    # 공유 백그라운드 루프에서 실행
+    return run_sync(connector.fetch(keywords, limit, date_from, date_to))
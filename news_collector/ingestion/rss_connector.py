@@ -3,18 +3,21 @@
 import re
 import time
 from datetime import datetime
-from typing import List, Optional
-from urllib.request import urlopen, Request
-from urllib.error import URLError
+from typing import List, Optional, Pattern
 from xml.etree import ElementTree
 
 from news_collector.ingestion.base_connector import BaseConnector
 from news_collector.models.raw_news import RawNewsRecord
 from news_collector.models.source import NewsSource
+from news_collector.utils.html_utils import strip_tags
 from news_collector.utils.logger import get_logger
+from news_collector.utils.xml_utils import iter_xml_elements
 
 logger = get_logger(__name__)
 
+_ATOM_NS = {"atom": "http://www.w3.org/2005/Atom"}
+_ENTRY_TAGS = frozenset({"item", "{http://www.w3.org/2005/Atom}entry"})
+
 
 class RSSConnector(BaseConnector):
     """RSS/Atom 피드 수집 커넥터."""
@@ -25,18 +28,22 @@ class RSSConnector(BaseConnector):
         start = time.time()
 
         try:
-            xml_text = self._fetch_feed(self.source.base_url)
-            entries = self._parse_feed(xml_text)
+            xml_bytes = await self._fetch_feed(self.source.base_url)
+            entries = self._parse_feed(xml_bytes)
         except Exception as e:
             logger.error("RSS 수집 실패: %s - %s", self.source.id, e)
             return []
 
         elapsed_ms = int((time.time() - start) * 1000)
+        fetched_at = datetime.now()
         records: List[RawNewsRecord] = []
 
+        keyword_pattern = self._compile_keywords(keywords) if keywords else None
         for entry in entries[:limit]:
             title = entry.get("title", "")
-            if keywords and not self._matches_keywords(title, entry.get("description", ""), keywords):
+            if keyword_pattern and not self._matches_keywords(
+                title, entry.get("description", ""), keyword_pattern
+            ):
                 continue
 
             record = RawNewsRecord(
@@ -49,69 +56,81 @@ class RSSConnector(BaseConnector):
                 page_language=self.source.default_locale[:2],
                 http_status=200,
                 response_time_ms=elapsed_ms,
+                fetch_timestamp=fetched_at,
             )
             records.append(record)
 
         logger.info("RSS 수집 완료: %s → %d건 (%dms)", self.source.id, len(records), elapsed_ms)
         return records
 
-    def _fetch_feed(self, url: str) -> str:
-        """HTTP로 RSS 피드 XML 가져오기."""
-        req = Request(url, headers={"User-Agent": self.source.user_agent})
-        with urlopen(req, timeout=15) as resp:
-            return resp.read().decode("utf-8", errors="replace")
+    async def _fetch_feed(self, url: str) -> bytes:
+        """HTTP로 RSS 피드 XML 가져오기.
+
+        인코딩은 XML 선언을 따르도록 파서에 바이트 그대로 전달한다.
+        """
+        resp = await self._http_get(url)
+        return resp.content
 
-    def _parse_feed(self, xml_text: str) -> List[dict]:
-        """RSS/Atom XML 파싱."""
-        entries = []
+    def _parse_feed(self, xml_bytes: bytes) -> List[dict]:
+        """RSS/Atom XML 파싱 (항목 단위 스트리밍, RSS 2.0 우선)."""
+        rss_entries = []
+        atom_entries = []
         try:
-            root = ElementTree.fromstring(xml_text)
+            for element in iter_xml_elements(xml_bytes, _ENTRY_TAGS):
+                if element.tag == "item":
+                    rss_entries.append(self._rss_entry(element))
+                else:
+                    atom_entries.append(self._atom_entry(element))
         except ElementTree.ParseError:
             logger.warning("XML 파싱 실패: %s", self.source.id)
             return []
 
-        # RSS 2.0
-        for item in root.iter("item"):
-            entries.append({
-                "title": self._text(item, "title"),
-                "link": self._text(item, "link"),
-                "description": self._text(item, "description"),
-                "pubDate": self._text(item, "pubDate"),
-                "author": self._text(item, "author") or self._text(item, "{http://purl.org/dc/elements/1.1/}creator"),
-            })
-
-        # Atom
-        if not entries:
-            ns = {"atom": "http://www.w3.org/2005/Atom"}
-            for entry in root.findall(".//atom:entry", ns):
-                link_el = entry.find("atom:link", ns)
-                entries.append({
-                    "title": self._text_ns(entry, "atom:title", ns),
-                    "link": link_el.get("href", "") if link_el is not None else "",
-                    "description": self._text_ns(entry, "atom:summary", ns) or self._text_ns(entry, "atom:content", ns),
-                    "pubDate": self._text_ns(entry, "atom:published", ns) or self._text_ns(entry, "atom:updated", ns),
-                    "author": self._text_ns(entry, "atom:author/atom:name", ns),
-                })
-
-        return entries
+        return rss_entries or atom_entries
 
     @staticmethod
-    def _text(element, tag: str) -> str:
-        el = element.find(tag)
-        return el.text.strip() if el is not None and el.text else ""
+    def _rss_entry(item: ElementTree.Element) -> dict:
+        """RSS 2.0 item 요소를 entry dict로 변환."""
+        return {
+            "title": item.findtext("title", "").strip(),
+            "link": item.findtext("link", "").strip(),
+            "description": item.findtext("description", "").strip(),
+            "pubDate": item.findtext("pubDate", "").strip(),
+            "author": (
+                item.findtext("author", "").strip()
+                or item.findtext("{http://purl.org/dc/elements/1.1/}creator", "").strip()
+            ),
+        }
 
     @staticmethod
-    def _text_ns(element, tag: str, ns: dict) -> str:
-        el = element.find(tag, ns)
-        return el.text.strip() if el is not None and el.text else ""
+    def _atom_entry(entry: ElementTree.Element) -> dict:
+        """Atom entry 요소를 entry dict로 변환."""
+        ns = _ATOM_NS
+        link_el = entry.find("atom:link", ns)
+        return {
+            "title": entry.findtext("atom:title", "", ns).strip(),
+            "link": link_el.get("href", "") if link_el is not None else "",
+            "description": (
+                entry.findtext("atom:summary", "", ns).strip()
+                or entry.findtext("atom:content", "", ns).strip()
+            ),
+            "pubDate": (
+                entry.findtext("atom:published", "", ns).strip()
+                or entry.findtext("atom:updated", "", ns).strip()
+            ),
+            "author": entry.findtext("atom:author/atom:name", "", ns).strip(),
+        }
 
     @staticmethod
     def _strip_html(html: str) -> str:
         """HTML 태그 제거."""
-        return re.sub(r"<[^>]+>", "", html).strip()
+        return strip_tags(html).strip()
+
+    @staticmethod
+    def _compile_keywords(keywords: List[str]) -> Pattern[str]:
+        """키워드 목록을 대소문자 무시 단일 정규식으로 컴파일."""
+        return re.compile("|".join(re.escape(kw) for kw in keywords), re.IGNORECASE)
 
     @staticmethod
-    def _matches_keywords(title: str, description: str, keywords: List[str]) -> bool:
-        """키워드 매칭."""
-        text = (title + " " + description).lower()
-        return any(kw.lower() in text for kw in keywords)
+    def _matches_keywords(title: str, description: str, keyword_pattern: Pattern[str]) -> bool:
+        """키워드 매칭 (제목 또는 설명에 키워드 중 하나라도 포함)."""
+        return keyword_pattern.search(title + " " + description) is not None
@@ -1,12 +1,16 @@
 """Module 6: Content Integrity QA - 콘텐츠 무결성 검증"""
 
-import hashlib
 import re
-from typing import Dict, List, Tuple
+from typing import Dict, List, Set, Tuple
 
 from news_collector.models.news import NormalizedNews
 from news_collector.utils.logger import get_logger
 
+try:
+    import ahocorasick  # 선택적 의존성: pyahocorasick
+except ImportError:
+    ahocorasick = None
+
 logger = get_logger(__name__)
 
 # 스팸/광고 키워드
@@ -21,7 +25,46 @@ SENSATIONAL_PATTERNS = [
     r".*\[충격\].*", r".*\[경악\].*", r".*놀라운\s(발표|비밀|진실).*",
     r".*\d+번\s(이것|저것).*", r".*이\s사실일\s리\s없다.*",
 ]
-FUNCTION_WORDS = {"의", "이", "가", "을", "를", "에", "에서", "로", "과", "그리고", "또는", "있다", "하다", "되다"}
+_SENSATIONAL_REGEXES = tuple(re.compile(p) for p in SENSATIONAL_PATTERNS)
+# 한글 2자 이상 또는 대문자로 시작하는 영단어 (한 번의 스캔으로 추출)
+_ENTITY_PATTERN = re.compile(r'[가-힣]{2,}|\b[A-Z][a-zA-Z]+\b')
+
+
+def _build_spam_automaton():
+    """광고/불법 키워드 전체를 하나의 Aho-Corasick 오토마톤으로 구성."""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for kw in AD_KEYWORDS:
+        automaton.add_word(kw, "ad")
+    for kw in ILLEGAL_KEYWORDS:
+        automaton.add_word(kw, "illegal")
+    automaton.make_automaton()
+    return automaton
+
+
+_SPAM_AUTOMATON = _build_spam_automaton()
+
+
+def _match_spam_labels(text_lower: str) -> Set[str]:
+    """텍스트에 포함된 스팸 키워드 분류 ("ad", "illegal") 집합."""
+    labels: Set[str] = set()
+    if _SPAM_AUTOMATON is None:
+        if any(kw in text_lower for kw in AD_KEYWORDS):
+            labels.add("ad")
+        if any(kw in text_lower for kw in ILLEGAL_KEYWORDS):
+            labels.add("illegal")
+        return labels
+
+    for _, label in _SPAM_AUTOMATON.iter(text_lower):
+        labels.add(label)
+        if len(labels) == 2:
+            break
+    return labels
+
+
+FUNCTION_WORDS = frozenset({"의", "이", "가", "을", "를", "에", "에서", "로", "과", "그리고", "또는", "있다", "하다", "되다"})
+STOPWORDS = frozenset({"의", "이", "그", "저", "것", "수", "등", "같은", "있다", "하다", "and", "the", "is"})
 
 
 class ContentIntegrityChecker:
@@ -72,20 +115,20 @@ class ContentIntegrityChecker:
             return 1.0
 
         body_lower = news.body.lower()
-        coverage = sum(1 for e in title_entities if e.lower() in body_lower)
+        find = body_lower.find
+        coverage = sum(1 for e in title_entities if find(e.lower()) >= 0)
         coverage_ratio = coverage / len(title_entities)
 
-        # 키워드 분산도
+        # 키워드 분산도 (이미 소문자화한 본문을 문단으로 분리해 재사용)
         title_words = {w for w in news.title.lower().split() if len(w) > 2}
-        paragraphs = [p for p in news.body.split("\n") if p.strip()][:5]
-        if not paragraphs or not title_words:
+        paragraphs_lower = [p for p in body_lower.split("\n") if p.strip()][:5]
+        if not paragraphs_lower or not title_words:
             return coverage_ratio
 
-        word_dist = []
-        for para in paragraphs:
-            para_lower = para.lower()
-            count = sum(1 for w in title_words if w in para_lower)
-            word_dist.append(count)
+        word_dist = [
+            sum(1 for w in title_words if w in para_lower)
+            for para_lower in paragraphs_lower
+        ]
 
         total = sum(word_dist)
         if total == 0:
@@ -105,13 +148,15 @@ class ContentIntegrityChecker:
             return 0.0, flags
 
         para_keywords = [set(self._extract_keywords(p)) for p in paragraphs[:10]]
+        sizes = [len(k) for k in para_keywords]
         similarities = []
         for i in range(len(para_keywords) - 1):
-            union = len(para_keywords[i] | para_keywords[i + 1])
+            # |A ∪ B| = |A| + |B| - |A ∩ B| (합집합을 새로 만들지 않음)
+            inter = len(para_keywords[i] & para_keywords[i + 1])
+            union = sizes[i] + sizes[i + 1] - inter
             if union == 0:
                 continue
-            sim = len(para_keywords[i] & para_keywords[i + 1]) / union
-            similarities.append(sim)
+            similarities.append(inter / union)
 
         if not similarities:
             return 0.0, flags
@@ -133,36 +178,37 @@ class ContentIntegrityChecker:
         """스팸/광고/보일러플레이트 탐지 (0~1, flags)."""
         flags = []
         score = 0.0
-        text = (news.body or "") + " " + (news.title or "")
-        text_lower = text.lower()
+        text_lower = ((news.body or "") + " " + (news.title or "")).lower()
 
         # 반복 문장
         if self._has_repetitive(news.body or ""):
             score += 0.3
             flags.append("repetitive_content")
 
+        spam_labels = _match_spam_labels(text_lower)
+
         # 광고 키워드
-        if any(kw in text_lower for kw in AD_KEYWORDS):
+        if "ad" in spam_labels:
             score += 0.3
             flags.append("ad_content")
 
         # 불법 키워드
-        if any(kw in text_lower for kw in ILLEGAL_KEYWORDS):
+        if "illegal" in spam_labels:
             score += 0.5
             flags.append("illegal_content")
 
         # Lexical density
         words = text_lower.split()
         if words:
-            meaningful = [w for w in words if w not in FUNCTION_WORDS and len(w) > 1]
-            density = len(meaningful) / len(words)
+            meaningful = sum(1 for w in words if len(w) > 1 and w not in FUNCTION_WORDS)
+            density = meaningful / len(words)
             if density < 0.4:
                 score += 0.2
                 flags.append("low_content_quality")
 
         # 선정적 제목
-        for pattern in SENSATIONAL_PATTERNS:
-            if re.search(pattern, news.title or ""):
+        for pattern in _SENSATIONAL_REGEXES:
+            if pattern.search(news.title or ""):
                 score += 0.1
                 flags.append("sensational_title")
                 break
@@ -171,17 +217,14 @@ class ContentIntegrityChecker:
 
     @staticmethod
     def _extract_entities(text: str) -> List[str]:
-        """제목에서 엔티티 추출 (간단한 패턴)."""
-        entities = re.findall(r'[가-힣]{2,}', text)
-        entities += re.findall(r'\b[A-Z][a-zA-Z]+\b', text)
-        return list(set(entities))
+        """제목에서 엔티티 추출 (간단한 패턴, 등장 순서 유지·중복 제거)."""
+        return list(dict.fromkeys(_ENTITY_PATTERN.findall(text)))
 
     @staticmethod
     def _extract_keywords(text: str) -> List[str]:
         """키워드 추출."""
-        stopwords = {"의", "이", "그", "저", "것", "수", "등", "같은", "있다", "하다", "and", "the", "is"}
         words = text.lower().split()
-        return [w for w in words if len(w) > 2 and w not in stopwords]
+        return [w for w in words if len(w) > 2 and w not in STOPWORDS]
 
     @staticmethod
     def _has_repetitive(text: str) -> bool:
@@ -189,6 +232,5 @@ class ContentIntegrityChecker:
         sentences = [s.strip() for s in text.split(".") if s.strip()]
         if len(sentences) < 3:
             return False
-        hashes = [hashlib.md5(s.encode()).hexdigest() for s in sentences]
-        unique = len(set(hashes))
-        return (1 - unique / len(hashes)) > 0.3
+        unique = len(set(sentences))
+        return (1 - unique / len(sentences)) > 0.3
@@ -36,4 +36,5 @@ from news_collector.models.generated_news import (
     GeneratedNews,
     GenerationRequest,
     GenerationResponse,
+    to_format,
 )
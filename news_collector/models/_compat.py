@@ -0,0 +1,6 @@
+"""모델 정의용 호환성 상수"""
+
+import sys
+
+# dataclass(slots=True)는 Python 3.10+ 전용. 3.9에서는 일반 dataclass로 동작.
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
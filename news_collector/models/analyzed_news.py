@@ -8,6 +8,7 @@ from dataclasses import dataclass, field
 from enum import Enum
 from typing import List, Optional
 
+from news_collector.models._compat import DATACLASS_SLOTS
 from news_collector.models.news import NewsWithScores
 
 
@@ -45,14 +46,14 @@ class SummaryType(Enum):
 # Data Classes
 # ==============================================================================
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class SentimentResult:
     label: SentimentLabel = SentimentLabel.NEUTRAL
     score: float = 0.0
     confidence: float = 0.0
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Entity:
     name: str = ""
     text: str = ""
@@ -60,20 +61,20 @@ class Entity:
     confidence: float = 0.0
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Keyword:
     word: str = ""
     score: float = 0.0
     frequency: int = 0
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class TopicScore:
     topic: str = ""
     confidence: float = 0.0
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class AnalyzedNews:
     news_id: str = ""
     sentiment: SentimentResult = field(default_factory=SentimentResult)
@@ -85,66 +86,66 @@ class AnalyzedNews:
     sentence_count: int = 0
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class NewsSummary:
     one_line: str = ""
     summary_type: SummaryType = SummaryType.EXTRACTIVE
     text: str = ""
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class KeywordTrend:
     keyword: str = ""
     count: int = 0
     trend: str = "stable"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class TopicCluster:
     topic: str = ""
     news_ids: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class TimelineEvent:
     date: str = ""
     description: str = ""
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Issue:
     title: str = ""
     description: str = ""
     severity: str = "low"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class TrendReport:
     keywords: List[KeywordTrend] = field(default_factory=list)
     clusters: List[TopicCluster] = field(default_factory=list)
     timeline: List[TimelineEvent] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class GenerationSuitability:
     recommended_formats: List[str] = field(default_factory=list)
     complexity_level: str = "medium"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class TrendContext:
     trend_keywords: List[str] = field(default_factory=list)
     related_topics: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class FactCheckResult:
     claim: str = ""
     verdict: str = "unverified"
     confidence: float = 0.0
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class EnrichedNews:
     news: NewsWithScores = field(default_factory=lambda: NewsWithScores(
         id="", title="", body="", url="", source_name="",
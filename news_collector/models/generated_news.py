@@ -6,7 +6,10 @@
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import List, Optional, Dict, Any
+from types import MappingProxyType
+from typing import List, Optional, Dict, Any, Mapping, Tuple
+
+from news_collector.models._compat import DATACLASS_SLOTS
 
 
 # ============================================================
@@ -47,94 +50,105 @@ class NewsFormat(Enum):
     OPINION = "opinion"             # 오피니언/칼럼
 
 
+def to_format(value: Any) -> NewsFormat:
+    """
+    문자열 값을 NewsFormat으로 변환.
+
+    값 → 멤버 사전을 먼저 조회하고, 없을 때만 ``NewsFormat(value)``로
+    처리한다 (NewsFormat 인스턴스 전달 또는 잘못된 값의 ValueError).
+    """
+    member = NewsFormat._value2member_map_.get(value)
+    return member if member is not None else NewsFormat(value)
+
+
 # ============================================================
 # 포맷 스펙 정의
 # ============================================================
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class FormatSpec:
-    """포맷별 상세 스펙"""
+    """포맷별 상세 스펙 (FORMAT_SPECS에서 공유되는 불변 상수)"""
     format: NewsFormat
     min_length: int              # 최소 글자 수
     max_length: int              # 최대 글자 수
-    structure: List[str]         # 필수 구조 요소
+    structure: Tuple[str, ...]   # 필수 구조 요소
     image_count: str             # "0", "1", "2-3", "5+"
     use_case: str                # 용도 설명
 
 
-# 포맷별 스펙 정의
-FORMAT_SPECS: Dict[NewsFormat, FormatSpec] = {
+# 포맷별 스펙 정의 (모듈 간 공유되므로 읽기 전용)
+FORMAT_SPECS: Mapping[NewsFormat, FormatSpec] = MappingProxyType({
     NewsFormat.STRAIGHT: FormatSpec(
         format=NewsFormat.STRAIGHT,
         min_length=400, max_length=800,
-        structure=["lead", "body", "closing"],
+        structure=("lead", "body", "closing"),
         image_count="1",
         use_case="일반 뉴스",
     ),
     NewsFormat.BRIEF: FormatSpec(
         format=NewsFormat.BRIEF,
         min_length=50, max_length=100,
-        structure=["single_paragraph"],
+        structure=("single_paragraph",),
         image_count="0",
         use_case="속보, 단신",
     ),
     NewsFormat.ANALYSIS: FormatSpec(
         format=NewsFormat.ANALYSIS,
         min_length=1500, max_length=3000,
-        structure=["current", "background", "outlook", "implications"],
+        structure=("current", "background", "outlook", "implications"),
         image_count="2-3",
         use_case="심층 보도",
     ),
     NewsFormat.FEATURE: FormatSpec(
         format=NewsFormat.FEATURE,
         min_length=2000, max_length=5000,
-        structure=["intro", "sections", "conclusion"],
+        structure=("intro", "sections", "conclusion"),
         image_count="5+",
         use_case="기획 시리즈",
     ),
     NewsFormat.EXPLAINER: FormatSpec(
         format=NewsFormat.EXPLAINER,
         min_length=800, max_length=1500,
-        structure=["question", "answer", "context"],
+        structure=("question", "answer", "context"),
         image_count="1-2",
         use_case="복잡한 이슈 해설",
     ),
     NewsFormat.CARD_NEWS: FormatSpec(
         format=NewsFormat.CARD_NEWS,
         min_length=150, max_length=500,
-        structure=["cards"],
+        structure=("cards",),
         image_count="5-10",
         use_case="SNS 공유용",
     ),
     NewsFormat.SOCIAL_POST: FormatSpec(
         format=NewsFormat.SOCIAL_POST,
         min_length=50, max_length=280,
-        structure=["hook", "main", "cta"],
+        structure=("hook", "main", "cta"),
         image_count="1",
         use_case="트위터/인스타",
     ),
     NewsFormat.NEWSLETTER: FormatSpec(
         format=NewsFormat.NEWSLETTER,
         min_length=1000, max_length=2000,
-        structure=["greeting", "sections", "footer"],
+        structure=("greeting", "sections", "footer"),
         image_count="thumbnails",
         use_case="이메일 발송",
     ),
     NewsFormat.LISTICLE: FormatSpec(
         format=NewsFormat.LISTICLE,
         min_length=1000, max_length=2000,
-        structure=["intro", "items", "conclusion"],
+        structure=("intro", "items", "conclusion"),
         image_count="per_item",
         use_case="정보 정리형",
     ),
     NewsFormat.QNA: FormatSpec(
         format=NewsFormat.QNA,
         min_length=500, max_length=1500,
-        structure=["intro", "qa_pairs", "summary"],
+        structure=("intro", "qa_pairs", "summary"),
         image_count="0-1",
         use_case="FAQ 형식",
     ),
-}
+})
 
 
 # ============================================================
@@ -161,7 +175,7 @@ class CitationType(Enum):
     FACT = "fact"                   # 팩트 인용 (사실 정보)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Citation:
     """인용 정보"""
     source_news_id: str
@@ -177,7 +191,7 @@ class Citation:
 # 비주얼 자산
 # ============================================================
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ImageAsset:
     """이미지 자산"""
     id: str
@@ -188,7 +202,7 @@ class ImageAsset:
     caption: str = ""
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ChartAsset:
     """차트 자산"""
     id: str
@@ -212,7 +226,7 @@ class ReviewStatus(Enum):
     REVISION_NEEDED = "revision_needed"  # 수정 필요
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ReviewRecord:
     """검수 기록"""
     reviewer: str                # "auto", "ai", "human"
@@ -226,7 +240,7 @@ class ReviewRecord:
 # 포맷 추천
 # ============================================================
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class FormatScore:
     """포맷 점수"""
     format: NewsFormat
@@ -234,7 +248,7 @@ class FormatScore:
     reason: str
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class FormatRecommendation:
     """포맷 추천 결과"""
     news_id: str
@@ -258,7 +272,7 @@ class FormatRecommendation:
 # 생성된 뉴스
 # ============================================================
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class GeneratedNews:
     """생성된 뉴스"""
     id: str
@@ -302,7 +316,7 @@ class GeneratedNews:
 # 생성 요청/응답
 # ============================================================
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class GenerationRequest:
     """뉴스 생성 요청"""
     source_news_ids: List[str]           # 원본 뉴스 ID들
@@ -317,7 +331,7 @@ class GenerationRequest:
     include_images: bool = False         # 이미지 추천 여부
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class GenerationResponse:
     """뉴스 생성 응답"""
     success: bool
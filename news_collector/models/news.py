@@ -2,10 +2,13 @@
 
 from dataclasses import dataclass, field
 from datetime import datetime
+from operator import attrgetter
 from typing import List, Optional
 
+from news_collector.models._compat import DATACLASS_SLOTS
 
-@dataclass
+
+@dataclass(**DATACLASS_SLOTS)
 class NormalizedNews:
     """Module 4 출력: 정규화된 뉴스 기사."""
 
@@ -50,7 +53,11 @@ class NormalizedNews:
     cluster_id: Optional[str] = None
 
 
-@dataclass
+# NormalizedNews 필드 전체를 선언 순서대로 한 번에 읽는 getter (NewsWithScores 복사용)
+_NORMALIZED_FIELDS_GETTER = attrgetter(*NormalizedNews.__dataclass_fields__)
+
+
+@dataclass(**DATACLASS_SLOTS)
 class NewsWithScores(NormalizedNews):
     """Module 6~9 출력: 점수가 포함된 최종 뉴스 객체."""
 
@@ -78,3 +85,13 @@ class NewsWithScores(NormalizedNews):
     final_score: float = 0.0
     rank_position: int = 0
     policy_flags: List[str] = field(default_factory=list)
+
+    @classmethod
+    def from_normalized(cls, news: NormalizedNews) -> "NewsWithScores":
+        """
+        NormalizedNews의 필드를 복사해 점수가 비어 있는 객체 생성.
+
+        상속 필드가 선언 순서대로 앞에 오므로 위치 인자로 전달한다
+        (필드별 dict 구성과 키워드 언패킹 없음). 리스트 필드는 얕은 복사.
+        """
+        return cls(*_NORMALIZED_FIELDS_GETTER(news))
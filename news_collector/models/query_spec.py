@@ -4,8 +4,10 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
+from news_collector.models._compat import DATACLASS_SLOTS
 
-@dataclass
+
+@dataclass(**DATACLASS_SLOTS)
 class QuerySpec:
     """
     Module 1의 출력 객체.
@@ -42,6 +44,9 @@ class QuerySpec:
 
     def __post_init__(self) -> None:
         """가변 기본값 안전 초기화."""
+        # 리스트 필드를 하나도 넘기지 않은 경우(create_default 등)는 검사 생략
+        if self.category is None and self.keywords is None and self.exclude_keywords is None:
+            return
         if self.category is not None and not isinstance(self.category, list):
             self.category = [self.category]
         if self.keywords is not None and not isinstance(self.keywords, list):
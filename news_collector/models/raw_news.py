@@ -1,12 +1,20 @@
 """원본 뉴스 레코드 데이터 모델"""
 
 import hashlib
-from dataclasses import dataclass, field
+import json
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from typing import Any, Dict, Optional
 
+from news_collector.models._compat import DATACLASS_SLOTS
 
-@dataclass
+try:
+    import orjson  # 선택적 의존성: 빠른 JSON 직렬화
+except ImportError:
+    orjson = None
+
+
+@dataclass(**DATACLASS_SLOTS)
 class RawNewsRecord:
     """Module 3 출력: 소스에서 수집된 원본 뉴스 레코드."""
 
@@ -34,6 +42,26 @@ class RawNewsRecord:
     def __post_init__(self) -> None:
         if not self.id and self.url:
             raw = f"{self.source_id}:{self.url}"
-            self.id = hashlib.md5(raw.encode()).hexdigest()
+            # 중복 제거용 비암호 ID: 짧은 입력에서 md5보다 빠른 blake2s (128bit, 32자)
+            self.id = hashlib.blake2s(raw.encode(), digest_size=16).hexdigest()
         if self.fetch_timestamp is None:
             self.fetch_timestamp = datetime.now()
+
+    def to_json(self) -> bytes:
+        """
+        레코드를 UTF-8 JSON 바이트로 직렬화.
+
+        orjson이 설치되어 있으면 사용하고, 없으면 표준 json으로 대체한다.
+        """
+        if orjson is not None:
+            return orjson.dumps(self, default=str)
+        return json.dumps(
+            asdict(self), ensure_ascii=False, default=_json_default
+        ).encode("utf-8")
+
+
+def _json_default(value: Any) -> Any:
+    """표준 json 폴백용 직렬화 (orjson과 동일하게 datetime은 ISO 8601)."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
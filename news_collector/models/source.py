@@ -4,8 +4,19 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Dict, List, Optional
 
+from news_collector.models._compat import DATACLASS_SLOTS
 
-@dataclass
+# Tier별 가중치 (tier_weight 조회마다 dict를 새로 만들지 않도록 모듈 상수)
+_TIER_WEIGHTS: Dict[str, float] = {
+    "whitelist": 1.0,
+    "tier1": 0.95,
+    "tier2": 0.80,
+    "tier3": 0.60,
+    "blacklist": 0.0,
+}
+
+
+@dataclass(**DATACLASS_SLOTS)
 class RateLimit:
     """소스별 요청 제한."""
 
@@ -14,7 +25,7 @@ class RateLimit:
     daily_quota: int = 10000
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ProvidesMetadata:
     """소스가 제공하는 메타데이터 여부."""
 
@@ -25,7 +36,7 @@ class ProvidesMetadata:
     publish_date: bool = True
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class NewsSource:
     """뉴스 소스 메타데이터."""
 
@@ -68,14 +79,7 @@ class NewsSource:
     @property
     def tier_weight(self) -> float:
         """Tier에 따른 가중치 반환."""
-        weights = {
-            "whitelist": 1.0,
-            "tier1": 0.95,
-            "tier2": 0.80,
-            "tier3": 0.60,
-            "blacklist": 0.0,
-        }
-        return weights.get(self.tier, 0.5)
+        return _TIER_WEIGHTS.get(self.tier, 0.5)
 
     @classmethod
     def from_dict(cls, data: Dict) -> "NewsSource":
@@ -1,32 +1,85 @@
 """Module 4: Parsing & Normalization - 뉴스 정규화"""
 
 import html as html_module
+import multiprocessing
+import os
+import pickle
 import re
-import uuid
+import secrets
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
-
-from dateutil import parser as dateutil_parser
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 
 from news_collector.models.news import NormalizedNews
 from news_collector.models.raw_news import RawNewsRecord
 from news_collector.models.source import NewsSource
 from news_collector.utils.config_manager import ConfigManager
+from news_collector.utils.date_utils import parse_datetime
 from news_collector.utils.logger import get_logger
 
+try:
+    import ahocorasick  # 선택적 의존성: pyahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    from selectolax.lexbor import LexborHTMLParser  # 선택적 의존성: selectolax
+except ImportError:
+    LexborHTMLParser = None
+
+try:
+    import hyperscan  # 선택적 의존성: hyperscan
+except ImportError:
+    hyperscan = None
+
 logger = get_logger(__name__)
 
-CATEGORY_MAPPING: Dict[str, List[str]] = {
-    "정치": ["politics", "정치", "국회", "대통령", "정당"],
-    "경제": ["economy", "경제", "기업", "주식", "금융", "business", "finance"],
-    "사회": ["society", "사회", "범죄", "교육", "복지"],
-    "IT": ["tech", "it", "기술", "소프트웨어", "ai", "인공지능", "technology"],
-    "과학": ["science", "과학", "연구", "우주", "바이오"],
-    "문화": ["culture", "문화", "예술", "영화", "음악"],
-    "스포츠": ["sports", "스포츠", "축구", "야구", "농구"],
-    "국제": ["world", "international", "국제", "세계", "외교"],
-    "연예": ["entertainment", "연예", "아이돌", "드라마"],
-}
+# 카테고리 → 키워드 (읽기 전용, 순서 = 우선순위)
+CATEGORY_MAPPING: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+    "정치": ("politics", "정치", "국회", "대통령", "정당"),
+    "경제": ("economy", "경제", "기업", "주식", "금융", "business", "finance"),
+    "사회": ("society", "사회", "범죄", "교육", "복지"),
+    "IT": ("tech", "it", "기술", "소프트웨어", "ai", "인공지능", "technology"),
+    "과학": ("science", "과학", "연구", "우주", "바이오"),
+    "문화": ("culture", "문화", "예술", "영화", "음악"),
+    "스포츠": ("sports", "스포츠", "축구", "야구", "농구"),
+    "국제": ("world", "international", "국제", "세계", "외교"),
+    "연예": ("entertainment", "연예", "아이돌", "드라마"),
+})
+
+# 카테고리 이름 (인덱스 = 우선순위, CATEGORY_MAPPING 순서)
+_CATEGORY_NAMES = tuple(CATEGORY_MAPPING)
+
+# 카테고리별 캡처 그룹을 우선순위 순으로 묶은 단일 패턴.
+# 전방탐색(zero-width)이라 모든 시작 위치를 검사하므로 겹치는 키워드
+# ("entertainment" 안의 "ai" 등)도 놓치지 않고, 각 위치에서는 가장 앞선 카테고리가 잡힌다.
+_CATEGORY_ALT_PATTERN = re.compile(
+    "(?="
+    + "|".join(
+        "(" + "|".join(re.escape(kw.lower()) for kw in keywords) + ")"
+        for keywords in CATEGORY_MAPPING.values()
+    )
+    + ")"
+)
+
+
+def _build_category_automaton():
+    """전체 카테고리 키워드를 하나의 Aho-Corasick 오토마톤으로 구성."""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    # 여러 카테고리에 같은 키워드가 있으면 앞선 카테고리가 남도록 역순으로 등록
+    for priority, (category, keywords) in reversed(list(enumerate(CATEGORY_MAPPING.items()))):
+        for kw in keywords:
+            automaton.add_word(kw.lower(), (priority, category))
+    automaton.make_automaton()
+    return automaton
+
+
+_CATEGORY_AUTOMATON = _build_category_automaton()
 
 # 동영상/방송 뉴스 제외 패턴
 VIDEO_NEWS_PATTERNS = [
@@ -39,6 +92,100 @@ VIDEO_NEWS_PATTERNS = [
     r"^\[.*LIVE.*\]",  # [LIVE]
     r"^\[.*라이브.*\]",  # [라이브]
 ]
+# 전체 패턴을 하나로 묶어 제목당 한 번만 검색
+_VIDEO_NEWS_PATTERN = re.compile(
+    "|".join(f"(?:{p})" for p in VIDEO_NEWS_PATTERNS), re.IGNORECASE
+)
+
+# 제목 통합 스캔용 패턴 ID → 카테고리 우선순위 (동영상 패턴 ID는 -1)
+_TITLE_PATTERN_PRIORITY: Tuple[int, ...] = (-1,) * len(VIDEO_NEWS_PATTERNS) + tuple(
+    priority
+    for priority, keywords in enumerate(CATEGORY_MAPPING.values())
+    for _ in keywords
+)
+
+
+def _build_title_database():
+    """동영상 패턴과 카테고리 키워드를 하나의 hyperscan DB로 컴파일.
+
+    ID 0..N-1은 동영상 패턴, 그 뒤는 키워드 (ID로 우선순위 조회).
+    """
+    if hyperscan is None:
+        return None
+    video_flags = (
+        hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP
+        | hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH
+    )
+    # 키워드는 원본 제목 구간의 매칭을 버리므로 첫 매칭만 보고하면 뒤 구간의 매칭을 놓침
+    keyword_flags = hyperscan.HS_FLAG_UTF8
+    expressions = [p.encode() for p in VIDEO_NEWS_PATTERNS]
+    flags = [video_flags] * len(expressions)
+    for keywords in CATEGORY_MAPPING.values():
+        for kw in keywords:
+            expressions.append(re.escape(kw.lower()).encode())
+            flags.append(keyword_flags)
+    database = hyperscan.Database()
+    database.compile(
+        expressions=expressions,
+        ids=list(range(len(expressions))),
+        elements=len(expressions),
+        flags=flags,
+    )
+    return database
+
+
+_TITLE_DATABASE = _build_title_database()
+
+# 스크래치는 스캔 중 상태를 담으므로 동시에 두 스캔이 쓰면 안 됨 → 스레드마다 따로 생성
+_title_scratch_local = threading.local()
+
+
+def _title_scratch() -> Any:
+    """현재 스레드의 hyperscan 스크래치 (처음 호출 시 생성)."""
+    scratch = getattr(_title_scratch_local, "scratch", None)
+    if scratch is None:
+        scratch = _title_scratch_local.scratch = hyperscan.Scratch(_TITLE_DATABASE)
+    return scratch
+
+
+def _on_title_match(pattern_id: int, start: int, end: int, flags: int, state: List[Any]) -> None:
+    """hyperscan 매칭 콜백. state = [원본 제목 끝 오프셋, 동영상 여부, 최우선 순위]."""
+    priority = _TITLE_PATTERN_PRIORITY[pattern_id]
+    if priority < 0:
+        # 원본 제목 구간 안에서 끝난 매칭만 동영상으로 인정
+        if end <= state[0]:
+            state[1] = True
+    # 키워드는 힌트/정제 제목 구간만 인정 (원본 제목은 소문자화·태그 제거 전이라 제외)
+    elif end > state[0] and priority < state[2]:
+        state[2] = priority
+
+# HTML 정제용 패턴 (기사마다 호출되므로 미리 컴파일)
+# script/style 블록은 태그 제거 전에 각각 별도 패스로 지워야 함
+# (태그 패턴과 한 정규식으로 합치면 블록 앞의 짝 없는 "<"가 여는 태그까지 삼켜 내용이 남음)
+_SCRIPT_PATTERN = re.compile(r"<script[^>]*>.*?</script>", re.DOTALL | re.IGNORECASE)
+_STYLE_PATTERN = re.compile(r"<style[^>]*>.*?</style>", re.DOTALL | re.IGNORECASE)
+_TAG_PATTERN = re.compile(r"<[^>]+>")
+# 줄 앞뒤 공백과 빈 줄을 개행 하나로 축약
+_LINE_BREAK_PATTERN = re.compile(r"[^\S\n]*\n\s*")
+_IMG_SRC_PATTERN = re.compile(r'<img[^>]+src=["\']([^"\']+)["\']', re.IGNORECASE)
+# HTML 파서가 img 요소로 만드는 시작 태그 (<image>도 img로 처리됨)
+_IMG_TAG_PATTERN = re.compile(r"<im(?:g|age)\b", re.IGNORECASE)
+
+
+# 이 건수를 넘는 배치만 프로세스 풀로 분산 (작은 배치는 피클링 비용이 더 큼)
+PARALLEL_BATCH_THRESHOLD = 200
+_PARALLEL_CHUNK_SIZE = 50
+
+
+def _generate_ids(count: int) -> List[str]:
+    """
+    뉴스 ID를 한 번의 난수 읽기로 count개 생성.
+
+    secrets.token_hex(16)과 같은 32자 16진수 형식이며, 레코드마다 난수 소스를
+    읽는 대신 16 * count 바이트를 한 번에 받아 잘라 쓴다.
+    """
+    hex_blob = secrets.token_bytes(16 * count).hex()
+    return [hex_blob[i:i + 32] for i in range(0, 32 * count, 32)]
 
 
 class NewsNormalizer:
@@ -47,27 +194,82 @@ class NewsNormalizer:
     HTML 정제, 날짜 파싱, 카테고리 매핑.
     """
 
-    def __init__(self, config: Optional[ConfigManager] = None) -> None:
+    def __init__(
+        self, config: Optional[ConfigManager] = None, max_workers: Optional[int] = 1
+    ) -> None:
+        """
+        Args:
+            config: 설정 관리자.
+            max_workers: normalize_batch 프로세스 수 (1이면 순차 처리, None이면 CPU 수).
+        """
         self._config = config
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        self._max_workers = max(1, max_workers)
 
     def normalize(
-        self, raw: RawNewsRecord, source: Optional[NewsSource] = None
+        self,
+        raw: RawNewsRecord,
+        source: Optional[NewsSource] = None,
+        now: Optional[datetime] = None,
     ) -> NormalizedNews:
-        """단일 RawNewsRecord를 NormalizedNews로 변환."""
+        """단일 RawNewsRecord를 NormalizedNews로 변환.
+
+        Args:
+            raw: 원본 뉴스 레코드
+            source: 소스 메타데이터 (없으면 레코드 값 사용)
+            now: 정규화 시각 (배치에서는 한 번만 계산해 전달)
+        """
+        return self._normalize(raw, source, now, filter_video_news=False)[1]
+
+    def _normalize(
+        self,
+        raw: RawNewsRecord,
+        source: Optional[NewsSource],
+        now: Optional[datetime],
+        filter_video_news: bool,
+        news_id: Optional[str] = None,
+        target_date: Optional[datetime] = None,
+        date_tolerance_days: int = 1,
+    ) -> Tuple[str, Optional[NormalizedNews]]:
+        """normalize 본체 + 필터링.
+
+        제목(동영상 여부)과 발행일(날짜 범위)을 먼저 판정하고, 통과한 레코드만
+        본문 정제·이미지 추출 등 나머지 작업을 수행한다.
+        news_id는 배치에서 미리 생성한 ID (없으면 새로 생성).
+
+        Returns:
+            ("ok", NormalizedNews) / ("video", None) / ("date", None)
+        """
+        if now is None:
+            now = datetime.now(timezone.utc)
         data = raw.raw_data or {}
-        title = self._clean_html(data.get("title", "") or (raw.extracted_text or "")[:200])
-        body = self._clean_html(
-            data.get("description", "")
-            or data.get("summary", "")
-            or data.get("content", "")
-            or raw.raw_html
-        )
+        raw_title = data.get("title", "") or ""
+        title = self._clean_html(raw_title or (raw.extracted_text or "")[:200])
+        category_hint = data.get("category", "") or data.get("section", "")
+        is_video, category = self._classify_title(raw_title, category_hint, title, filter_video_news)
+        if is_video:
+            return "video", None
+
+        pub_date = self._parse_datetime(data.get("pubDate") or data.get("published") or data.get("pub_date"))
+        published_at = pub_date or raw.fetch_timestamp or now
+        if target_date:
+            diff_days = abs((published_at.replace(tzinfo=None) -
+                            target_date.replace(tzinfo=None)).days)
+            if diff_days > date_tolerance_days:
+                return "date", None
+
+        body_html = data.get("description", "") or data.get("summary", "") or data.get("content", "")
+        if body_html:
+            body = self._clean_html(body_html)
+            image_urls = self._extract_image_urls(raw.raw_html)
+        else:
+            # 본문도 raw_html에서 얻는 경우 한 번만 파싱해 이미지까지 추출
+            body, image_urls = self._clean_html_with_images(raw.raw_html)
         if not body:
             body = raw.extracted_text
 
         author = data.get("author", "") or data.get("creator", "")
-        pub_date = self._parse_datetime(data.get("pubDate") or data.get("published") or data.get("pub_date"))
-        category_hint = data.get("category", "") or data.get("section", "")
         tags = data.get("tags", [])
         if isinstance(tags, str):
             tags = [t.strip() for t in tags.split(",") if t.strip()]
@@ -76,8 +278,8 @@ class NewsNormalizer:
         source_name = source.name if source else raw.source_name
         language = (source.default_locale[:2] if source else raw.page_language) or "ko"
 
-        return NormalizedNews(
-            id=str(uuid.uuid4()),
+        return "ok", NormalizedNews(
+            id=news_id or secrets.token_hex(16),
             raw_record_id=raw.id,
             source_id=raw.source_id,
             source_name=source_name,
@@ -86,18 +288,18 @@ class NewsNormalizer:
             body=body,
             summary=body[:200] if body else None,
             author=author or None,
-            published_at=pub_date or raw.fetch_timestamp or datetime.now(timezone.utc),
+            published_at=published_at,
             language=language,
             country="KR" if language == "ko" else "US",
-            category=self._infer_category(category_hint, title),
+            category=category,
             tags=tags,
             url=raw.url,
-            image_urls=self._extract_image_urls(raw.raw_html),
+            image_urls=image_urls,
             view_count=data.get("view_count"),
             share_count=data.get("share_count"),
             comment_count=data.get("comment_count"),
-            crawl_timestamp=raw.fetch_timestamp or datetime.now(timezone.utc),
-            normalized_timestamp=datetime.now(timezone.utc),
+            crawl_timestamp=raw.fetch_timestamp or now,
+            normalized_timestamp=now,
         )
 
     def normalize_batch(
@@ -118,31 +320,27 @@ class NewsNormalizer:
             date_tolerance_days: 날짜 허용 범위 (일)
         """
         source_map = source_map or {}
+        # 배치 전체에 동일한 정규화 시각 사용
+        now = datetime.now(timezone.utc)
+        options = (filter_video_news, target_date, date_tolerance_days, now)
+
+        if self._max_workers > 1 and len(records) > PARALLEL_BATCH_THRESHOLD:
+            outcomes = self._normalize_parallel(records, source_map, options)
+        else:
+            outcomes = self._normalize_records(records, source_map, options)
+
         results = []
         filtered_video = 0
         filtered_date = 0
-
-        for raw in records:
-            try:
-                # 동영상 뉴스 필터링
-                if filter_video_news and self._is_video_news(raw):
-                    filtered_video += 1
-                    continue
-
-                source = source_map.get(raw.source_id)
-                normalized = self.normalize(raw, source)
-
-                # 날짜 필터링
-                if target_date and normalized.published_at:
-                    diff_days = abs((normalized.published_at.replace(tzinfo=None) -
-                                    target_date.replace(tzinfo=None)).days)
-                    if diff_days > date_tolerance_days:
-                        filtered_date += 1
-                        continue
-
-                results.append(normalized)
-            except Exception as e:
-                logger.error("정규화 실패: %s - %s", raw.id, e)
+        for raw, (status, value) in zip(records, outcomes):
+            if status == "ok":
+                results.append(value)
+            elif status == "video":
+                filtered_video += 1
+            elif status == "date":
+                filtered_date += 1
+            else:
+                logger.error("정규화 실패: %s - %s", raw.id, value)
 
         if filtered_video > 0:
             logger.info("동영상 뉴스 제외: %d건", filtered_video)
@@ -151,49 +349,220 @@ class NewsNormalizer:
         logger.info("정규화 완료: %d/%d건", len(results), len(records))
         return results
 
-    def _is_video_news(self, raw: RawNewsRecord) -> bool:
-        """동영상/방송 뉴스인지 확인."""
-        data = raw.raw_data or {}
-        title = data.get("title", "") or ""
+    def _normalize_records(
+        self,
+        records: List[RawNewsRecord],
+        source_map: Dict[str, NewsSource],
+        options: Tuple[Any, ...],
+    ) -> List[Tuple[str, Any]]:
+        """레코드 목록 순차 정규화 (ID는 목록 단위로 한 번에 생성)."""
+        news_ids = _generate_ids(len(records))
+        return [
+            self._normalize_record(raw, source_map, *options, news_id=news_id)
+            for raw, news_id in zip(records, news_ids)
+        ]
+
+    def _normalize_record(
+        self,
+        raw: RawNewsRecord,
+        source_map: Dict[str, NewsSource],
+        filter_video_news: bool,
+        target_date: Optional[datetime],
+        date_tolerance_days: int,
+        now: datetime,
+        news_id: Optional[str] = None,
+    ) -> Tuple[str, Any]:
+        """레코드 하나 정규화 + 필터링.
+
+        Returns:
+            ("ok", NormalizedNews) / ("video", None) / ("date", None) / ("error", 메시지)
+        """
+        try:
+            # 동영상·날짜 필터는 본문 처리 전에 _normalize 안에서 판정
+            return self._normalize(
+                raw, source_map.get(raw.source_id), now, filter_video_news,
+                news_id, target_date, date_tolerance_days,
+            )
+        except Exception as e:
+            # 워커 프로세스에서도 돌려받을 수 있도록 메시지로 전달
+            return "error", str(e)
+
+    def _normalize_parallel(
+        self,
+        records: List[RawNewsRecord],
+        source_map: Dict[str, NewsSource],
+        options: Tuple[Any, ...],
+    ) -> List[Tuple[str, Any]]:
+        """프로세스 풀로 청크 단위 정규화 (입력 순서 유지)."""
+        chunks = [
+            records[i:i + _PARALLEL_CHUNK_SIZE]
+            for i in range(0, len(records), _PARALLEL_CHUNK_SIZE)
+        ]
+        try:
+            # 호출 측에 스레드(run_sync 이벤트 루프, 공유 세션)가 떠 있을 수 있으므로
+            # fork 대신 spawn으로 워커 생성 (멀티스레드 프로세스의 fork는 안전하지 않음)
+            with ProcessPoolExecutor(
+                max_workers=self._max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(self._config, source_map, options),
+            ) as executor:
+                outcomes: List[Tuple[str, Any]] = []
+                for chunk_outcomes in executor.map(_normalize_chunk, chunks):
+                    outcomes.extend(chunk_outcomes)
+                return outcomes
+        # 피클링 실패는 PicklingError 외에 TypeError/AttributeError(로컬 객체)로도 발생
+        except (BrokenProcessPool, OSError, pickle.PicklingError, TypeError, AttributeError) as e:
+            logger.warning("프로세스 풀 사용 불가, 순차 처리로 전환: %s", e)
+            return self._normalize_records(records, source_map, options)
 
-        for pattern in VIDEO_NEWS_PATTERNS:
-            if re.search(pattern, title, re.IGNORECASE):
-                return True
-        return False
+    def _classify_title(
+        self, raw_title: str, hint: str, title: str, filter_video_news: bool
+    ) -> Tuple[bool, Optional[str]]:
+        """동영상 뉴스 여부와 카테고리를 함께 판정.
+
+        hyperscan이 있으면 원본 제목, 힌트, 정제된 제목을 개행으로 이어 한 번만
+        스캔한다. 키워드에는 개행이 없어 구간을 넘는 매칭이 생기지 않으므로
+        동영상 패턴은 원본 제목 구간 안에서, 키워드는 그 밖에서 끝났는지만 확인하면 된다.
+
+        Returns:
+            (동영상 뉴스 여부, 카테고리). 동영상이면 카테고리는 계산하지 않음.
+        """
+        if _TITLE_DATABASE is not None:
+            try:
+                raw_bytes = raw_title.encode()
+                buffer = b"\n".join((raw_bytes, hint.lower().encode(), title.lower().encode()))
+            except UnicodeEncodeError:
+                buffer = None  # 서로게이트 등 UTF-8로 못 바꾸는 제목은 정규식 경로로
+            if buffer is not None:
+                state = [len(raw_bytes), False, len(_CATEGORY_NAMES)]
+                _TITLE_DATABASE.scan(
+                    buffer, match_event_handler=_on_title_match, context=state, scratch=_title_scratch()
+                )
+                if filter_video_news and state[1]:
+                    return True, None
+                best = state[2]
+                return False, _CATEGORY_NAMES[best] if best < len(_CATEGORY_NAMES) else None
+
+        if filter_video_news and _VIDEO_NEWS_PATTERN.search(raw_title) is not None:
+            return True, None
+        return False, self._infer_category(hint, title)
 
     def _clean_html(self, html: str) -> str:
         """HTML 태그 제거 및 정제."""
         if not html:
             return ""
-        text = re.sub(r"<script[^>]*>.*?</script>", "", html, flags=re.DOTALL | re.IGNORECASE)
-        text = re.sub(r"<style[^>]*>.*?</style>", "", text, flags=re.DOTALL | re.IGNORECASE)
-        text = re.sub(r"<[^>]+>", "", text)
+        if "<" not in html:
+            # 태그 없는 평문(RSS 요약 대부분)은 엔티티 디코딩만 수행
+            return self._tidy_text(html_module.unescape(html))
+        if LexborHTMLParser is not None:
+            # C 파서로 한 번에 트리 구성 (주석·중첩 태그도 정확히 처리, 엔티티 디코딩 포함)
+            return self._tree_text(LexborHTMLParser(html))
+        # script/style 블록(내용 포함) 제거 후 나머지 태그 제거
+        text = _SCRIPT_PATTERN.sub("", html)
+        text = _STYLE_PATTERN.sub("", text)
+        text = _TAG_PATTERN.sub("", text)
         # HTML entity 올바르게 디코딩 (&amp; → &, &lt; → < 등)
-        text = html_module.unescape(text)
-        lines = [line.strip() for line in text.split("\n")]
-        lines = [line for line in lines if line]
-        return "\n".join(lines)
+        return self._tidy_text(html_module.unescape(text))
+
+    def _clean_html_with_images(self, html: str) -> Tuple[str, List[str]]:
+        """HTML 정제와 이미지 URL 추출을 한 번의 파싱으로 처리."""
+        if not html:
+            return "", []
+        if LexborHTMLParser is not None and "<" in html:
+            tree = LexborHTMLParser(html)
+            # script/style 제거 전에 이미지 수집 (트리가 변경되므로)
+            srcs = (node.attributes.get("src") for node in tree.css("img"))
+            image_urls = [src for src in srcs if src]
+            return self._tree_text(tree), image_urls
+        return self._clean_html(html), self._extract_image_urls(html)
+
+    def _tree_text(self, tree: Any) -> str:
+        """파싱된 트리에서 script/style을 뺀 텍스트 추출 (엔티티는 파서가 디코딩)."""
+        for node in tree.css("script, style"):
+            node.decompose()
+        return self._tidy_text(tree.text(separator=""))
+
+    @staticmethod
+    def _tidy_text(text: str) -> str:
+        """줄 단위 공백 정리."""
+        # 한 줄짜리(제목·요약 대부분)는 양끝 공백만 제거
+        if "\n" not in text:
+            return text.strip()
+        # 각 줄 strip + 빈 줄 제거를 한 번의 치환으로 처리
+        return _LINE_BREAK_PATTERN.sub("\n", text).strip()
 
     def _parse_datetime(self, date_str: Optional[str]) -> Optional[datetime]:
         """다양한 날짜 형식 파싱."""
-        if not date_str:
+        # 원본 데이터의 비문자열 값(리스트 등)은 캐시 키로 쓸 수 없으므로 제외
+        if not date_str or not isinstance(date_str, str):
             return None
-        try:
-            return dateutil_parser.parse(date_str)
-        except (ValueError, TypeError, OverflowError):
+        parsed = parse_datetime(date_str)
+        if parsed is None:
             logger.debug("날짜 파싱 실패: %s", date_str)
-            return None
+        return parsed
 
     def _infer_category(self, hint: str, title: str) -> Optional[str]:
         """카테고리 추론."""
-        text = (hint + " " + title).lower()
-        for category, keywords in CATEGORY_MAPPING.items():
-            if any(kw in text for kw in keywords):
-                return category
-        return None
+        # 힌트와 제목을 이어 붙이지 않고 각각 소문자화해 스캔 (공백 포함 키워드 없음)
+        texts = (hint.lower(), title.lower()) if hint else (title.lower(),)
+
+        best = len(_CATEGORY_NAMES)
+        if _CATEGORY_AUTOMATON is not None:
+            # 오토마톤이 있으면 텍스트당 한 번의 스캔으로 모든 키워드 확인
+            priorities = (
+                priority
+                for text in texts
+                for _, (priority, _) in _CATEGORY_AUTOMATON.iter(text)
+            )
+        else:
+            # 그룹 패턴 한 번의 스캔 (단어 단위 사전 조회를 먼저 하는 것보다 빠름)
+            priorities = (
+                match.lastindex - 1
+                for text in texts
+                for match in _CATEGORY_ALT_PATTERN.finditer(text)
+            )
+
+        for priority in priorities:
+            if priority < best:
+                best = priority
+                if best == 0:
+                    break
+
+        return _CATEGORY_NAMES[best] if best < len(_CATEGORY_NAMES) else None
 
     def _extract_image_urls(self, html: str) -> List[str]:
         """HTML에서 이미지 URL 추출."""
         if not html:
             return []
-        return re.findall(r'<img[^>]+src=["\']([^"\']+)["\']', html, re.IGNORECASE)
+        if LexborHTMLParser is not None:
+            # 이미지 태그가 없으면 전체 파싱 생략 (본문 대부분은 이미지가 없음)
+            if _IMG_TAG_PATTERN.search(html) is None:
+                return []
+            srcs = (node.attributes.get("src") for node in LexborHTMLParser(html).css("img"))
+            return [src for src in srcs if src]
+        return _IMG_SRC_PATTERN.findall(html)
+
+
+# ─── 프로세스 풀 워커 (피클링 가능하도록 모듈 최상위 함수) ───
+
+_worker_normalizer: Optional[NewsNormalizer] = None
+_worker_source_map: Dict[str, NewsSource] = {}
+_worker_options: Tuple[Any, ...] = ()
+
+
+def _init_worker(
+    config: Optional[ConfigManager],
+    source_map: Dict[str, NewsSource],
+    options: Tuple[Any, ...],
+) -> None:
+    """워커 프로세스당 한 번: 정규화기(호출 측 설정 사용)와 공유 입력 준비."""
+    global _worker_normalizer, _worker_source_map, _worker_options
+    _worker_normalizer = NewsNormalizer(config)
+    _worker_source_map = source_map
+    _worker_options = options
+
+
+def _normalize_chunk(records: List[RawNewsRecord]) -> List[Tuple[str, Any]]:
+    """워커에서 레코드 청크 정규화."""
+    return _worker_normalizer._normalize_records(records, _worker_source_map, _worker_options)
@@ -2,13 +2,19 @@
 
 import re
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Pattern, Tuple
 from zoneinfo import ZoneInfo
 
 from news_collector.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# 정규식 규칙은 모두 숫자 캡처를 날짜로 변환하므로 숫자가 없으면 매칭될 수 없음
+_DIGIT_PATTERN = re.compile(r"\d")
+
+# 상대 날짜 규칙 유형 → N에 곱할 일수
+_RELATIVE_DAY_MULTIPLIERS = {"days_ago": 1, "weeks_ago": 7}
+
 
 class DateParser:
     """
@@ -35,8 +41,18 @@ class DateParser:
             reference_time: 테스트용 기준 시각. None이면 현재 시각 사용.
         """
         self._relative_dates = date_config.get("relative", {})
-        self._relative_regex = date_config.get("relative_regex", [])
-        self._date_regex = date_regex_config
+        # YAML 정규식은 parse() 호출마다 쓰이므로 생성 시 한 번만 컴파일
+        # (유형은 일수 배수로 변환, 알 수 없는 유형의 규칙은 매칭돼도 쓰이지 않으므로 제외)
+        self._relative_regex: List[Tuple[Pattern[str], int]] = []
+        for rule in date_config.get("relative_regex", []):
+            multiplier = _RELATIVE_DAY_MULTIPLIERS.get(rule["type"])
+            if multiplier is None:
+                logger.warning("알 수 없는 상대 날짜 규칙 유형: %s", rule["type"])
+                continue
+            self._relative_regex.append((re.compile(rule["pattern"]), multiplier))
+        self._range_re = self._compile_optional(date_regex_config.get("month_day_range", ""))
+        self._single_re = self._compile_optional(date_regex_config.get("year_month_day", ""))
+        self._iso_re = self._compile_optional(date_regex_config.get("iso_range", ""))
         self._tz = ZoneInfo(timezone)
         self._reference_time = reference_time
 
@@ -50,6 +66,15 @@ class DateParser:
         Returns:
             (date_from, date_to) 튜플. 날짜 없으면 (None, None).
         """
+        # 숫자가 없는 입력(대부분의 질의)은 정규식 단계 없이 키워드만 확인
+        if _DIGIT_PATTERN.search(text) is None:
+            result = self._try_relative_keyword(text)
+            if result:
+                logger.debug("상대 날짜 키워드 매칭: %s", result)
+                return result
+            logger.debug("날짜 표현 없음: %s", text)
+            return None, None
+
         # 1. ISO 범위 (YYYY-MM-DD~YYYY-MM-DD) 먼저 시도
         result = self._try_iso_range(text)
         if result:
@@ -83,6 +108,11 @@ class DateParser:
         logger.debug("날짜 표현 없음: %s", text)
         return None, None
 
+    @staticmethod
+    def _compile_optional(pattern: str) -> Optional[Pattern[str]]:
+        """설정에 패턴이 없으면 None."""
+        return re.compile(pattern) if pattern else None
+
     def _get_now(self) -> datetime:
         """기준 시각 반환 (테스트 주입 가능)."""
         if self._reference_time is not None:
@@ -100,13 +130,10 @@ class DateParser:
     def _infer_year(self, month: int, day: int) -> int:
         """연도 미지정 시 추론. 미래 날짜면 작년으로."""
         now = self._get_now()
-        try:
-            candidate = datetime(now.year, month, day, tzinfo=self._tz)
-            if candidate > now:
-                return now.year - 1
-            return now.year
-        except ValueError:
-            return now.year
+        # 해당 날짜 0시와 비교하는 것과 같으므로 (월, 일)만 비교 (datetime 생성 불필요)
+        if (month, day) > (now.month, now.day):
+            return now.year - 1
+        return now.year
 
     def _try_relative_keyword(
         self, text: str
@@ -128,19 +155,11 @@ class DateParser:
         self, text: str
     ) -> Optional[Tuple[datetime, datetime]]:
         """상대 날짜 정규식 매칭 ("지난 N일", "최근 N주")."""
-        now = self._get_now()
-        for rule in self._relative_regex:
-            pattern = rule["pattern"]
-            match = re.search(pattern, text)
+        for pattern, multiplier in self._relative_regex:
+            match = pattern.search(text)
             if match:
-                n = int(match.group(1))
-                if rule["type"] == "days_ago":
-                    days = n
-                elif rule["type"] == "weeks_ago":
-                    days = n * 7
-                else:
-                    continue
-
+                days = int(match.group(1)) * multiplier
+                now = self._get_now()
                 start = now.replace(
                     hour=0, minute=0, second=0, microsecond=0
                 ) - timedelta(days=days)
@@ -154,11 +173,10 @@ class DateParser:
         self, text: str
     ) -> Optional[Tuple[datetime, datetime]]:
         """절대 날짜 범위 매칭 ("M월 D일~D일")."""
-        pattern = self._date_regex.get("month_day_range", "")
-        if not pattern:
+        if self._range_re is None:
             return None
 
-        match = re.search(pattern, text)
+        match = self._range_re.search(text)
         if match:
             month = int(match.group(1))
             day_start = int(match.group(2))
@@ -178,11 +196,10 @@ class DateParser:
         self, text: str
     ) -> Optional[Tuple[datetime, datetime]]:
         """절대 단일 날짜 매칭 ("M월 D일" 또는 "YYYY년 M월 D일")."""
-        pattern = self._date_regex.get("year_month_day", "")
-        if not pattern:
+        if self._single_re is None:
             return None
 
-        match = re.search(pattern, text)
+        match = self._single_re.search(text)
         if match:
             year_str = match.group(1)
             month = int(match.group(2))
@@ -207,11 +224,10 @@ class DateParser:
         self, text: str
     ) -> Optional[Tuple[datetime, datetime]]:
         """ISO 형식 범위 매칭 ("YYYY-MM-DD~YYYY-MM-DD")."""
-        pattern = self._date_regex.get("iso_range", "")
-        if not pattern:
+        if self._iso_re is None:
             return None
 
-        match = re.search(pattern, text)
+        match = self._iso_re.search(text)
         if match:
             try:
                 d1 = datetime.strptime(match.group(1), "%Y-%m-%d").replace(
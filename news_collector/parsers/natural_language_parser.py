@@ -2,15 +2,43 @@
 
 import re
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Pattern, Tuple
 
 from news_collector.models.query_spec import QuerySpec
 from news_collector.parsers.date_parser import DateParser
 from news_collector.utils.logger import get_logger
 
+try:
+    import ahocorasick  # 선택적 의존성: pyahocorasick
+except ImportError:
+    ahocorasick = None
+
 logger = get_logger(__name__)
 
 
+def _build_keyword_automaton(groups: List[List[str]]):
+    """
+    그룹별 키워드 목록을 하나의 Aho-Corasick 오토마톤으로 구성.
+
+    값은 (키워드, 해당 키워드가 속한 그룹 인덱스 튜플). 같은 키워드가 여러
+    그룹에 있어도 모두 매칭되도록 인덱스를 모아 둔다. 빈 문자열처럼 부분
+    문자열 검사와 결과가 달라지는 키워드가 있으면 None (순차 검사 사용).
+    """
+    if ahocorasick is None:
+        return None
+    index: Dict[str, List[int]] = {}
+    for group_index, keywords in enumerate(groups):
+        for keyword in keywords:
+            if not isinstance(keyword, str) or not keyword:
+                return None
+            index.setdefault(keyword, []).append(group_index)
+    automaton = ahocorasick.Automaton()
+    for keyword, group_indices in index.items():
+        automaton.add_word(keyword, (keyword, tuple(group_indices)))
+    automaton.make_automaton()
+    return automaton
+
+
 class NaturalLanguageParser:
     """
     한국어 자연어 입력을 QuerySpec 필드로 변환.
@@ -31,12 +59,27 @@ class NaturalLanguageParser:
         """
         self._intent_patterns = nl_config.get("intent_patterns", {})
         self._category_keywords = nl_config.get("category_keywords", {})
-        self._limit_patterns = nl_config.get("limit_patterns", [])
-        self._keyword_patterns = nl_config.get("keyword_patterns", [])
-        self._exclude_patterns = nl_config.get("exclude_patterns", [])
+        # 정규식 규칙은 parse() 호출마다 쓰이므로 (컴파일된 패턴, 그룹)으로 미리 변환
+        self._limit_rules = self._compile_rules(nl_config.get("limit_patterns", []))
+        self._keyword_rules = self._compile_rules(nl_config.get("keyword_patterns", []))
+        self._exclude_rules = self._compile_rules(nl_config.get("exclude_patterns", []))
         self._option_keywords = nl_config.get("option_keywords", {})
         self._defaults = defaults
 
+        # 의도/카테고리/옵션 키워드는 선언 순서를 인덱스로 삼아 텍스트당 한 번만 스캔
+        self._intent_items = list(self._intent_patterns.items())
+        self._intent_automaton = _build_keyword_automaton(
+            [spec.get("keywords", []) for _, spec in self._intent_items]
+        )
+        self._category_names = list(self._category_keywords)
+        self._category_automaton = _build_keyword_automaton(
+            [self._category_keywords[name] for name in self._category_names]
+        )
+        self._option_items = list(self._option_keywords.items())
+        self._option_automaton = _build_keyword_automaton(
+            [spec.get("keywords", []) for _, spec in self._option_items]
+        )
+
         self._date_parser = DateParser(
             date_config=nl_config.get("date_patterns", {}),
             date_regex_config=nl_config.get("date_regex", {}),
@@ -44,6 +87,11 @@ class NaturalLanguageParser:
             reference_time=reference_time,
         )
 
+    @staticmethod
+    def _compile_rules(rules: List[Dict[str, Any]]) -> List[Tuple[Pattern[str], Any]]:
+        """YAML 규칙 목록을 (컴파일된 패턴, 캡처 그룹) 목록으로 변환."""
+        return [(re.compile(rule["pattern"]), rule.get("group", 1)) for rule in rules]
+
     def parse(self, text: str) -> QuerySpec:
         """
         자연어 문자열을 QuerySpec으로 변환.
@@ -106,13 +154,27 @@ class NaturalLanguageParser:
         Returns:
             매칭된 intent의 result 딕셔너리. 매칭 없으면 빈 딕셔너리.
         """
-        for intent_name, spec in self._intent_patterns.items():
-            keywords = spec.get("keywords", [])
-            for keyword in keywords:
-                if keyword in text:
-                    logger.debug("의도 매칭: %s (키워드: %s)", intent_name, keyword)
-                    return spec.get("result", {})
-        return {}
+        if self._intent_automaton is None:
+            for intent_name, spec in self._intent_patterns.items():
+                keywords = spec.get("keywords", [])
+                for keyword in keywords:
+                    if keyword in text:
+                        logger.debug("의도 매칭: %s (키워드: %s)", intent_name, keyword)
+                        return spec.get("result", {})
+            return {}
+
+        # 매칭된 키워드 중 가장 먼저 선언된 의도 선택
+        best, best_keyword = len(self._intent_items), ""
+        for _, (keyword, group_indices) in self._intent_automaton.iter(text):
+            if group_indices[0] < best:
+                best, best_keyword = group_indices[0], keyword
+                if best == 0:
+                    break
+        if best == len(self._intent_items):
+            return {}
+        intent_name, spec = self._intent_items[best]
+        logger.debug("의도 매칭: %s (키워드: %s)", intent_name, best_keyword)
+        return spec.get("result", {})
 
     def _extract_dates(
         self, text: str
@@ -127,14 +189,23 @@ class NaturalLanguageParser:
         Returns:
             매칭된 카테고리 리스트. 없으면 None.
         """
-        matched: List[str] = []
-        for category, keywords in self._category_keywords.items():
-            for keyword in keywords:
-                if keyword in text:
-                    if category not in matched:
-                        matched.append(category)
-                    break
-        return matched if matched else None
+        if self._category_automaton is None:
+            matched: List[str] = []
+            for category, keywords in self._category_keywords.items():
+                for keyword in keywords:
+                    if keyword in text:
+                        if category not in matched:
+                            matched.append(category)
+                        break
+            return matched if matched else None
+
+        hits = {
+            group_index
+            for _, (_, group_indices) in self._category_automaton.iter(text)
+            for group_index in group_indices
+        }
+        # 선언 순서 유지
+        return [self._category_names[i] for i in sorted(hits)] or None
 
     def _extract_keywords(
         self, text: str, categories: Optional[List[str]] = None
@@ -149,11 +220,8 @@ class NaturalLanguageParser:
         # 카테고리명 자체만 제외 (카테고리 감지 키워드는 제외하지 않음)
         category_names = set(categories) if categories else set()
 
-        for rule in self._keyword_patterns:
-            pattern = rule["pattern"]
-            group = rule.get("group", 1)
-            matches = re.finditer(pattern, text)
-            for match in matches:
+        for pattern, group in self._keyword_rules:
+            for match in pattern.finditer(text):
                 word = match.group(group).strip()
                 if word and word not in extracted and word not in category_names:
                     extracted.append(word)
@@ -163,11 +231,8 @@ class NaturalLanguageParser:
     def _extract_exclude_keywords(self, text: str) -> Optional[List[str]]:
         """제외 키워드 추출."""
         extracted: List[str] = []
-        for rule in self._exclude_patterns:
-            pattern = rule["pattern"]
-            group = rule.get("group", 1)
-            matches = re.finditer(pattern, text)
-            for match in matches:
+        for pattern, group in self._exclude_rules:
+            for match in pattern.finditer(text):
                 word = match.group(group).strip()
                 if word and word not in extracted:
                     extracted.append(word)
@@ -175,10 +240,8 @@ class NaturalLanguageParser:
 
     def _extract_limit(self, text: str) -> Optional[int]:
         """결과 수 추출 ("Top 10", "20개" 등)."""
-        for rule in self._limit_patterns:
-            pattern = rule["pattern"]
-            group = rule.get("group", 1)
-            match = re.search(pattern, text)
+        for pattern, group in self._limit_rules:
+            match = pattern.search(text)
             if match:
                 try:
                     return int(match.group(group))
@@ -189,10 +252,22 @@ class NaturalLanguageParser:
     def _extract_options(self, text: str) -> Dict[str, bool]:
         """옵션 키워드 추출."""
         options: Dict[str, bool] = {}
-        for option_name, spec in self._option_keywords.items():
-            keywords = spec.get("keywords", [])
-            for keyword in keywords:
-                if keyword in text:
-                    options[option_name] = spec.get("value", True)
-                    break
+        if self._option_automaton is None:
+            for option_name, spec in self._option_keywords.items():
+                keywords = spec.get("keywords", [])
+                for keyword in keywords:
+                    if keyword in text:
+                        options[option_name] = spec.get("value", True)
+                        break
+            return options
+
+        matched = {
+            group_index
+            for _, (_, group_indices) in self._option_automaton.iter(text)
+            for group_index in group_indices
+        }
+        # 선언 순서대로 채워 순차 검사와 같은 딕셔너리 순서 유지
+        for group_index in sorted(matched):
+            option_name, spec = self._option_items[group_index]
+            options[option_name] = spec.get("value", True)
         return options
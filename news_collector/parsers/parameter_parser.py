@@ -3,15 +3,16 @@
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
-from dateutil import parser as dateutil_parser
-
 from news_collector.models.query_spec import QuerySpec
+from news_collector.utils.date_utils import parse_datetime
 from news_collector.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
 ALLOWED_POPULARITY_TYPES = {"trending", "popular", "latest", "quality"}
 ALLOWED_GROUP_BY = {"day", "source", "none"}
+# 참으로 해석하는 문자열 (소문자 기준)
+_TRUTHY_STRINGS = frozenset({"true", "1", "yes", "on", "y", "t"})
 
 
 class ParameterParser:
@@ -82,11 +83,10 @@ class ParameterParser:
         if isinstance(value, datetime):
             return value
         if isinstance(value, str):
-            try:
-                return dateutil_parser.parse(value)
-            except (ValueError, TypeError):
+            parsed = parse_datetime(value)
+            if parsed is None:
                 logger.warning("날짜 파싱 실패: %s", value)
-                return None
+            return parsed
         return None
 
     def _parse_list_field(self, value: Any) -> Optional[List[str]]:
@@ -117,7 +117,7 @@ class ParameterParser:
         if isinstance(value, bool):
             return value
         if isinstance(value, str):
-            return value.lower() in ("true", "1", "yes")
+            return value.lower() in _TRUTHY_STRINGS
         return bool(value)
 
     def _validate_popularity_type(self, value: str) -> str:
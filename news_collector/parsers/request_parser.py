@@ -44,6 +44,13 @@ class RequestParser:
         )
         self._param_parser = ParameterParser(defaults=self._defaults)
 
+        # 설정 기본값은 생성 후 바뀌지 않으므로 parse()마다 조회하지 않도록 미리 읽어 둠
+        self._default_locale = self._defaults.get("locale", "ko_KR")
+        self._default_timezone = self._defaults.get("timezone", "Asia/Seoul")
+        self._default_country = self._defaults.get("country", "KR")
+        self._default_language = self._defaults.get("language", "ko")
+        self._default_market = self._defaults.get("market", "ko_KR")
+
     def parse(self, user_input: Union[str, Dict[str, Any]]) -> QuerySpec:
         """
         사용자 입력을 QuerySpec으로 변환.
@@ -81,15 +88,15 @@ class RequestParser:
     def _apply_defaults(self, query_spec: QuerySpec) -> QuerySpec:
         """None 필드에 설정 기본값 적용."""
         if query_spec.locale is None:
-            query_spec.locale = self._defaults.get("locale", "ko_KR")
+            query_spec.locale = self._default_locale
         if query_spec.timezone is None:
-            query_spec.timezone = self._defaults.get("timezone", "Asia/Seoul")
+            query_spec.timezone = self._default_timezone
         if query_spec.country is None:
-            query_spec.country = self._defaults.get("country", "KR")
+            query_spec.country = self._default_country
         if query_spec.language is None:
-            query_spec.language = self._defaults.get("language", "ko")
+            query_spec.language = self._default_language
         if query_spec.market is None:
-            query_spec.market = self._defaults.get("market", "ko_KR")
+            query_spec.market = self._default_market
         return query_spec
 
     def _validate_and_return(self, query_spec: QuerySpec) -> QuerySpec:
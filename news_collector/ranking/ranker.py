@@ -1,8 +1,12 @@
 """Module 9: Ranker & Policy Filter - 최종 점수 계산 및 랭킹"""
 
+import heapq
 import re
+from collections import defaultdict
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from operator import attrgetter
+from types import MappingProxyType
+from typing import Any, Callable, DefaultDict, Dict, List, Mapping, Optional, Tuple
 
 from news_collector.models.news import NormalizedNews, NewsWithScores
 from news_collector.integrity.integrity_checker import ContentIntegrityChecker
@@ -12,6 +16,11 @@ from news_collector.registry.source_registry import SourceRegistry
 from news_collector.utils.config_manager import ConfigManager
 from news_collector.utils.logger import get_logger
 
+try:
+    import ahocorasick  # 선택적 의존성: pyahocorasick
+except ImportError:
+    ahocorasick = None
+
 logger = get_logger(__name__)
 
 DEFAULT_WEIGHTS = {
@@ -28,6 +37,127 @@ RANKING_PRESETS = {
     "latest": {"popularity": 0.10, "relevance": 0.20, "quality": 0.30, "credibility": 0.40},
 }
 
+# 스팸 점수가 이 값을 넘으면 정책 필터에서 제외
+_SPAM_EXCLUDE_THRESHOLD = 0.7
+
+# 최종 점수 정렬 키 (C로 구현된 getter라 기사마다 파이썬 함수 호출이 없음)
+_FINAL_SCORE_KEY = attrgetter("final_score")
+
+# 발행일이 없는 기사는 latest 정렬에서 가장 뒤로
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _latest_sort_key(news: NewsWithScores) -> datetime:
+    """latest 프리셋 정렬 키 (발행일, 없으면 1970-01-01 UTC)."""
+    return news.published_at or _EPOCH
+
+
+# 최종 점수 가중치 (popularity, relevance, quality, credibility)
+_WeightVector = Tuple[float, float, float, float]
+
+
+def _weight_vector(weights: Dict[str, float]) -> _WeightVector:
+    """가중치 dict를 고정 순서 튜플로 변환 (없는 키는 0.25)."""
+    return (
+        weights.get("popularity", 0.25),
+        weights.get("relevance", 0.25),
+        weights.get("quality", 0.25),
+        weights.get("credibility", 0.25),
+    )
+
+
+# 프리셋별 가중치 튜플 (rank()마다 dict에서 다시 읽지 않도록 import 시 한 번 변환, 읽기 전용)
+_PRESET_WEIGHT_VECTORS: Mapping[str, _WeightVector] = MappingProxyType(
+    {name: _weight_vector(weights) for name, weights in RANKING_PRESETS.items()}
+)
+_DEFAULT_WEIGHT_VECTOR = _weight_vector(DEFAULT_WEIGHTS)
+
+
+# (검색 용어 목록, 키워드별 용어 인덱스 목록, 용어 오토마톤 또는 None,
+#  소문자 키워드 목록, 카테고리별 보너스 판정 캐시)
+_RelevancePlan = Tuple[List[str], List[List[int]], Any, List[str], Dict[str, bool]]
+
+# 키워드 → 관련 용어 매핑 원본 (검색어 확장, 영한 음역 + 한한 관련어)
+# 조회에는 Ranker.KEYWORD_SYNONYMS(소문자 변환본)를 사용
+_RAW_KEYWORD_SYNONYMS: Dict[str, List[str]] = {
+    # 영→한 매핑
+    "kpop": ["k-pop", "케이팝", "아이돌", "idol"],
+    "ai": ["인공지능", "artificial intelligence", "머신러닝", "딥러닝"],
+    "election": ["선거", "투표", "vote", "대선", "출마"],
+    "nba": ["농구", "basketball"],
+    "bts": ["방탄소년단", "방탄"],
+    "nato": ["나토", "북대서양조약기구"],
+    "un": ["유엔", "국제연합", "united nations"],
+    "nasa": ["나사", "항공우주국"],
+    "gdp": ["국내총생산", "성장률"],
+    "inflation": ["인플레이션", "물가", "물가상승"],
+    "trade": ["무역", "통상", "관세"],
+    "congress": ["의회", "국회"],
+    "president": ["대통령", "대선"],
+    "olympics": ["올림픽"],
+    "fifa": ["피파", "월드컵"],
+    "climate": ["기후", "기후변화", "온난화"],
+    "semiconductor": ["반도체", "칩"],
+    "startup": ["스타트업", "창업"],
+    # 한→영 + 한→한 관련어
+    "반도체": ["semiconductor", "칩", "chip", "파운드리"],
+    "경제": ["economy", "gdp", "성장률", "물가", "금리"],
+    "축구": ["football", "soccer", "fifa", "월드컵"],
+    "야구": ["baseball", "mlb", "프로야구", "타자", "투수"],
+    "부동산": ["real estate", "아파트", "주택", "집값", "매매"],
+    "주식": ["stock", "증시", "코스피", "나스닥", "주가"],
+    "영화": ["movie", "film", "cinema", "극장", "감독", "배우", "오스카", "개봉"],
+    "예술": ["art", "미술", "작품", "전시", "작가", "갤러리"],
+    "외교": ["diplomacy", "diplomatic", "대사", "외무", "정상회담", "회담"],
+    "선거": ["election", "투표", "vote", "대선", "출마", "당선", "후보"],
+    "정치": ["politics", "정당", "국회", "의원", "여당", "야당"],
+    "교육": ["education", "학교", "학생", "대학", "교사", "수업"],
+    "범죄": ["crime", "사건", "수사", "검찰", "경찰", "체포"],
+    "인공지능": ["ai", "머신러닝", "딥러닝", "chatgpt", "gpt"],
+    "스포츠": ["sports", "경기", "선수", "대회", "리그"],
+    "문화": ["culture", "예술", "공연", "전시", "축제"],
+    "과학": ["science", "연구", "실험", "논문", "발견"],
+    "우주": ["space", "nasa", "위성", "로켓", "발사"],
+    "기후변화": ["climate change", "온난화", "탄소", "환경"],
+    "드라마": ["drama", "시청률", "방영", "출연"],
+    "음악": ["music", "가수", "앨범", "콘서트", "노래"],
+    "올림픽": ["olympics", "메달", "금메달", "올림픽"],
+    "물가": ["inflation", "소비자물가", "가격", "인상"],
+    "인구": ["population", "출생률", "고령화", "인구감소"],
+    "아이돌": ["idol", "kpop", "k-pop", "연예인", "가수", "컴백"],
+    "연예": ["entertainment", "연예인", "스타", "셀럽", "방송"],
+    "복지": ["welfare", "복지정책", "사회보장", "지원"],
+    "환율": ["exchange rate", "달러", "원화", "외환"],
+    "금리": ["interest rate", "기준금리", "이자", "금리인하", "금리인상"],
+    "IT": ["정보기술", "소프트웨어", "하드웨어", "테크", "기술"],
+    "연구": ["research", "논문", "학술", "실험", "연구원", "연구소", "학회"],
+    "사건": ["incident", "사고", "수사", "경찰", "검찰", "범행"],
+    "뉴스": ["news", "보도", "기사", "언론", "미디어"],
+    "속보": ["breaking", "긴급", "단독", "flash"],
+}
+
+
+def _build_term_automaton(terms: List[str]):
+    """검색 용어 전체를 하나의 Aho-Corasick 오토마톤으로 구성 (빈 용어가 있으면 None)."""
+    if ahocorasick is None or not all(terms):
+        return None
+    automaton = ahocorasick.Automaton()
+    for i, term in enumerate(terms):
+        automaton.add_word(term, (i, len(term)))
+    automaton.make_automaton()
+    return automaton
+
+
+def _count_terms(automaton, text: str, term_count: int) -> List[int]:
+    """텍스트 한 번 스캔으로 용어별 등장 횟수 (str.count와 같이 겹치지 않는 등장만 셈)."""
+    counts = [0] * term_count
+    last_end = [-1] * term_count
+    for end, (i, length) in automaton.iter(text):
+        if end - length >= last_end[i]:
+            counts[i] += 1
+            last_end[i] = end
+    return counts
+
 
 class Ranker:
     """
@@ -81,36 +211,26 @@ class Ranker:
         if not news_list:
             return []
 
-        weights = RANKING_PRESETS.get(preset, DEFAULT_WEIGHTS)
         logger.info("랭킹 시작: %d건, 프리셋=%s", len(news_list), preset)
 
-        # 1. 점수 산출
-        scored = self._score_all(news_list, keywords=keywords)
-
-        # 2. 최종 점수 계산
-        for news in scored:
-            news.final_score = self._calculate_final_score(news, weights)
+        # 1. 점수 산출 + 정책 필터
+        #    (제외될 기사는 무결성 평가 후 나머지 점수 계산 생략, 정책 플래그는 6단계에서 기록)
+        filtered = self._score_all(news_list, keywords=keywords, policy_gate=True)
 
-        # 3. 정책 필터
-        filtered = self._apply_policy_filter(scored)
-
-        # 4. 정렬
-        _epoch = datetime(1970, 1, 1, tzinfo=timezone.utc)
-        if preset == "latest":
-            filtered.sort(
-                key=lambda n: n.published_at if n.published_at else _epoch,
-                reverse=True,
-            )
-        else:
-            filtered.sort(key=lambda n: n.final_score, reverse=True)
+        # 2~3. 최종 점수 계산 (가중치 조회는 배치당 한 번)
+        w = _PRESET_WEIGHT_VECTORS.get(preset, _DEFAULT_WEIGHT_VECTOR)
+        for news in filtered:
+            news.final_score = self._weighted_final_score(news, w)
 
-        # 5. 다양성 보장
-        diverse = self._ensure_diversity(filtered)
+        # 4~5. 정렬 + 다양성 보장
+        sort_key = _latest_sort_key if preset == "latest" else _FINAL_SCORE_KEY
+        diverse = self._sorted_diverse(filtered, sort_key, limit)
 
-        # 6. Top-N + 순위 할당
+        # 6. Top-N + 순위/정책 플래그 할당
         results = diverse[:limit]
         for i, news in enumerate(results):
             news.rank_position = i + 1
+            news.policy_flags = self._policy_flags(news)
 
         logger.info("랭킹 완료: %d → 필터(%d) → 최종(%d)", len(news_list), len(filtered), len(results))
         return results
@@ -119,111 +239,109 @@ class Ranker:
         self,
         news_list: List[NormalizedNews],
         keywords: Optional[List[str]] = None,
+        policy_gate: bool = False,
     ) -> List[NewsWithScores]:
-        """모든 뉴스에 Module 6/7/8 + 관련성 점수 산출."""
-        scored: List[NewsWithScores] = []
+        """
+        모든 뉴스에 Module 6/7/8 + 관련성 점수 산출.
 
-        for news in news_list:
-            nws = NewsWithScores(**{
-                k: v for k, v in news.__dict__.items()
-                if k in NormalizedNews.__dataclass_fields__
-            })
-
-            # Module 6: Integrity
-            integrity, details = self._integrity_checker.assess(news)
-            nws.integrity_score = integrity
-            nws.title_body_consistency = details["title_body_consistency"]
-            nws.contamination_score = details["contamination_score"]
-            nws.spam_score = details["spam_score"]
-            nws.integrity_flags = details.get("contamination_flags", []) + details.get("spam_flags", [])
-
-            # Module 7: Credibility & Quality
-            cred = self._credibility_scorer.score(news, news_list)
-            nws.credibility_score = cred["credibility_score"]
-            nws.quality_score = cred["quality_score"]
-            nws.evidence_score = cred["evidence_score"]
-            nws.sensationalism_penalty = cred["sensationalism_penalty"]
-
-            # Module 8: Popularity
-            pop = self._popularity_scorer.score(news, news_list)
-            nws.popularity_score = pop["popularity_score"]
-            nws.trending_velocity = pop["trending_velocity"]
-
-            # Relevance: 키워드 관련성 점수
-            nws.relevance_score = self._calculate_relevance(news, keywords)
-
-            scored.append(nws)
-
-        return scored
-
-    # 키워드 → 관련 용어 매핑 (검색어 확장, 영한 음역 + 한한 관련어)
+        policy_gate=True면 무결성 평가(Module 6) 직후 정책 필터 제외 대상인 기사는
+        나머지 점수를 계산하지 않고 결과에서 뺀다.
+        """
+        # Module 8은 배치 최대값 등 배치 단위 값이 필요하므로 한 번에 산출
+        popularity = self._popularity_scorer.score_batch(news_list)
+        # 키워드 검색 용어와 오토마톤은 배치 전체에서 공유
+        plan = self._build_relevance_plan(keywords) if keywords else None
+
+        # Module 6을 먼저 돌려, 정책 필터 제외 대상은 이후 점수 계산 생략
+        # (기사별 점수는 순수 파이썬 연산(GIL 점유)이라 스레드 풀로는 빨라지지 않으므로 순차 처리)
+        passed = []
+        for news, pop in zip(news_list, popularity):
+            nws = self._integrity_scored(news)
+            if policy_gate and self._excluded_by_policy(nws):
+                logger.debug("정책 필터 제외 (무결성/스팸): %s", news.title[:30])
+                continue
+            passed.append((news, nws, pop))
+
+        # Module 7: 크로스 소스 검증은 제외된 기사를 포함한 배치 전체와 비교
+        credibility = self._credibility_scorer.score_batch(
+            [news for news, _, _ in passed], news_list
+        )
+        return [
+            self._score_one(news, nws, pop, cred, keywords, plan)
+            for (news, nws, pop), cred in zip(passed, credibility)
+        ]
+
+    def _integrity_scored(self, news: NormalizedNews) -> NewsWithScores:
+        """Module 6 무결성 점수만 채운 NewsWithScores."""
+        nws = NewsWithScores.from_normalized(news)
+        integrity, details = self._integrity_checker.assess(news)
+        nws.integrity_score = integrity
+        nws.title_body_consistency = details["title_body_consistency"]
+        nws.contamination_score = details["contamination_score"]
+        nws.spam_score = details["spam_score"]
+        nws.integrity_flags = details.get("contamination_flags", []) + details.get("spam_flags", [])
+        return nws
+
+    def _score_one(
+        self,
+        news: NormalizedNews,
+        nws: NewsWithScores,
+        pop: Dict[str, float],
+        cred: Dict[str, float],
+        keywords: Optional[List[str]],
+        plan: Optional[_RelevancePlan],
+    ) -> NewsWithScores:
+        """무결성 평가를 마친 nws에 Module 7/8 + 관련성 점수 기록 (7/8은 배치에서 계산)."""
+        # Module 7: Credibility & Quality
+        nws.credibility_score = cred["credibility_score"]
+        nws.quality_score = cred["quality_score"]
+        nws.evidence_score = cred["evidence_score"]
+        nws.sensationalism_penalty = cred["sensationalism_penalty"]
+
+        # Module 8: Popularity
+        nws.popularity_score = pop["popularity_score"]
+        nws.trending_velocity = pop["trending_velocity"]
+
+        # Relevance: 키워드 관련성 점수
+        nws.relevance_score = self._calculate_relevance(news, keywords, plan)
+
+        return nws
+
+    # 키워드 → 관련 용어 매핑 (_RAW_KEYWORD_SYNONYMS를 조회용으로 변환)
+    # 키워드는 소문자로 조회하므로 키와 관련어를 미리 소문자 튜플로 변환 ("IT" → "it")
     KEYWORD_SYNONYMS = {
-        # 영→한 매핑
-        "kpop": ["k-pop", "케이팝", "아이돌", "idol"],
-        "ai": ["인공지능", "artificial intelligence", "머신러닝", "딥러닝"],
-        "election": ["선거", "투표", "vote", "대선", "출마"],
-        "nba": ["농구", "basketball"],
-        "bts": ["방탄소년단", "방탄"],
-        "nato": ["나토", "북대서양조약기구"],
-        "un": ["유엔", "국제연합", "united nations"],
-        "nasa": ["나사", "항공우주국"],
-        "gdp": ["국내총생산", "성장률"],
-        "inflation": ["인플레이션", "물가", "물가상승"],
-        "trade": ["무역", "통상", "관세"],
-        "congress": ["의회", "국회"],
-        "president": ["대통령", "대선"],
-        "olympics": ["올림픽"],
-        "fifa": ["피파", "월드컵"],
-        "climate": ["기후", "기후변화", "온난화"],
-        "semiconductor": ["반도체", "칩"],
-        "startup": ["스타트업", "창업"],
-        # 한→영 + 한→한 관련어
-        "반도체": ["semiconductor", "칩", "chip", "파운드리"],
-        "경제": ["economy", "gdp", "성장률", "물가", "금리"],
-        "축구": ["football", "soccer", "fifa", "월드컵"],
-        "야구": ["baseball", "mlb", "프로야구", "타자", "투수"],
-        "부동산": ["real estate", "아파트", "주택", "집값", "매매"],
-        "주식": ["stock", "증시", "코스피", "나스닥", "주가"],
-        "영화": ["movie", "film", "cinema", "극장", "감독", "배우", "오스카", "개봉"],
-        "예술": ["art", "미술", "작품", "전시", "작가", "갤러리"],
-        "외교": ["diplomacy", "diplomatic", "대사", "외무", "정상회담", "회담"],
-        "선거": ["election", "투표", "vote", "대선", "출마", "당선", "후보"],
-        "정치": ["politics", "정당", "국회", "의원", "여당", "야당"],
-        "교육": ["education", "학교", "학생", "대학", "교사", "수업"],
-        "범죄": ["crime", "사건", "수사", "검찰", "경찰", "체포"],
-        "인공지능": ["ai", "머신러닝", "딥러닝", "chatgpt", "gpt"],
-        "스포츠": ["sports", "경기", "선수", "대회", "리그"],
-        "문화": ["culture", "예술", "공연", "전시", "축제"],
-        "과학": ["science", "연구", "실험", "논문", "발견"],
-        "우주": ["space", "nasa", "위성", "로켓", "발사"],
-        "기후변화": ["climate change", "온난화", "탄소", "환경"],
-        "드라마": ["drama", "시청률", "방영", "출연"],
-        "음악": ["music", "가수", "앨범", "콘서트", "노래"],
-        "올림픽": ["olympics", "메달", "금메달", "올림픽"],
-        "물가": ["inflation", "소비자물가", "가격", "인상"],
-        "인구": ["population", "출생률", "고령화", "인구감소"],
-        "아이돌": ["idol", "kpop", "k-pop", "연예인", "가수", "컴백"],
-        "연예": ["entertainment", "연예인", "스타", "셀럽", "방송"],
-        "복지": ["welfare", "복지정책", "사회보장", "지원"],
-        "환율": ["exchange rate", "달러", "원화", "외환"],
-        "금리": ["interest rate", "기준금리", "이자", "금리인하", "금리인상"],
-        "IT": ["정보기술", "소프트웨어", "하드웨어", "테크", "기술"],
-        "연구": ["research", "논문", "학술", "실험", "연구원", "연구소", "학회"],
-        "사건": ["incident", "사고", "수사", "경찰", "검찰", "범행"],
-        "뉴스": ["news", "보도", "기사", "언론", "미디어"],
-        "속보": ["breaking", "긴급", "단독", "flash"],
+        k.lower(): tuple(s.lower() for s in v) for k, v in _RAW_KEYWORD_SYNONYMS.items()
     }
 
+    def _build_relevance_plan(self, keywords: List[str]) -> _RelevancePlan:
+        """
+        키워드별 검색 용어(동의어 확장)를 중복 없는 용어 목록으로 정리.
+
+        Returns:
+            (용어 목록, 키워드별 용어 인덱스 목록, 전체 용어 오토마톤 또는 None,
+             소문자 키워드 목록, 카테고리별 보너스 판정 캐시(빈 dict))
+        """
+        term_index: Dict[str, int] = {}
+        keyword_terms: List[List[int]] = []
+        keywords_lower = [kw.lower() for kw in keywords]
+        for kw_lower in keywords_lower:
+            search_terms = (kw_lower,) + self.KEYWORD_SYNONYMS.get(kw_lower, ())
+            keyword_terms.append([term_index.setdefault(t, len(term_index)) for t in search_terms])
+        terms = list(term_index)
+        return terms, keyword_terms, _build_term_automaton(terms), keywords_lower, {}
+
     def _calculate_relevance(
         self,
         news: NormalizedNews,
         keywords: Optional[List[str]] = None,
+        plan: Optional[_RelevancePlan] = None,
     ) -> float:
         """
         키워드 기반 관련성 점수 (0~1).
 
         키워드가 없으면 카테고리/콘텐츠 기반 기본 점수 반환.
         키워드가 있으면 제목/본문 매칭도를 측정 (동의어 확장 포함).
+        plan은 _build_relevance_plan(keywords) 결과로, 배치에서 재사용할 때 전달.
         """
         if not keywords:
             base = 0.5
@@ -237,92 +355,147 @@ class Ranker:
 
         title = (news.title or "").lower()
         body = (news.body or "").lower()
-        text = title + " " + body
 
-        if not text.strip():
+        # 제목/본문이 모두 공백이면 매칭 불가 (둘을 이어 붙인 사본은 만들지 않음)
+        if not title.strip() and not body.strip():
             return 0.0
 
-        # 키워드별 매칭 점수
+        if plan is None:
+            plan = self._build_relevance_plan(keywords)
+        terms, keyword_terms, automaton, keywords_lower, category_matches = plan
+
+        # 용어별 매칭 점수: 제목 포함 0.6 + 본문 포함 0.3 + 본문 빈도 보너스
+        # (오토마톤이 있으면 제목/본문을 용어 수와 무관하게 한 번씩만 스캔)
+        if automaton is not None:
+            title_counts = _count_terms(automaton, title, len(terms))
+            body_counts = _count_terms(automaton, body, len(terms))
+            term_scores = [
+                (0.6 if title_count else 0.0)
+                + (0.3 if body_count else 0.0)
+                + min(0.3, body_count * 0.05)
+                for title_count, body_count in zip(title_counts, body_counts)
+            ]
+        else:
+            # 제목에 없는 용어는 최대 0.6점(본문 포함 + 빈도 보너스)이라 제목에 있는 용어(0.6점
+            # 이상)를 넘을 수 없으므로, 그런 키워드는 제목 매칭 용어의 본문만 센다.
+            # 세지 않은 용어는 0.0으로 두며 키워드별 최대값에는 영향이 없다.
+            in_title = [term in title for term in terms]
+            needed = set()
+            for term_ids in keyword_terms:
+                title_ids = [i for i in term_ids if in_title[i]]
+                needed.update(title_ids or term_ids)
+            term_scores = [0.0] * len(terms)
+            for i in needed:
+                body_count = body.count(terms[i])
+                term_scores[i] = (
+                    (0.6 if in_title[i] else 0.0)
+                    + (0.3 if body_count else 0.0)
+                    + min(0.3, body_count * 0.05)
+                )
+
+        # 키워드별로 (동의어 포함) 가장 높은 매칭 점수 사용
         total_score = 0.0
-        for kw in keywords:
-            kw_lower = kw.lower()
-            # 동의어 확장
-            search_terms = [kw_lower]
-            synonyms = self.KEYWORD_SYNONYMS.get(kw_lower, [])
-            search_terms.extend(s.lower() for s in synonyms)
-
-            # 가장 높은 매칭 점수 사용
-            best_kw_score = 0.0
-            for term in search_terms:
-                title_match = 1.0 if term in title else 0.0
-                body_match = 1.0 if term in body else 0.0
-                body_count = body.count(term)
-                freq_bonus = min(0.3, body_count * 0.05)
-                kw_score = title_match * 0.6 + body_match * 0.3 + freq_bonus
-                best_kw_score = max(best_kw_score, kw_score)
-
-            total_score += best_kw_score
+        for term_ids in keyword_terms:
+            total_score += max([term_scores[i] for i in term_ids])
 
         # 키워드 수로 정규화
         relevance = total_score / len(keywords)
 
-        # 카테고리 매칭 보너스
+        # 카테고리 매칭 보너스 (키워드와 카테고리가 서로 부분 문자열이면 +0.1)
+        # 카테고리 종류는 적으므로 판정 결과를 plan에 캐시해 배치에서 재사용
         if news.category:
             cat_lower = news.category.lower()
-            for kw in keywords:
-                if kw.lower() in cat_lower or cat_lower in kw.lower():
-                    relevance = min(1.0, relevance + 0.1)
-                    break
+            matched = category_matches.get(cat_lower)
+            if matched is None:
+                matched = any(kw in cat_lower or cat_lower in kw for kw in keywords_lower)
+                category_matches[cat_lower] = matched
+            if matched:
+                relevance = min(1.0, relevance + 0.1)
 
         return min(1.0, relevance)
 
-    def _calculate_final_score(self, news: NewsWithScores, weights: Dict[str, float]) -> float:
-        """가중 평균으로 최종 점수 (0~100) 계산."""
+    @staticmethod
+    def _weighted_final_score(news: NewsWithScores, w: _WeightVector) -> float:
+        """(popularity, relevance, quality, credibility) 가중치 튜플로 최종 점수 계산."""
         raw = (
-            news.popularity_score * weights.get("popularity", 0.25)
-            + news.relevance_score * weights.get("relevance", 0.25)
-            + news.quality_score * weights.get("quality", 0.25)
-            + news.credibility_score * weights.get("credibility", 0.25)
+            news.popularity_score * w[0]
+            + news.relevance_score * w[1]
+            + news.quality_score * w[2]
+            + news.credibility_score * w[3]
         )
         return round(raw * 100, 1)
 
-    def _apply_policy_filter(self, scored: List[NewsWithScores]) -> List[NewsWithScores]:
-        """정책 필터 적용."""
-        result = []
-        for news in scored:
-            flags = []
-
-            if news.integrity_score < self._integrity_threshold:
-                flags.append("low_integrity")
-                logger.debug("정책 필터 제외 (무결성): %s", news.title[:30])
-                continue
-
-            if news.credibility_score < self._credibility_threshold:
-                flags.append("suspicious_credibility")
+    def _excluded_by_policy(self, news: NewsWithScores) -> bool:
+        """정책 필터에서 제외될 기사인지 (무결성 미달 또는 스팸)."""
+        return (
+            news.integrity_score < self._integrity_threshold
+            or news.spam_score > _SPAM_EXCLUDE_THRESHOLD
+        )
 
-            if news.spam_score > 0.7:
-                flags.append("spam_detected")
-                continue
+    def _policy_flags(self, news: NewsWithScores) -> List[str]:
+        """필터를 통과한 기사의 정책 플래그."""
+        if news.credibility_score < self._credibility_threshold:
+            return ["suspicious_credibility"]
+        return []
 
-            news.policy_flags = flags
-            result.append(news)
+    def _sorted_diverse(
+        self,
+        news_list: List[NewsWithScores],
+        sort_key: Callable[[NewsWithScores], Any],
+        limit: int,
+    ) -> List[NewsWithScores]:
+        """
+        sort_key 내림차순 정렬 후 다양성 보장 (앞쪽 limit건은 전체 정렬 결과와 동일).
 
-        return result
+        다양성 보장은 정렬 순서대로 앞에서부터 고르므로, 상위 k건만으로 limit건을
+        채울 수 있으면 나머지 순서는 결과에 영향이 없다. heapq.nlargest(안정 정렬과
+        같은 순서)로 상위 k건만 정렬하고, 부족하면 k를 늘려 다시 시도한다.
+        """
+        use_name = self._use_source_name(news_list)
+        k = limit * max(1, self._max_same_source)
+        while 0 < k < len(news_list):
+            top = heapq.nlargest(k, news_list, key=sort_key)
+            diverse = self._ensure_diversity(top, use_name=use_name, limit=limit)
+            if len(diverse) >= limit:
+                return diverse
+            k *= 4
+
+        news_list.sort(key=sort_key, reverse=True)
+        return self._ensure_diversity(news_list, use_name=use_name)
+
+    @staticmethod
+    def _use_source_name(news_list: List[NewsWithScores]) -> bool:
+        """source_id가 모두 같으면(예: google_news) source_name 기반으로 다양성 판단."""
+        if len(news_list) < 2:
+            return False
+        # 다른 source_id가 하나라도 나오면 바로 중단 (보통 두 번째 기사에서 결정됨)
+        first_id = news_list[0].source_id
+        return all(n.source_id == first_id for n in news_list)
+
+    def _ensure_diversity(
+        self,
+        news_list: List[NewsWithScores],
+        use_name: Optional[bool] = None,
+        limit: Optional[int] = None,
+    ) -> List[NewsWithScores]:
+        """
+        소스 다양성 보장 (같은 소스 최대 N개).
 
-    def _ensure_diversity(self, news_list: List[NewsWithScores]) -> List[NewsWithScores]:
-        """소스 다양성 보장 (같은 소스 최대 N개)."""
-        source_count: Dict[str, int] = {}
+        use_name을 생략하면 news_list로 판단하고, limit건을 고르면 중단한다.
+        """
+        source_count: DefaultDict[str, int] = defaultdict(int)
         diverse: List[NewsWithScores] = []
+        max_same_source = self._max_same_source
 
-        # source_id가 모두 같으면(예: google_news) source_name 기반으로 전환
-        unique_ids = {n.source_id for n in news_list}
-        use_name = len(unique_ids) == 1 and len(news_list) > 1
+        if use_name is None:
+            use_name = self._use_source_name(news_list)
 
         for news in news_list:
             key = news.source_name if use_name else news.source_id
-            count = source_count.get(key, 0)
-            if count < self._max_same_source:
+            if source_count[key] < max_same_source:
                 diverse.append(news)
-                source_count[key] = count + 1
+                source_count[key] += 1
+                if limit is not None and len(diverse) >= limit:
+                    break
 
         return diverse
@@ -177,8 +177,10 @@ class SourceRegistry:
         """수집 성공 기록."""
         source = self._sources.get(source_id)
         if source:
-            source.last_crawled = datetime.now()
-            source.last_success = datetime.now()
+            # 수집 시각과 성공 시각은 같은 시점이므로 시계를 한 번만 읽음
+            now = datetime.now()
+            source.last_crawled = now
+            source.last_success = now
             source.failure_count = 0
             logger.debug("소스 성공 기록: %s", source_id)
 
@@ -1,7 +1,7 @@
 """Module 7: Credibility & Quality Scoring - 신뢰도/품질 점수"""
 
 import re
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Pattern, Set, Tuple
 
 from news_collector.models.news import NormalizedNews
 from news_collector.registry.source_registry import SourceRegistry
@@ -18,12 +18,49 @@ EVIDENCE_PATTERNS = [
     r'https?://\S+',  # 참고 링크
 ]
 
+
+def _compile_evidence_patterns(
+    patterns: List[str],
+) -> Tuple[Optional[Pattern[str]], Tuple[Pattern[str], ...]]:
+    """
+    증거 패턴을 스캔 횟수가 적은 형태로 컴파일.
+
+    "\\d+X"(숫자 + 단위 문자 하나) 패턴은 "숫자 바로 뒤에 X가 있는가"와 같으므로 단위 문자를
+    모아 정규식 하나로 판정하고 (찾은 단위 문자 종류 = 매칭된 패턴 수), 나머지는 개별 컴파일.
+
+    Returns:
+        (단위 문자 정규식 또는 None, 나머지 패턴의 컴파일 결과)
+    """
+    units = []
+    others = []
+    for pattern in patterns:
+        unit = pattern[3:]
+        if (
+            pattern.startswith(r"\d+") and len(unit) == 1
+            and re.escape(unit) == unit and unit not in units
+        ):
+            units.append(unit)
+        else:
+            others.append(re.compile(pattern))
+    unit_regex = re.compile(r"\d([" + "".join(units) + "])") if units else None
+    return unit_regex, tuple(others)
+
+
+_EVIDENCE_UNIT_REGEX, _EVIDENCE_OTHER_REGEXES = _compile_evidence_patterns(EVIDENCE_PATTERNS)
+
 # 선정적 표현
 SENSATIONAL_WORDS = [
     "충격", "경악", "발칵", "폭탄", "대박", "역대급", "초대형",
     "긴급", "속보", "단독", "breaking", "shock",
 ]
 
+# 선정적 표현 전체를 한 번의 스캔으로 찾는 정규식 (찾은 표현 종류 = 포함된 단어 수)
+# 현재 목록에는 서로 겹치는 단어가 없으므로 왼쪽부터 비겹침 매칭해도 누락이 없음
+_SENSATIONAL_REGEX = re.compile("|".join(map(re.escape, SENSATIONAL_WORDS)))
+
+# 과도한 특수문자 (물음표/느낌표 연속, ㅋㅋ/ㅎㅎ)
+_SPECIAL_CHAR_REGEX = re.compile(r'[!?]{2,}|[ㅋㅎ]{2,}')
+
 
 class CredibilityScorer:
     """
@@ -47,8 +84,40 @@ class CredibilityScorer:
         Returns:
             {"credibility_score", "quality_score", "evidence_score", "sensationalism_penalty"}
         """
+        return self._score_with(news, all_news or [], None)
+
+    def score_batch(
+        self,
+        news_list: List[NormalizedNews],
+        all_news: Optional[List[NormalizedNews]] = None,
+    ) -> List[Dict[str, float]]:
+        """
+        여러 기사의 신뢰도 + 품질 점수를 한 번에 산출.
+
+        각 기사에 score(news, all_news)를 호출한 것과 같은 결과지만, 크로스 소스 검증용
+        제목 토큰을 all_news에서 한 번만 만든다.
+
+        Args:
+            news_list: 점수를 낼 기사들.
+            all_news: 크로스 소스 검증에 쓸 배치 전체. None이면 news_list.
+
+        Returns:
+            news_list와 같은 순서의 score() 결과 리스트.
+        """
+        if all_news is None:
+            all_news = news_list
+        title_words = self._title_word_sets(all_news)
+        return [self._score_with(news, all_news, title_words) for news in news_list]
+
+    def _score_with(
+        self,
+        news: NormalizedNews,
+        all_news: List[NormalizedNews],
+        title_words: Optional[List[Set[str]]],
+    ) -> Dict[str, float]:
+        """all_news의 제목 토큰(없으면 새로 생성)이 주어졌을 때 한 기사의 점수 산출."""
         source_trust = self._source_trust_score(news)
-        cross_bonus = self._cross_source_bonus(news, all_news or [])
+        cross_bonus = self._cross_source_bonus(news, all_news, title_words)
         evidence = self._evidence_score(news)
         sensationalism = self._sensationalism_penalty(news)
 
@@ -62,6 +131,11 @@ class CredibilityScorer:
             "sensationalism_penalty": round(sensationalism, 3),
         }
 
+    @staticmethod
+    def _title_word_sets(news_list: List[NormalizedNews]) -> List[Set[str]]:
+        """크로스 소스 검증에 쓰는 기사별 제목 단어 집합 (news_list와 같은 순서)."""
+        return [set((news.title or "").lower().split()) for news in news_list]
+
     def _source_trust_score(self, news: NormalizedNews) -> float:
         """소스 Tier 기반 신뢰도 (0~1)."""
         tier_scores = {
@@ -79,7 +153,10 @@ class CredibilityScorer:
         return base
 
     def _cross_source_bonus(
-        self, news: NormalizedNews, all_news: List[NormalizedNews]
+        self,
+        news: NormalizedNews,
+        all_news: List[NormalizedNews],
+        other_words_list: Optional[List[Set[str]]] = None,
     ) -> float:
         """여러 소스에서 같은 뉴스 보도 시 보너스."""
         if not all_news:
@@ -88,20 +165,24 @@ class CredibilityScorer:
         title_words = set((news.title or "").lower().split())
         if len(title_words) < 3:
             return 0.0
+        if other_words_list is None:
+            other_words_list = self._title_word_sets(all_news)
 
+        title_len = len(title_words)
         cross_count = 0
-        for other in all_news:
+        for other, other_words in zip(all_news, other_words_list):
             if other.source_id == news.source_id or other.id == news.id:
                 continue
-            other_words = set(other.title.lower().split())
             if not other_words:
                 continue
-            union = len(title_words | other_words)
-            if union == 0:
-                continue
-            sim = len(title_words & other_words) / union
+            # 합집합 크기는 교집합 크기로 계산 (합집합 set 생성 생략)
+            common = len(title_words & other_words)
+            sim = common / (title_len + len(other_words) - common)
             if sim >= 0.5:
                 cross_count += 1
+                # 3건 이상이면 보너스가 더 오르지 않으므로 나머지는 볼 필요 없음
+                if cross_count >= 3:
+                    break
 
         if cross_count >= 3:
             return 0.15
@@ -115,10 +196,10 @@ class CredibilityScorer:
             return 0.3
 
         text = news.body
-        match_count = 0
-        for pattern in EVIDENCE_PATTERNS:
-            if re.search(pattern, text):
-                match_count += 1
+        # 매칭되는 증거 패턴 수 (숫자 단위 패턴은 한 번의 스캔으로 판정)
+        match_count = sum(1 for regex in _EVIDENCE_OTHER_REGEXES if regex.search(text))
+        if _EVIDENCE_UNIT_REGEX is not None:
+            match_count += len(set(_EVIDENCE_UNIT_REGEX.findall(text)))
 
         # 본문 길이 보너스 (짧은 텍스트에 더 관대)
         text_len = len(text)
@@ -137,13 +218,13 @@ class CredibilityScorer:
     def _sensationalism_penalty(self, news: NormalizedNews) -> float:
         """선정성 감점 (0~1)."""
         penalty = 0.0
-        title = (news.title or "").lower()
+        title = news.title or ""
 
-        word_count = sum(1 for w in SENSATIONAL_WORDS if w in title)
+        word_count = len(set(_SENSATIONAL_REGEX.findall(title.lower())))
         penalty += min(0.5, word_count * 0.15)
 
         # 과도한 특수문자
-        special_count = len(re.findall(r'[!?]{2,}|[ㅋㅎ]{2,}', news.title or ""))
+        special_count = len(_SPECIAL_CHAR_REGEX.findall(title))
         penalty += min(0.2, special_count * 0.1)
 
         return min(1.0, penalty)
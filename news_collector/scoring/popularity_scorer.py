@@ -1,7 +1,7 @@
 """Module 8: Popularity Engine - 인기도 점수"""
 
 from datetime import datetime, timezone
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from news_collector.models.news import NormalizedNews
 from news_collector.utils.logger import get_logger
@@ -40,11 +40,35 @@ class PopularityScorer:
             {"popularity_score": 0~1, "trending_velocity": 0~1}
         """
         all_news = all_news or []
+        maxima = self._batch_maxima(all_news)
+        reference = self._freshness_reference(all_news)
+        return self._score_with(news, maxima, reference, datetime.now(timezone.utc))
 
-        # 정규화를 위한 최대값 수집
-        max_views = max((n.view_count or 0 for n in all_news), default=1) or 1
-        max_shares = max((n.share_count or 0 for n in all_news), default=1) or 1
-        max_comments = max((n.comment_count or 0 for n in all_news), default=1) or 1
+    def score_batch(self, news_list: List[NormalizedNews]) -> List[Dict[str, float]]:
+        """
+        배치 전체의 인기도 + 트렌딩 속도를 한 번에 산출.
+
+        각 기사에 score(news, news_list)를 호출한 것과 같은 결과지만, 배치 단위 값
+        (지표 최대값, 신선도 기준 시각)을 기사마다 다시 계산하지 않으므로
+        O(N²)이 아닌 O(N)으로 처리된다.
+
+        Returns:
+            news_list와 같은 순서의 score() 결과 리스트.
+        """
+        maxima = self._batch_maxima(news_list)
+        reference = self._freshness_reference(news_list)
+        now = datetime.now(timezone.utc)
+        return [self._score_with(news, maxima, reference, now) for news in news_list]
+
+    def _score_with(
+        self,
+        news: NormalizedNews,
+        maxima: Tuple[int, int, int],
+        reference: datetime,
+        now: datetime,
+    ) -> Dict[str, float]:
+        """배치 단위 값이 주어졌을 때 한 기사의 점수 산출."""
+        max_views, max_shares, max_comments = maxima
 
         # 개별 지표 정규화 (0~1)
         norm_views = (news.view_count or 0) / max_views
@@ -61,16 +85,24 @@ class PopularityScorer:
         # 인기도 메트릭이 전혀 없으면 신선도 기반 추정 (최소 0.3 보장)
         has_metrics = any([news.view_count, news.share_count, news.comment_count])
         if not has_metrics:
-            freshness = self._freshness_score(news, all_news)
+            freshness = self._freshness_at(news, reference)
             popularity = max(0.3, freshness)
 
-        trending = self._trending_velocity(news)
+        trending = self._trending_velocity(news, now)
 
         return {
             "popularity_score": round(min(1.0, popularity), 3),
             "trending_velocity": round(trending, 3),
         }
 
+    @staticmethod
+    def _batch_maxima(all_news: List[NormalizedNews]) -> Tuple[int, int, int]:
+        """정규화를 위한 조회/공유/댓글 최대값 (0이면 1)."""
+        max_views = max((n.view_count or 0 for n in all_news), default=1) or 1
+        max_shares = max((n.share_count or 0 for n in all_news), default=1) or 1
+        max_comments = max((n.comment_count or 0 for n in all_news), default=1) or 1
+        return max_views, max_shares, max_comments
+
     def _freshness_score(
         self, news: NormalizedNews, all_news: Optional[List[NormalizedNews]] = None,
     ) -> float:
@@ -82,12 +114,11 @@ class PopularityScorer:
         """
         if not news.published_at:
             return 0.3
+        return self._freshness_at(news, self._freshness_reference(all_news))
 
-        pub = news.published_at
-        if pub.tzinfo is None:
-            pub = pub.replace(tzinfo=timezone.utc)
-
-        # 기준 시각 결정: 배치 내 최신 기사가 7일 이상 전이면 배치 기준 사용
+    @staticmethod
+    def _freshness_reference(all_news: Optional[List[NormalizedNews]]) -> datetime:
+        """신선도 기준 시각: 배치 내 최신 기사가 7일 이상 전이면 그 발행일, 아니면 현재 시각."""
         reference = datetime.now(timezone.utc)
         if all_news:
             pub_dates = []
@@ -101,17 +132,30 @@ class PopularityScorer:
                 latest_in_batch = max(pub_dates)
                 if (reference - latest_in_batch).days >= 7:
                     reference = latest_in_batch
+        return reference
+
+    def _freshness_at(self, news: NormalizedNews, reference: datetime) -> float:
+        """기준 시각 대비 신선도 (0~1)."""
+        if not news.published_at:
+            return 0.3
+
+        pub = news.published_at
+        if pub.tzinfo is None:
+            pub = pub.replace(tzinfo=timezone.utc)
 
         hours_ago = max(0, (reference - pub).total_seconds() / 3600)
         # 지수 감쇠
         return 0.5 ** (hours_ago / self._half_life)
 
-    def _trending_velocity(self, news: NormalizedNews) -> float:
+    def _trending_velocity(
+        self, news: NormalizedNews, now: Optional[datetime] = None,
+    ) -> float:
         """트렌딩 속도: 시간 대비 인기도 상승률."""
         if not news.published_at:
             return 0.0
 
-        now = datetime.now(timezone.utc)
+        if now is None:
+            now = datetime.now(timezone.utc)
         pub = news.published_at
         if pub.tzinfo is None:
             pub = pub.replace(tzinfo=timezone.utc)
@@ -1,5 +1,7 @@
 """Module 7: CredibilityScorer 테스트"""
 
+import re
+
 import pytest
 
 from news_collector.scoring.credibility_scorer import CredibilityScorer, EVIDENCE_PATTERNS, SENSATIONAL_WORDS
@@ -143,6 +145,21 @@ class TestEvidenceScore:
         long_score = self.scorer._evidence_score(long_news)
         assert long_score >= short_score
 
+    def test_matches_per_pattern_count(self):
+        """숫자 단위 패턴을 묶어 판정해도 패턴별 search 결과와 동일."""
+        bodies = [
+            '대변인은 "점유율이 5%에 그쳤다"고 말했다. 3억 원, 2조 달러, 10만 명.',
+            "5억5억 5억 단위만 반복",
+            "% 억 만 조 숫자 없는 단위",
+            "1 % 띄어 쓴 단위와 ٣% 아라비아 숫자",
+            "'짧음' '충분히 긴 인용문' 연구 결과 발표 자료 http://x.y",
+        ]
+        for body in bodies:
+            news = _make_news(body=body)
+            expected_count = sum(1 for p in EVIDENCE_PATTERNS if re.search(p, body))
+            expected = 0.25 + min(1.0, expected_count * 0.15) + min(0.3, len(body) / 3000)
+            assert self.scorer._evidence_score(news) == pytest.approx(min(1.0, expected))
+
 
 # ═══════════════════════════════════════════════════════════
 # 선정성 감점 테스트
@@ -174,6 +191,17 @@ class TestSensationalismPenalty:
         penalty = self.scorer._sensationalism_penalty(news)
         assert penalty <= 1.0
 
+    def test_repeated_word_counted_once(self):
+        """같은 선정적 표현이 반복돼도 한 단어로 계산."""
+        once = self.scorer._sensationalism_penalty(_make_news(title="충격 발표"))
+        repeated = self.scorer._sensationalism_penalty(_make_news(title="충격 충격 충격 발표"))
+        assert repeated == once == pytest.approx(0.15)
+
+    def test_uppercase_english_words(self):
+        """영문 표현은 대소문자 구분 없이 매칭."""
+        news = _make_news(title="BREAKING: Shock result")
+        assert self.scorer._sensationalism_penalty(news) == pytest.approx(0.3)
+
 
 # ═══════════════════════════════════════════════════════════
 # score() 종합 테스트
@@ -214,3 +242,40 @@ class TestCredibilityScore:
         score_normal = self.scorer.score(normal)
         score_sensational = self.scorer.score(sensational)
         assert score_normal["quality_score"] >= score_sensational["quality_score"]
+
+
+# ═══════════════════════════════════════════════════════════
+# score_batch() 테스트
+# ═══════════════════════════════════════════════════════════
+
+class TestScoreBatch:
+    """score_batch() 테스트."""
+
+    def setup_method(self):
+        self.scorer = CredibilityScorer()
+
+    def test_matches_per_item_score(self):
+        """각 기사에 score(news, batch)를 호출한 결과와 동일."""
+        batch = [
+            _make_news(id="1", title="AI 인공지능 기술 혁신 발표 뉴스", source_id="src_a"),
+            _make_news(id="2", title="AI 인공지능 기술 혁신 발표 소식", source_id="src_b"),
+            _make_news(id="3", title="AI 인공지능 기술 혁신 발표 보도", source_id="src_c"),
+            _make_news(id="4", title="AI 인공지능 기술 혁신 발표 기사", source_id="src_d"),
+            _make_news(id="5", title="스포츠 축구 경기 결과", source_id="src_a"),
+            _make_news(id="6", title="", source_id="src_e"),
+        ]
+        assert self.scorer.score_batch(batch) == [self.scorer.score(n, batch) for n in batch]
+
+    def test_empty_batch(self):
+        assert self.scorer.score_batch([]) == []
+
+    def test_subset_against_full_batch(self):
+        """일부 기사만 채점해도 크로스 소스 검증은 all_news 전체와 비교."""
+        news = _make_news(id="1", title="한국 경제 성장률 전망 발표", source_id="src_a")
+        batch = [
+            news,
+            _make_news(id="2", title="한국 경제 성장률 전망 공개", source_id="src_b"),
+            _make_news(id="3", title="스포츠 축구 경기 결과", source_id="src_c"),
+        ]
+        assert self.scorer.score_batch([news], batch) == [self.scorer.score(news, batch)]
+        assert self.scorer.score_batch([news], batch)[0]["credibility_score"] == 0.9
@@ -99,6 +99,13 @@ class TestRelativeRegex:
         date_from, date_to = parser.parse("지난 1주 뉴스")
         assert date_from == datetime(2026, 1, 29, 0, 0, 0, tzinfo=TZ)
 
+    def test_unknown_rule_type_skipped(self, date_config, date_regex_config) -> None:
+        """알 수 없는 유형의 규칙은 건너뛰고 다음 규칙 적용."""
+        date_config["relative_regex"].insert(0, {"pattern": "지난\\s*(\\d+)\\s*일", "type": "months_ago"})
+        parser = DateParser(date_config, date_regex_config, reference_time=REF_TIME)
+        date_from, _ = parser.parse("지난 3일 뉴스")
+        assert date_from == datetime(2026, 2, 2, 0, 0, 0, tzinfo=TZ)
+
     def test_recent_n_days(self, parser: DateParser) -> None:
         """'최근 5일' 파싱."""
         date_from, date_to = parser.parse("최근 5일 뉴스")
@@ -143,6 +150,20 @@ class TestAbsoluteSingle:
         date_from, date_to = parser.parse("12월 25일 뉴스")
         assert date_from.year == 2025
 
+    def test_today_infers_this_year(self, parser: DateParser) -> None:
+        """오늘 날짜는 올해로 추론."""
+        date_from, _ = parser.parse("2월 5일 뉴스")
+        assert date_from == datetime(2026, 2, 5, 0, 0, 0, tzinfo=TZ)
+
+    def test_leap_day_uses_last_leap_year(self, date_config, date_regex_config) -> None:
+        """아직 오지 않은 2월 29일은 작년(윤년)으로 추론."""
+        parser = DateParser(
+            date_config, date_regex_config,
+            reference_time=datetime(2025, 2, 5, 14, 0, 0, tzinfo=TZ),
+        )
+        date_from, _ = parser.parse("2월 29일 뉴스")
+        assert date_from == datetime(2024, 2, 29, 0, 0, 0, tzinfo=TZ)
+
 
 class TestIsoRange:
     """ISO 형식 범위 테스트."""
@@ -176,3 +197,31 @@ class TestNoDateFound:
         date_from, date_to = parser.parse("")
         assert date_from is None
         assert date_to is None
+
+    def test_missing_regex_config(self, date_config) -> None:
+        """date_regex 항목이 없으면 절대 날짜 매칭 생략."""
+        parser = DateParser(date_config=date_config, date_regex_config={}, reference_time=REF_TIME)
+        assert parser.parse("2월 1일 뉴스") == (None, None)
+        assert parser.parse("어제 뉴스")[0] == datetime(2026, 2, 4, 0, 0, 0, tzinfo=TZ)
+
+    def test_no_digit_skips_regex(self, parser: DateParser, monkeypatch) -> None:
+        """숫자가 없으면 정규식 단계를 실행하지 않음."""
+        monkeypatch.setattr(parser, "_try_iso_range", lambda text: pytest.fail("regex step ran"))
+        assert parser.parse("AI 뉴스 보여줘") == (None, None)
+        assert parser.parse("어제 뉴스")[0] == datetime(2026, 2, 4, 0, 0, 0, tzinfo=TZ)
+
+
+class TestStagePriority:
+    """여러 날짜 표현이 섞인 경우 단계 우선순위 테스트."""
+
+    def test_stage_order_beats_text_position(self, parser: DateParser) -> None:
+        """텍스트 앞쪽 표현보다 먼저 시도하는 단계가 우선."""
+        assert parser.parse("2월 1일 기사 중 지난 3일")[0] == datetime(2026, 2, 2, 0, 0, 0, tzinfo=TZ)
+        assert parser.parse("2월 1일~3일 그리고 2026-01-01~2026-01-05")[0] == datetime(
+            2026, 1, 1, 0, 0, 0, tzinfo=TZ
+        )
+        assert parser.parse("1월 3일 어제")[0] == datetime(2026, 2, 4, 0, 0, 0, tzinfo=TZ)
+
+    def test_first_match_only_per_stage(self, parser: DateParser) -> None:
+        """단계마다 첫 매칭만 사용 (잘못된 날짜면 같은 단계의 뒤쪽 표현은 보지 않음)."""
+        assert parser.parse("2월 30일 또는 2월 3일") == (None, None)
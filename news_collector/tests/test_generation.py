@@ -1,5 +1,8 @@
 """Stage 3 뉴스 생성 모듈 테스트"""
 
+import dataclasses
+import sys
+
 import pytest
 from datetime import datetime
 from unittest.mock import Mock, patch
@@ -21,6 +24,8 @@ from news_collector.generation.content_assembler import (
 )
 from news_collector.generation.citation_manager import CitationManager
 from news_collector.models.generated_news import (
+    FORMAT_SPECS,
+    to_format,
     NewsFormat,
     GenerationMode,
     CitationType,
@@ -38,7 +43,8 @@ from news_collector.models.analyzed_news import (
     TextComplexity,
     EnrichedNews,
 )
-from news_collector.models.news import NewsWithScores
+from news_collector.models.news import NewsWithScores, NormalizedNews
+from news_collector.models.raw_news import RawNewsRecord
 
 
 # ============================================================
@@ -651,6 +657,13 @@ class TestDataClasses:
         assert NewsFormat.BRIEF.value == "brief"
         assert NewsFormat.CARD_NEWS.value == "card_news"
 
+    def test_to_format(self):
+        """문자열/멤버 모두 NewsFormat으로 변환"""
+        assert to_format("card_news") is NewsFormat.CARD_NEWS
+        assert to_format(NewsFormat.BRIEF) is NewsFormat.BRIEF
+        with pytest.raises(ValueError):
+            to_format("unknown_format")
+
     def test_generation_mode_enum(self):
         """GenerationMode 열거형"""
         assert GenerationMode.REWRITE.value == "rewrite"
@@ -693,6 +706,27 @@ class TestDataClasses:
         assert citation.source_news_id == "1"
         assert citation.position == 0  # 기본값
 
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots는 3.10+")
+    def test_hot_models_use_slots(self):
+        """수집/정규화/생성 모델은 __dict__ 없이 슬롯 사용 (상속 포함)"""
+        instances = [
+            RawNewsRecord(url="http://example.com/1"),
+            NormalizedNews(title="t"),
+            NewsWithScores(title="t", final_score=0.5),
+            GeneratedNews(id="g", format=NewsFormat.BRIEF, title="t"),
+        ]
+        for obj in instances:
+            assert not hasattr(obj, "__dict__"), type(obj).__name__
+        assert instances[2].title == "t" and instances[2].final_score == 0.5
+
+    def test_format_specs_read_only(self):
+        """FORMAT_SPECS는 읽기 전용, structure는 튜플"""
+        with pytest.raises(TypeError):
+            FORMAT_SPECS[NewsFormat.BRIEF] = FORMAT_SPECS[NewsFormat.STRAIGHT]
+        assert FORMAT_SPECS[NewsFormat.BRIEF].structure == ("single_paragraph",)
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            FORMAT_SPECS[NewsFormat.BRIEF].max_length = 1
+
 
 # ============================================================
 # SentenceClassifier 테스트
@@ -1003,3 +1037,26 @@ class TestFallbackGeneratorWithAssembler:
         # images와 sources도 확인
         assert isinstance(result.images, list)
         assert isinstance(result.sources, list)
+
+
+# ============================================================
+# 분석 모델 테스트
+# ============================================================
+
+class TestAnalyzedNewsModels:
+    """분석 결과 모델 테스트"""
+
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots는 3.10+")
+    def test_models_use_slots(self):
+        """인스턴스별 __dict__ 없이 슬롯 사용"""
+        analysis = AnalyzedNews(news_id="n1", keywords=[Keyword(word="AI", score=0.9)])
+        assert not hasattr(analysis, "__dict__")
+        assert not hasattr(analysis.sentiment, "__dict__")
+        with pytest.raises(AttributeError):
+            analysis.unknown_field = 1
+
+    def test_default_factories_are_independent(self):
+        """기본 리스트는 인스턴스마다 별도"""
+        a, b = AnalyzedNews(), AnalyzedNews()
+        a.keywords.append(Keyword(word="AI"))
+        assert b.keywords == []
@@ -1,6 +1,7 @@
 """Module 3: Ingestion Engine 테스트"""
 
 import asyncio
+import json
 from unittest.mock import patch, MagicMock
 from xml.etree import ElementTree
 
@@ -8,6 +9,14 @@ import pytest
 
 from news_collector.ingestion.rss_connector import RSSConnector
 from news_collector.ingestion.api_connector import APIConnector
+from news_collector.ingestion import base_connector
+from news_collector.ingestion.base_connector import parse_json, run_sync
+from news_collector.ingestion.naver_news_connector import (
+    NaverAPIRateLimiter,
+    NaverNewsConnector,
+    _extract_source_name,
+    _infer_tier,
+)
 from news_collector.ingestion.ingestion_engine import IngestionEngine
 from news_collector.models.source import NewsSource
 from news_collector.models.raw_news import RawNewsRecord
@@ -94,10 +103,65 @@ class TestRSSConnectorParsing:
         assert entries[0]["title"] == "Atom 뉴스 제목"
         assert entries[0]["link"] == "https://atom.example.com/1"
 
+    def test_parse_bytes_with_declared_encoding(self):
+        xml_bytes = (
+            '<?xml version="1.0" encoding="ISO-8859-1"?>'
+            "<rss><channel><item><title>Caf\xe9 news</title></item></channel></rss>"
+        ).encode("latin-1")
+        entries = self.connector._parse_feed(xml_bytes)
+        assert len(entries) == 1
+        assert entries[0]["title"] == "Caf\xe9 news"
+
+    def test_parse_large_feed_streams_all_items(self):
+        items = "".join(
+            f"<item><title>뉴스 {i}</title><link>https://example.com/{i}</link></item>"
+            for i in range(2000)
+        )
+        xml_bytes = f'<?xml version="1.0" encoding="UTF-8"?><rss><channel>{items}</channel></rss>'.encode()
+        entries = self.connector._parse_feed(xml_bytes)
+        assert len(entries) == 2000
+        assert entries[-1]["link"] == "https://example.com/1999"
+
+    def test_parse_truncated_feed_returns_empty(self):
+        xml_bytes = SAMPLE_RSS_XML.encode("utf-8")[:-20]
+        assert self.connector._parse_feed(xml_bytes) == []
+
     def test_parse_invalid_xml(self):
         entries = self.connector._parse_feed("<not valid xml")
         assert entries == []
 
+    def test_parse_rejects_external_entity_declarations(self):
+        for decl in (
+            b'<!ENTITY a SYSTEM "file:///etc/passwd">',
+            b'<!ENTITY a PUBLIC "-//X//EN" "http://example.com/a">',
+            b'<!ENTITY % p SYSTEM "http://example.com/p.dtd"> %p;',
+        ):
+            xml_bytes = (
+                b'<?xml version="1.0"?><!DOCTYPE rss [' + decl + b"]>"
+                b"<rss><channel><item><title>t</title></item></channel></rss>"
+            )
+            assert self.connector._parse_feed(xml_bytes) == []
+
+    def test_parse_allows_internal_entity_declaration(self):
+        """&nbsp; 정의 같은 내부 엔티티 선언은 허용."""
+        xml_bytes = (
+            '<?xml version="1.0"?><!DOCTYPE rss [<!ENTITY nbsp "&#160;">]>'
+            "<rss><channel><item><title>AI&nbsp;뉴스</title>"
+            "<link>https://example.com/1</link></item></channel></rss>"
+        ).encode()
+        entries = self.connector._parse_feed(xml_bytes)
+        assert len(entries) == 1
+        assert entries[0]["title"] == "AI\xa0뉴스"
+
+    def test_parse_allows_entity_text_in_cdata(self):
+        """본문 CDATA 안의 '<!ENTITY' 문자열은 선언으로 보지 않음."""
+        xml_bytes = (
+            b'<?xml version="1.0"?><rss><channel><item><title>t</title>'
+            b'<description><![CDATA[<!ENTITY x SYSTEM "y"> \xec\x98\x88\xec\x8b\x9c]]></description>'
+            b"<link>https://example.com/1</link></item></channel></rss>"
+        )
+        assert len(self.connector._parse_feed(xml_bytes)) == 1
+
     def test_parse_empty_feed(self):
         entries = self.connector._parse_feed('<?xml version="1.0"?><rss><channel></channel></rss>')
         assert entries == []
@@ -112,14 +176,23 @@ class TestRSSConnectorHelpers:
     def test_strip_html_empty(self):
         assert RSSConnector._strip_html("") == ""
 
+    def test_strip_html_keeps_unclosed_and_empty_brackets(self):
+        assert RSSConnector._strip_html("a <> b <i>c</i> < d") == "a <> b c < d"
+
     def test_matches_keywords_true(self):
-        assert RSSConnector._matches_keywords("AI 기술 혁신", "상세 내용", ["AI"])
+        assert RSSConnector._matches_keywords("AI 기술 혁신", "상세 내용", RSSConnector._compile_keywords(["AI"]))
 
     def test_matches_keywords_false(self):
-        assert not RSSConnector._matches_keywords("경제 뉴스", "경제 전망", ["스포츠"])
+        assert not RSSConnector._matches_keywords("경제 뉴스", "경제 전망", RSSConnector._compile_keywords(["스포츠"]))
+
+    def test_matches_keywords_any_of_many(self):
+        pattern = RSSConnector._compile_keywords(["스포츠", "c++", "경제"])
+        assert RSSConnector._matches_keywords("C++ 20 release", "", pattern)
+        assert RSSConnector._matches_keywords("뉴스", "경제 전망", pattern)
+        assert not RSSConnector._matches_keywords("날씨", "맑음", pattern)
 
     def test_matches_keywords_case_insensitive(self):
-        assert RSSConnector._matches_keywords("KPOP News", "description", ["kpop"])
+        assert RSSConnector._matches_keywords("KPOP News", "description", RSSConnector._compile_keywords(["kpop"]))
 
 
 class TestRSSConnectorFetch:
@@ -129,18 +202,29 @@ class TestRSSConnectorFetch:
         source = _make_source()
         connector = RSSConnector(source)
 
-        with patch.object(connector, "_fetch_feed", return_value=SAMPLE_RSS_XML):
+        with patch.object(connector, "_fetch_feed", return_value=SAMPLE_RSS_XML.encode("utf-8")):
             records = asyncio.run(connector.fetch(limit=10))
             assert len(records) == 3
             assert all(isinstance(r, RawNewsRecord) for r in records)
             assert records[0].source_id == "test_rss"
             assert records[0].url == "https://example.com/news/1"
 
+    def test_fetch_records_share_fetch_timestamp(self):
+        source = _make_source()
+        connector = RSSConnector(source)
+
+        with patch.object(connector, "_fetch_feed", return_value=SAMPLE_RSS_XML.encode("utf-8")):
+            records = asyncio.run(connector.fetch(limit=10))
+
+        assert len(records) > 1
+        assert records[0].fetch_timestamp is not None
+        assert len({r.fetch_timestamp for r in records}) == 1
+
     def test_fetch_with_keyword_filter(self):
         source = _make_source()
         connector = RSSConnector(source)
 
-        with patch.object(connector, "_fetch_feed", return_value=SAMPLE_RSS_XML):
+        with patch.object(connector, "_fetch_feed", return_value=SAMPLE_RSS_XML.encode("utf-8")):
             records = asyncio.run(connector.fetch(keywords=["AI"], limit=10))
             assert len(records) == 1
             assert "AI" in records[0].raw_data["title"]
@@ -149,10 +233,24 @@ class TestRSSConnectorFetch:
         source = _make_source()
         connector = RSSConnector(source)
 
-        with patch.object(connector, "_fetch_feed", return_value=SAMPLE_RSS_XML):
+        with patch.object(connector, "_fetch_feed", return_value=SAMPLE_RSS_XML.encode("utf-8")):
             records = asyncio.run(connector.fetch(limit=2))
             assert len(records) == 2
 
+    def test_fetch_feed_uses_shared_session(self):
+        source = _make_source()
+        connector = RSSConnector(source)
+        session = MagicMock()
+        session.get.return_value.content = b"<rss/>"
+
+        with patch("news_collector.ingestion.base_connector.get_http_session", return_value=session):
+            body = asyncio.run(connector._fetch_feed(source.base_url))
+
+        assert body == b"<rss/>"
+        _, kwargs = session.get.call_args
+        assert kwargs["headers"]["User-Agent"] == "TestBot/1.0"
+        session.get.return_value.raise_for_status.assert_called_once()
+
     def test_fetch_error_returns_empty(self):
         source = _make_source()
         connector = RSSConnector(source)
@@ -181,6 +279,217 @@ class TestAPIConnector:
         assert connector._api_key == ""
 
 
+# ═══════════════════════════════════════════════════════════
+# parse_json 테스트
+# ═══════════════════════════════════════════════════════════
+
+class TestParseJson:
+    """응답 JSON 파싱 테스트."""
+
+    PAYLOAD = '{"items": [{"title": "한글 제목"}]}'.encode("utf-8")
+
+    def test_parse_bytes(self):
+        assert parse_json(self.PAYLOAD) == {"items": [{"title": "한글 제목"}]}
+
+    def test_parse_bytes_without_orjson(self):
+        with patch.object(base_connector, "orjson", None):
+            assert parse_json(self.PAYLOAD) == {"items": [{"title": "한글 제목"}]}
+
+
+# ═══════════════════════════════════════════════════════════
+# run_sync 테스트
+# ═══════════════════════════════════════════════════════════
+
+class TestRunSync:
+    """공유 백그라운드 루프 실행 테스트."""
+
+    @staticmethod
+    async def _loop_id():
+        await asyncio.sleep(0)
+        return id(asyncio.get_running_loop())
+
+    def test_reuses_single_loop(self):
+        assert run_sync(self._loop_id()) == run_sync(self._loop_id())
+
+    def test_works_inside_running_loop(self):
+        async def _caller():
+            return run_sync(self._loop_id())
+
+        assert asyncio.run(_caller()) == run_sync(self._loop_id())
+
+    def test_propagates_exception(self):
+        async def _fail():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            run_sync(_fail())
+
+
+# ═══════════════════════════════════════════════════════════
+# NaverNewsConnector 테스트
+# ═══════════════════════════════════════════════════════════
+
+class TestNaverAPIRateLimiter:
+    """토큰 버킷 레이트 리미터 테스트."""
+
+    def test_burst_passes_without_waiting(self):
+        limiter = NaverAPIRateLimiter(requests_per_second=0.001, burst=3)
+        with patch("asyncio.sleep") as mock_sleep:
+            for _ in range(3):
+                asyncio.run(limiter.wait_if_needed())
+        mock_sleep.assert_not_called()
+
+    def test_waits_when_bucket_empty(self):
+        limiter = NaverAPIRateLimiter(requests_per_second=0.001, burst=2)
+        with patch("asyncio.sleep") as mock_sleep:
+            for _ in range(3):
+                asyncio.run(limiter.wait_if_needed())
+        mock_sleep.assert_called_once()
+        assert mock_sleep.call_args.args[0] == pytest.approx(1000.0, rel=0.01)
+
+    def test_daily_quota_exceeded_raises(self):
+        limiter = NaverAPIRateLimiter(requests_per_second=1000.0, daily_quota=1)
+        asyncio.run(limiter.wait_if_needed())
+        with pytest.raises(RuntimeError):
+            asyncio.run(limiter.wait_if_needed())
+        assert limiter.remaining_quota == 0
+
+
+class TestNaverNewsConnector:
+    """Naver 커넥터 페이지네이션 테스트 (네트워크 모킹)."""
+
+    def _make_connector(self) -> NaverNewsConnector:
+        limiter = NaverAPIRateLimiter(requests_per_second=1000.0)
+        return NaverNewsConnector(client_id="id", client_secret="secret", rate_limiter=limiter)
+
+    @staticmethod
+    def _page(start: int, display: int):
+        return [
+            RawNewsRecord(source_id="naver_news", url=f"https://example.com/{start + i}")
+            for i in range(display)
+        ]
+
+    def test_fetch_pages_in_parallel_preserving_order(self):
+        connector = self._make_connector()
+
+        async def _fake_page(query, display, start, sort):
+            # 뒤 페이지가 먼저 끝나도 순서는 유지되어야 함
+            await asyncio.sleep(0.001 * (1000 - start) / 100)
+            return self._page(start, display)
+
+        with patch.object(connector, "_fetch_page", side_effect=_fake_page) as mock_page:
+            records = asyncio.run(connector.fetch(keywords=["AI"], limit=250))
+
+        assert len(records) == 250
+        assert records[0].url == "https://example.com/1"
+        assert records[-1].url == "https://example.com/250"
+        assert sorted(c.args[2] for c in mock_page.call_args_list) == [1, 101, 201]
+
+    def test_fetch_stops_on_empty_page(self):
+        connector = self._make_connector()
+
+        async def _fake_page(query, display, start, sort):
+            return self._page(start, display) if start == 1 else []
+
+        with patch.object(connector, "_fetch_page", side_effect=_fake_page):
+            records = asyncio.run(connector.fetch(keywords=["AI"], limit=300))
+
+        assert len(records) == 100
+
+    def test_enrich_all_with_full_body_downloads_concurrently(self):
+        connector = self._make_connector()
+        records = [
+            RawNewsRecord(
+                source_id="naver_news",
+                url=f"https://example.com/{i}",
+                raw_data={"title": f"제목{i}", "originallink": f"https://example.com/{i}"},
+            )
+            for i in range(3)
+        ]
+        state = {"active": 0, "peak": 0}
+
+        async def _fake_download(url):
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+            await asyncio.sleep(0.01)
+            state["active"] -= 1
+            return url.encode()
+
+        with patch.dict("sys.modules", {"trafilatura": MagicMock()}), \
+                patch.object(connector, "_download_body", side_effect=_fake_download), \
+                patch.object(NaverNewsConnector, "_extract_body", side_effect=lambda b: "본문 " + b.decode()):
+            asyncio.run(connector._enrich_all_with_full_body(records))
+
+        assert state["peak"] == 3
+        assert records[0].raw_data["full_body"] == "본문 https://example.com/0"
+        assert records[2].extracted_text == "제목2 본문 https://example.com/2"
+
+    def test_fetch_page_caches_parsed_pub_date(self):
+        connector = self._make_connector()
+        resp = MagicMock(status_code=200)
+        resp.content = json.dumps({"items": [{
+            "title": "제목", "description": "설명",
+            "originallink": "https://www.chosun.com/1", "link": "https://n.news.naver.com/1",
+            "pubDate": "Mon, 06 Jan 2025 12:30:00 +0900",
+        }]}).encode("utf-8")
+
+        with patch.object(connector, "_http_get", return_value=resp):
+            records = asyncio.run(connector._fetch_page("AI", 10, 1, "date"))
+
+        parsed = records[0].raw_data["_parsed_pub_date"]
+        assert (parsed.year, parsed.month, parsed.day, parsed.hour) == (2025, 1, 6, 12)
+        assert records[0].source_name == "조선일보"
+
+    def test_fetch_filters_by_cached_pub_date(self):
+        from datetime import datetime, timezone
+
+        connector = self._make_connector()
+        old = RawNewsRecord(url="https://example.com/old", raw_data={
+            "_parsed_pub_date": datetime(2024, 1, 1, tzinfo=timezone.utc)})
+        new = RawNewsRecord(url="https://example.com/new", raw_data={
+            "_parsed_pub_date": datetime(2025, 1, 6, tzinfo=timezone.utc)})
+
+        async def _fake_page(query, display, start, sort):
+            return [old, new] if start == 1 else []
+
+        with patch.object(connector, "_fetch_page", side_effect=_fake_page):
+            records = asyncio.run(connector.fetch(
+                keywords=["AI"], limit=10, date_from=datetime(2025, 1, 1, tzinfo=timezone.utc)))
+
+        assert records == [new]
+
+    def test_clean_html(self):
+        connector = self._make_connector()
+        assert connector._clean_html("<b>삼성</b> &amp; LG&quot;s  news") == '삼성 & LG"s news'
+        assert connector._clean_html("plain  text ") == "plain text"
+        assert connector._clean_html("") == ""
+
+    def test_clean_html_whitespace_runs(self):
+        connector = self._make_connector()
+        assert connector._clean_html("a <br> b") == "a b"
+        assert connector._clean_html("a<br>b") == "ab"
+        assert connector._clean_html("&nbsp;삼성&nbsp; 전자 ") == "삼성 전자"
+        # 엔티티로 인코딩된 태그도 디코딩 후 제거
+        assert connector._clean_html("a &lt;b&gt; c") == "a c"
+
+    def test_extract_source_name(self):
+        assert _extract_source_name("https://www.chosun.com/economy/1") == "조선일보"
+        assert _extract_source_name("https://news.kbs.co.kr/news/view.do?ncd=1") == "KBS"
+        assert _extract_source_name("https://unknown.example.com/a") == "unknown.example.com"
+        assert _extract_source_name("") == "네이버 뉴스"
+        assert _extract_source_name("not a url") == "Unknown"
+
+    def test_infer_tier(self):
+        assert _infer_tier("연합뉴스") == "tier1"
+        assert _infer_tier("매일경제") == "tier2"
+        assert _infer_tier("unknown.example.com") == "tier3"
+
+    def test_fetch_without_credentials_returns_empty(self):
+        with patch.dict("os.environ", {}, clear=True):
+            connector = NaverNewsConnector(client_id="", client_secret="")
+        assert asyncio.run(connector.fetch(keywords=["AI"])) == []
+
+
 # ═══════════════════════════════════════════════════════════
 # IngestionEngine 테스트
 # ═══════════════════════════════════════════════════════════
@@ -237,3 +546,104 @@ class TestIngestionEngine:
         query.category = ["비존재카테고리"]
         result = engine.collect(query)
         assert result == []
+
+    def test_collect_all_records_result_against_matching_source(self):
+        """커넥터 없는 소스가 건너뛰어져도 성공/실패가 올바른 소스에 기록됨."""
+        registry = self._make_registry()
+        registry.record_success = MagicMock()
+        registry.record_failure = MagicMock()
+        engine = IngestionEngine(registry)
+        sources = [
+            registry._sources["web_source"],
+            registry._sources["rss_source"],
+            registry._sources["api_source"],
+        ]
+        record = RawNewsRecord(source_id="api_source", url="https://example.com/1")
+
+        async def _fake_collect(connector, source, query_spec):
+            if source.id == "rss_source":
+                raise ConnectionError("boom")
+            return [record]
+
+        query = QuerySpec.create_default({"locale": "ko_KR", "limit": 20})
+        with patch.object(engine, "_collect_from_source", side_effect=_fake_collect):
+            records = asyncio.run(engine._collect_all(sources, query))
+
+        assert records == [record]
+        registry.record_failure.assert_called_once_with("rss_source")
+        registry.record_success.assert_called_once_with("api_source")
+
+    def test_collect_all_limits_concurrency_per_host(self):
+        """같은 호스트의 소스는 상한 이상 동시에 수집하지 않음."""
+        registry = self._make_registry()
+        engine = IngestionEngine(registry, max_concurrency_per_host=1)
+        sources = [
+            _make_source(id="a", base_url="https://same.example.com/a.xml"),
+            _make_source(id="b", base_url="https://same.example.com/b.xml"),
+        ]
+        state = {"active": 0, "peak": 0}
+
+        class _SlowConnector:
+            async def fetch(self, keywords=None, limit=20):
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+                await asyncio.sleep(0.01)
+                state["active"] -= 1
+                return []
+
+        query = QuerySpec.create_default({"locale": "ko_KR", "limit": 20})
+        with patch.object(engine, "_create_connector", return_value=_SlowConnector()):
+            asyncio.run(engine._collect_all(sources, query))
+        assert state["peak"] == 1
+
+
+# ═══════════════════════════════════════════════════════════
+# RawNewsRecord 직렬화 테스트
+# ═══════════════════════════════════════════════════════════
+
+class TestRawNewsRecordId:
+    """RawNewsRecord ID 자동 생성 테스트."""
+
+    def test_id_is_stable_per_source_and_url(self):
+        a = RawNewsRecord(source_id="s1", url="https://example.com/1")
+        b = RawNewsRecord(source_id="s1", url="https://example.com/1")
+        assert a.id == b.id
+        assert len(a.id) == 32
+        int(a.id, 16)
+
+    def test_id_differs_by_source_and_url(self):
+        base = RawNewsRecord(source_id="s1", url="https://example.com/1").id
+        assert RawNewsRecord(source_id="s2", url="https://example.com/1").id != base
+        assert RawNewsRecord(source_id="s1", url="https://example.com/2").id != base
+
+    def test_explicit_id_and_missing_url(self):
+        assert RawNewsRecord(id="fixed", url="https://example.com/1").id == "fixed"
+        assert RawNewsRecord(source_id="s1").id == ""
+
+
+class TestRawNewsRecordSerialization:
+    """RawNewsRecord.to_json 테스트."""
+
+    def _make_record(self) -> RawNewsRecord:
+        return RawNewsRecord(
+            source_id="test_rss",
+            source_name="Test RSS",
+            raw_data={"title": "AI 기술 혁신 발표"},
+            url="https://example.com/news/1",
+        )
+
+    def test_to_json_roundtrip(self):
+        record = self._make_record()
+        data = json.loads(record.to_json())
+        assert data["id"] == record.id
+        assert data["raw_data"]["title"] == "AI 기술 혁신 발표"
+        assert data["fetch_timestamp"] == record.fetch_timestamp.isoformat()
+
+    def test_to_json_stdlib_fallback(self):
+        from news_collector.models import raw_news
+
+        record = self._make_record()
+        with patch.object(raw_news, "orjson", None):
+            data = json.loads(record.to_json())
+        assert data["url"] == "https://example.com/news/1"
+        assert data["fetch_timestamp"] == record.fetch_timestamp.isoformat()
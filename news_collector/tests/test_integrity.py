@@ -1,7 +1,10 @@
 """Module 6: ContentIntegrityChecker 테스트"""
 
+from unittest.mock import patch
+
 import pytest
 
+from news_collector.integrity import integrity_checker
 from news_collector.integrity.integrity_checker import ContentIntegrityChecker
 from news_collector.models.news import NormalizedNews
 
@@ -118,6 +121,20 @@ class TestSpam:
         score, flags = self.checker._check_spam(news)
         assert "illegal_content" in flags
 
+    def test_ad_and_illegal_keywords_together(self):
+        news = _make_news(body="카지노 특가 할인 안내")
+        _, flags = self.checker._check_spam(news)
+        assert "ad_content" in flags
+        assert "illegal_content" in flags
+
+    def test_keyword_scan_without_automaton(self):
+        """pyahocorasick이 없을 때도 동일하게 탐지."""
+        news = _make_news(body="카지노 특가 할인 안내")
+        with patch.object(integrity_checker, "_SPAM_AUTOMATON", None):
+            _, flags = self.checker._check_spam(news)
+        assert "ad_content" in flags
+        assert "illegal_content" in flags
+
     def test_repetitive_content(self):
         news = _make_news(
             body="같은 문장입니다. 같은 문장입니다. 같은 문장입니다. 같은 문장입니다. 같은 문장입니다.",
@@ -150,6 +167,10 @@ class TestHelpers:
         assert "Apple" in entities
         assert "iPhone" not in entities or "iPhone" in entities  # 대문자로 시작
 
+    def test_extract_entities_mixed_unique_in_order(self):
+        entities = ContentIntegrityChecker._extract_entities("삼성 Apple 협력, 삼성 주가 상승 Apple")
+        assert entities == ["삼성", "Apple", "협력", "주가", "상승"]
+
     def test_extract_keywords(self):
         keywords = ContentIntegrityChecker._extract_keywords("한국 경제 성장률 전망 보고서")
         assert len(keywords) > 0
@@ -5,6 +5,7 @@ from zoneinfo import ZoneInfo
 
 import pytest
 
+from news_collector.parsers import natural_language_parser
 from news_collector.parsers.natural_language_parser import NaturalLanguageParser
 
 TZ = ZoneInfo("Asia/Seoul")
@@ -50,6 +51,17 @@ class TestIntentExtraction:
         assert q.popularity_type == "latest"
 
 
+    def test_declaration_order_wins(self, nl_config, defaults, monkeypatch) -> None:
+        """텍스트 위치와 관계없이 먼저 선언된 의도 선택 (오토마톤 유무 동일)."""
+        for automaton_module in (natural_language_parser.ahocorasick, None):
+            monkeypatch.setattr(natural_language_parser, "ahocorasick", automaton_module)
+            parser = NaturalLanguageParser(nl_config, defaults, reference_time=REF_TIME)
+            assert parser.parse("최신 인기 뉴스").popularity_type == "popular"
+            assert parser.parse("새로운 화제의 뉴스").popularity_type == "trending"
+            options = parser._extract_options("다양성 있는 공식 발표")
+            assert list(options) == ["verified_sources_only", "diversity"]
+
+
 class TestDateExtraction:
     """날짜 추출 테스트."""
 
@@ -82,6 +94,14 @@ class TestCategoryExtraction:
         assert "경제" in q.category
         assert "IT" in q.category
 
+    def test_categories_in_declaration_order(self, nl_config, defaults, monkeypatch) -> None:
+        """텍스트 순서와 관계없이 선언 순서로 반환 (오토마톤 유무 동일)."""
+        for automaton_module in (natural_language_parser.ahocorasick, None):
+            monkeypatch.setattr(natural_language_parser, "ahocorasick", automaton_module)
+            parser = NaturalLanguageParser(nl_config, defaults, reference_time=REF_TIME)
+            assert parser._extract_categories("축구 그리고 주식 그리고 국회") == ["정치", "경제", "스포츠"]
+            assert parser._extract_categories("날씨") is None
+
     def test_category_by_keyword(self, parser: NaturalLanguageParser) -> None:
         """카테고리 키워드로 매칭."""
         q = parser.parse("주식 관련 뉴스")
@@ -2,9 +2,16 @@
 
 from datetime import datetime, timezone
 
+from unittest.mock import patch
+
 import pytest
 
-from news_collector.normalizer.news_normalizer import NewsNormalizer, CATEGORY_MAPPING
+from news_collector.normalizer import news_normalizer
+from news_collector.normalizer.news_normalizer import (
+    CATEGORY_MAPPING,
+    PARALLEL_BATCH_THRESHOLD,
+    NewsNormalizer,
+)
 from news_collector.models.raw_news import RawNewsRecord
 from news_collector.models.news import NormalizedNews
 from news_collector.models.source import NewsSource
@@ -76,12 +83,110 @@ class TestCleanHtml:
         result = self.normalizer._clean_html("a &lt; b &gt; c")
         assert result == "a < b > c"
 
+    def test_remove_script_and_style_mixed_case(self):
+        html = "<p>A</p><SCRIPT type='x'>var s = '<style>';</SCRIPT><Style>p{}</Style>B"
+        assert self.normalizer._clean_html(html) == "AB"
+
+    def test_stray_lt_before_script_block(self):
+        """script/style 앞의 짝 없는 '<'가 블록 내용을 본문에 남기지 않음."""
+        with patch.object(news_normalizer, "LexborHTMLParser", None):
+            html = "<p>score 3<5 <script>track('id');</script> end</p>"
+            assert self.normalizer._clean_html(html) == "score 3"
+            assert self.normalizer._clean_html("a < <style>.x{color:red}</style>b") == "a < b"
+
     def test_empty_string(self):
         assert self.normalizer._clean_html("") == ""
 
     def test_plain_text_unchanged(self):
         assert self.normalizer._clean_html("Hello World") == "Hello World"
 
+    def test_regex_fallback_without_selectolax(self):
+        """selectolax가 없을 때 정규식 경로로 동일하게 정제."""
+        html = "<p>A &amp; B</p><script>x()</script>\n\n<b>C</b>"
+        with patch.object(news_normalizer, "LexborHTMLParser", None):
+            assert self.normalizer._clean_html(html) == "A & B\nC"
+            assert self.normalizer._extract_image_urls('<img src="a.jpg">') == ["a.jpg"]
+        assert self.normalizer._clean_html(html) == "A & B\nC"
+
+    def test_plain_text_skips_tag_stripping(self):
+        with patch.object(news_normalizer, "_TAG_PATTERN") as strip:
+            assert self.normalizer._clean_html(" A &lt;b&gt; \n\n B ") == "A <b>\nB"
+        strip.sub.assert_not_called()
+
+    def test_single_line_only_trimmed(self):
+        assert self.normalizer._clean_html(" \t<b>제목</b>\t부제  ") == "제목\t부제"
+
+    def test_collapse_blank_lines(self):
+        html = "  <p>첫 줄 </p>\r\n \n\t<p> 둘째  줄</p>&nbsp;\n\n"
+        assert self.normalizer._clean_html(html) == "첫 줄\n둘째  줄"
+
+
+# ═══════════════════════════════════════════════════════════
+# 동영상 뉴스 필터 테스트
+# ═══════════════════════════════════════════════════════════
+
+class TestVideoNewsFilter:
+    """동영상/방송 뉴스 판별 테스트."""
+
+    def setup_method(self):
+        self.normalizer = NewsNormalizer()
+
+    def _is_video(self, title: str) -> bool:
+        return self.normalizer._classify_title(title, "", "", filter_video_news=True)[0]
+
+    def test_broadcast_titles(self):
+        assert self._is_video("뉴스데스크 01월 04일 방송")
+        assert self._is_video("오늘의 편성 11:50 ~ 13:44")
+        assert self._is_video("[Live] 대통령 기자회견")
+        assert self._is_video("[현장 생중계] 국회 본회의")
+
+    def test_regular_titles(self):
+        assert not self._is_video("삼성전자 3분기 실적 발표")
+        # 대괄호 태그는 제목 맨 앞에 있을 때만 해당
+        assert not self._is_video("국회 본회의 [생중계 예정]")
+
+    def test_classify_title_matches_regex_path(self):
+        """hyperscan 통합 스캔과 정규식 경로의 판정이 같음."""
+        cases = [
+            ("[LIVE] 국회 본회의", "", "[LIVE] 국회 본회의"),
+            ("<b>주식</b> 시장 11:50", "sports", "주식 시장 11:50"),
+            ("오늘의 편성 11:50 ~ 13:44", "tech", "오늘의 편성 11:50 ~ 13:44"),
+            ("entertainment", "", "entertainment"),
+        ]
+        for raw_title, hint, title in cases:
+            for filter_video in (True, False):
+                expected = self.normalizer._classify_title(raw_title, hint, title, filter_video)
+                with patch.object(news_normalizer, "_TITLE_DATABASE", None):
+                    assert self.normalizer._classify_title(
+                        raw_title, hint, title, filter_video
+                    ) == expected
+
+    def test_keyword_in_raw_markup_ignored(self):
+        """원본 제목의 태그 속성에만 있는 키워드는 카테고리로 쓰지 않음."""
+        raw_title = '<a href="https://example.com/it/ai/detail">삼성 발표</a>'
+        assert self.normalizer._classify_title(raw_title, "", "삼성 발표", True) == (False, None)
+        with patch.object(news_normalizer, "_TITLE_DATABASE", None):
+            assert self.normalizer._classify_title(raw_title, "", "삼성 발표", True) == (False, None)
+
+    def test_classify_title_concurrent_threads(self):
+        """여러 스레드에서 동시에 판정해도 순차 결과와 같음."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        cases = [
+            (f"[LIVE] 중계 {i}", "", f"[LIVE] 중계 {i}") if i % 3 == 0
+            else (f"AI 기술 {i}", "", f"ai 기술 {i}")
+            for i in range(200)
+        ]
+        expected = [self.normalizer._classify_title(*case, True) for case in cases]
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(lambda case: self.normalizer._classify_title(*case, True), cases))
+        assert results == expected
+
+    def test_video_pattern_limited_to_raw_title(self):
+        # 힌트/정제 제목 구간의 패턴은 동영상으로 보지 않음
+        assert self.normalizer._classify_title("주식 시장", "", "주식 11:50 ~ 13:44", True) == (False, "경제")
+        assert self.normalizer._classify_title("[생중계] 축구", "", "축구", True) == (True, None)
+
 
 # ═══════════════════════════════════════════════════════════
 # 날짜 파싱 테스트
@@ -105,6 +210,46 @@ class TestParseDateTime:
         assert dt is not None
         assert dt.year == 2026
 
+    def test_iso_zulu_suffix(self):
+        dt = self.normalizer._parse_datetime("2026-02-05T01:00:00Z")
+        assert dt == datetime(2026, 2, 5, 1, 0, tzinfo=timezone.utc)
+
+    def test_rfc2822_offset_preserved(self):
+        dt = self.normalizer._parse_datetime("Thu, 05 Feb 2026 10:00:00 +0900")
+        assert dt == datetime(2026, 2, 5, 1, 0, tzinfo=timezone.utc)
+
+    def test_rfc2822_negative_zero_offset_is_utc(self):
+        """-0000 오프셋은 naive가 아닌 UTC로 해석."""
+        dt = self.normalizer._parse_datetime("Thu, 05 Feb 2026 10:00:00 -0000")
+        assert dt == datetime(2026, 2, 5, 10, 0, tzinfo=timezone.utc)
+        assert dt.tzinfo is not None
+
+    def test_repeated_date_string_parsed_once(self):
+        from news_collector.utils import date_utils
+
+        date_utils._parse_standard_datetime.cache_clear()
+        for _ in range(5):
+            self.normalizer._parse_datetime("Thu, 05 Feb 2026 10:00:00 +0900")
+        info = date_utils._parse_standard_datetime.cache_info()
+        assert info.misses == 1
+        assert info.hits == 4
+
+    def test_dateutil_result_not_cached(self):
+        """빠진 필드를 현재 시각으로 채우는 dateutil 결과는 매번 다시 계산."""
+        from news_collector.utils import date_utils
+
+        with patch.object(date_utils.dateutil_parser, "parse", wraps=date_utils.dateutil_parser.parse) as parse:
+            for _ in range(3):
+                self.normalizer._parse_datetime("Feb 5 10:00")
+        assert parse.call_count == 3
+
+    def test_non_string_input(self):
+        assert self.normalizer._parse_datetime(["2026-02-05"]) is None
+
+    def test_fallback_to_dateutil(self):
+        dt = self.normalizer._parse_datetime("2026.02.05 10:00")
+        assert dt == datetime(2026, 2, 5, 10, 0)
+
     def test_none_input(self):
         assert self.normalizer._parse_datetime(None) is None
 
@@ -139,6 +284,28 @@ class TestInferCategory:
         # 매칭이 안 될 수 있음
         assert result is None or isinstance(result, str)
 
+    def test_mapping_order_wins(self):
+        # 본문 위치와 관계없이 CATEGORY_MAPPING 앞쪽 카테고리 우선
+        assert self.normalizer._infer_category("", "주식 급등에 국회 긴급 회의") == "정치"
+
+    def test_substring_keyword_beats_later_token(self):
+        # 단어 일부인 키워드도 매칭: "국회의원" 안의 "국회"로 정치가 우선
+        assert self.normalizer._infer_category("", "주식 보유 국회의원") == "정치"
+        assert self.normalizer._infer_category("", "인공지능반도체 투자") == "IT"
+
+    def test_overlapping_keywords_keep_priority(self):
+        # "entertainment"(연예) 안의 "ai"(IT)도 매칭되어 앞선 카테고리 IT 선택
+        with patch.object(news_normalizer, "_CATEGORY_AUTOMATON", None):
+            assert self.normalizer._infer_category("", "entertainment") == "IT"
+        assert self.normalizer._infer_category("", "entertainment") == "IT"
+
+    def test_keyword_scan_without_automaton(self):
+        """pyahocorasick이 없을 때도 동일하게 추론."""
+        with patch.object(news_normalizer, "_CATEGORY_AUTOMATON", None):
+            assert self.normalizer._infer_category("", "주식 급등에 국회 긴급 회의") == "정치"
+            assert self.normalizer._infer_category("tech", "AI 기술 발표") == "IT"
+            assert self.normalizer._infer_category("", "일반적인 내용") is None
+
 
 # ═══════════════════════════════════════════════════════════
 # 이미지 URL 추출 테스트
@@ -166,6 +333,18 @@ class TestExtractImageUrls:
     def test_empty_html(self):
         assert self.normalizer._extract_image_urls("") == []
 
+    def test_image_tag_variants(self):
+        html = '<p>본문</p><IMG SRC="a.jpg"><image src="b.jpg">'
+        expected = ["a.jpg", "b.jpg"] if news_normalizer.LexborHTMLParser else ["a.jpg"]
+        assert self.normalizer._extract_image_urls(html) == expected
+
+    def test_clean_html_with_images_single_parse(self):
+        html = '<p>본문 &amp; 내용</p><script>x = "<img src=s.jpg>"</script><img src="a.jpg">'
+        expected = ("본문 & 내용", ["a.jpg"])
+        assert self.normalizer._clean_html_with_images(html) == expected
+        with patch.object(news_normalizer, "LexborHTMLParser", None):
+            assert self.normalizer._clean_html_with_images(html) == expected
+
 
 # ═══════════════════════════════════════════════════════════
 # normalize() 통합 테스트
@@ -186,6 +365,12 @@ class TestNormalize:
         assert result.url == "https://example.com/news/1"
         assert result.id  # UUID 생성
 
+    def test_normalize_ids_are_unique_hex(self):
+        raw = _make_raw()
+        ids = {self.normalizer.normalize(raw).id for _ in range(50)}
+        assert len(ids) == 50
+        assert all(len(i) == 32 and int(i, 16) >= 0 for i in ids)
+
     def test_normalize_with_source(self):
         raw = _make_raw()
         source = _make_source(tier="tier1")
@@ -264,3 +449,106 @@ class TestNormalizeBatch:
     def test_batch_empty_list(self):
         results = self.normalizer.normalize_batch([])
         assert results == []
+
+    def test_parallel_batch_matches_serial(self):
+        raws = [
+            _make_raw(url=f"https://example.com/{i}", raw_data={
+                "title": f"[LIVE] 중계 {i}" if i % 7 == 0 else f"AI 기술 뉴스 {i}",
+                "description": f"<p>본문 {i}</p>",
+                "pubDate": "2026-02-05T10:00:00+09:00",
+            })
+            for i in range(PARALLEL_BATCH_THRESHOLD + 30)
+        ]
+        serial = NewsNormalizer().normalize_batch(raws)
+        parallel = NewsNormalizer(max_workers=2).normalize_batch(raws)
+        assert len(parallel) == len(serial) < len(raws)
+        assert [n.raw_record_id for n in parallel] == [n.raw_record_id for n in serial]
+        assert [n.body for n in parallel] == [n.body for n in serial]
+
+    def test_batch_mixed_rfc2822_offsets_comparable(self):
+        """-0000과 +0900 pubDate가 섞여도 게시 시각끼리 비교 가능 (tz-aware)."""
+        raws = [
+            _make_raw(url=f"https://example.com/{i}", raw_data={"title": f"경제 뉴스 {i}", "pubDate": date})
+            for i, date in enumerate(
+                ["Thu, 05 Feb 2026 10:00:00 -0000", "Thu, 05 Feb 2026 11:00:00 +0900"]
+            )
+        ]
+        results = self.normalizer.normalize_batch(raws)
+        assert all(r.published_at.tzinfo is not None for r in results)
+        assert max(r.published_at for r in results) == datetime(2026, 2, 5, 10, 0, tzinfo=timezone.utc)
+
+    def test_parallel_batch_falls_back_on_pickling_error(self):
+        """워커로 보낼 수 없는 레코드가 있으면 순차 처리로 전환."""
+        raws = [
+            _make_raw(url=f"https://example.com/{i}", raw_data={"title": f"AI 기술 뉴스 {i}"})
+            for i in range(PARALLEL_BATCH_THRESHOLD + 1)
+        ]
+        raws[0].raw_data["callback"] = lambda: None  # 피클링 불가
+        results = NewsNormalizer(max_workers=2).normalize_batch(raws)
+        assert len(results) == len(raws)
+
+    def test_worker_uses_caller_config(self):
+        """워커 정규화기는 호출 측 설정으로 생성."""
+        config = object()
+        news_normalizer._init_worker(config, {}, ())
+        try:
+            assert news_normalizer._worker_normalizer._config is config
+        finally:
+            news_normalizer._worker_normalizer = None
+
+    def test_batch_filters_video_news(self):
+        raws = [
+            _make_raw(url="https://example.com/1", raw_data={"title": "[LIVE] 대통령 기자회견"}),
+            _make_raw(url="https://example.com/2", raw_data={"title": "AI 기술 발표"}),
+        ]
+        results = self.normalizer.normalize_batch(raws)
+        assert [r.url for r in results] == ["https://example.com/2"]
+        assert results[0].category == "IT"
+        assert len(self.normalizer.normalize_batch(raws, filter_video_news=False)) == 2
+
+    def test_batch_filters_by_target_date(self):
+        raws = [
+            _make_raw(url="https://example.com/in", raw_data={
+                "title": "AI 기술 발표", "description": "본문", "pubDate": "2026-02-05T10:00:00+09:00",
+            }),
+            _make_raw(url="https://example.com/out", raw_data={
+                "title": "AI 기술 발표", "description": "본문", "pubDate": "2026-01-20T10:00:00+09:00",
+            }),
+        ]
+        results = self.normalizer.normalize_batch(raws, target_date=datetime(2026, 2, 5))
+        assert [r.url for r in results] == ["https://example.com/in"]
+
+    def test_date_filter_runs_before_body_processing(self):
+        raw = _make_raw(raw_data={"title": "AI 기술 발표", "pubDate": "2026-01-20T10:00:00+09:00"})
+        with patch.object(NewsNormalizer, "_clean_html_with_images") as clean:
+            results = self.normalizer.normalize_batch([raw], target_date=datetime(2026, 2, 5))
+        assert results == []
+        clean.assert_not_called()
+
+    def test_max_workers_none_uses_cpu_count(self):
+        with patch.object(news_normalizer.os, "cpu_count", return_value=4):
+            assert NewsNormalizer(max_workers=None)._max_workers == 4
+        with patch.object(news_normalizer.os, "cpu_count", return_value=None):
+            assert NewsNormalizer(max_workers=None)._max_workers == 1
+
+    def test_batch_ids_unique_hex(self):
+        raws = [_make_raw(url=f"https://example.com/{i}") for i in range(20)]
+        ids = [r.id for r in self.normalizer.normalize_batch(raws)]
+        assert len(set(ids)) == 20
+        assert all(len(i) == 32 and int(i, 16) >= 0 for i in ids)
+        assert news_normalizer._generate_ids(0) == []
+
+    def test_batch_shares_normalized_timestamp(self):
+        raws = [_make_raw(url=f"https://example.com/{i}") for i in range(3)]
+        results = self.normalizer.normalize_batch(raws)
+        assert len({r.normalized_timestamp for r in results}) == 1
+
+    def test_normalize_uses_given_now(self):
+        now = datetime(2024, 1, 4, 12, 0, tzinfo=timezone.utc)
+        raw = _make_raw()
+        raw.fetch_timestamp = None
+        raw.raw_data.pop("pubDate", None)
+        result = self.normalizer.normalize(raw, now=now)
+        assert result.normalized_timestamp == now
+        assert result.crawl_timestamp == now
+        assert result.published_at == now
@@ -1,6 +1,6 @@
 """ParameterParser 테스트"""
 
-from datetime import datetime
+from datetime import datetime, timezone
 
 import pytest
 
@@ -62,6 +62,24 @@ class TestDateParsing:
         q = parser.parse(params)
         assert q.date_from.hour == 10
 
+    def test_date_string_utc_suffix(self, parser: ParameterParser) -> None:
+        """Z 접미사 ISO 문자열은 UTC."""
+        params = {"date_from": "2026-02-01T10:00:00Z"}
+        q = parser.parse(params)
+        assert q.date_from == datetime(2026, 2, 1, 10, 0, tzinfo=timezone.utc)
+
+    def test_date_string_rfc2822(self, parser: ParameterParser) -> None:
+        """RFC 2822 형식 문자열."""
+        params = {"date_from": "Sun, 01 Feb 2026 10:00:00 +0900"}
+        q = parser.parse(params)
+        assert q.date_from == datetime(2026, 2, 1, 1, 0, tzinfo=timezone.utc)
+
+    def test_date_string_other_format(self, parser: ParameterParser) -> None:
+        """그 외 형식은 dateutil로 처리."""
+        params = {"date_from": "2026/02/01"}
+        q = parser.parse(params)
+        assert q.date_from == datetime(2026, 2, 1)
+
     def test_date_datetime_object(self, parser: ParameterParser) -> None:
         """datetime 객체 그대로."""
         dt = datetime(2026, 2, 1)
@@ -137,6 +155,12 @@ class TestTypeParsing:
         q = parser.parse(params)
         assert q.verified_sources_only is False
 
+    def test_bool_truthy_vocabulary(self, parser: ParameterParser) -> None:
+        """'on', 'Y' 등도 참으로 해석."""
+        for value in ("on", "Y", "t", "YES"):
+            assert parser.parse({"verified_sources_only": value}).verified_sources_only is True
+        assert parser.parse({"verified_sources_only": "off"}).verified_sources_only is False
+
     def test_bool_native(self, parser: ParameterParser) -> None:
         """네이티브 bool."""
         params = {"diversity": True}
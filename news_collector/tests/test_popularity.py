@@ -187,3 +187,24 @@ class TestPopularityScorerIntegration:
         news = _make_news(view_count=100)
         result = self.scorer.score(news, [])
         assert result["popularity_score"] >= 0
+
+
+class TestScoreBatch:
+    """score_batch() 테스트."""
+
+    def setup_method(self):
+        self.scorer = PopularityScorer()
+
+    def test_matches_per_item_score(self):
+        """각 기사에 score(news, batch)를 호출한 결과와 동일."""
+        old = _now() - timedelta(days=30)
+        batch = [
+            _make_news(id="1", view_count=100, share_count=10, comment_count=5),
+            _make_news(id="2", view_count=5000, published_at=old),
+            _make_news(id="3", published_at=old - timedelta(hours=12)),
+            _make_news(id="4"),
+        ]
+        assert self.scorer.score_batch(batch) == [self.scorer.score(n, batch) for n in batch]
+
+    def test_empty_batch(self):
+        assert self.scorer.score_batch([]) == []
@@ -56,6 +56,12 @@ class TestQuerySpecPostInit:
         q = QuerySpec(keywords="AI")
         assert q.keywords == ["AI"]
 
+    def test_string_exclude_keywords_to_list(self) -> None:
+        """제외 키워드만 넘겨도 리스트로 변환."""
+        q = QuerySpec(exclude_keywords="광고")
+        assert q.exclude_keywords == ["광고"]
+        assert q.category is None and q.keywords is None
+
     def test_list_stays_list(self) -> None:
         """리스트는 그대로 유지."""
         q = QuerySpec(category=["정치", "경제"])
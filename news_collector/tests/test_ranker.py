@@ -1,10 +1,13 @@
 """Module 9: Ranker 테스트"""
 
 from datetime import datetime, timezone, timedelta
+from unittest.mock import patch
 
 import pytest
 
-from news_collector.ranking.ranker import Ranker, RANKING_PRESETS, DEFAULT_WEIGHTS
+from news_collector.ranking.ranker import (
+    Ranker, RANKING_PRESETS, DEFAULT_WEIGHTS, _DEFAULT_WEIGHT_VECTOR, _PRESET_WEIGHT_VECTORS,
+)
 from news_collector.models.news import NormalizedNews, NewsWithScores
 
 
@@ -59,7 +62,7 @@ class TestCalculateFinalScore:
             quality_score=1.0,
             credibility_score=1.0,
         )
-        score = self.ranker._calculate_final_score(news, DEFAULT_WEIGHTS)
+        score = self.ranker._weighted_final_score(news, _DEFAULT_WEIGHT_VECTOR)
         assert score == 100.0
 
     def test_zero_scores(self):
@@ -69,7 +72,7 @@ class TestCalculateFinalScore:
             quality_score=0.0,
             credibility_score=0.0,
         )
-        score = self.ranker._calculate_final_score(news, DEFAULT_WEIGHTS)
+        score = self.ranker._weighted_final_score(news, _DEFAULT_WEIGHT_VECTOR)
         assert score == 0.0
 
     def test_quality_preset_weights(self):
@@ -79,7 +82,7 @@ class TestCalculateFinalScore:
             quality_score=0.9,
             credibility_score=0.7,
         )
-        score = self.ranker._calculate_final_score(news, RANKING_PRESETS["quality"])
+        score = self.ranker._weighted_final_score(news, _PRESET_WEIGHT_VECTORS["quality"])
         assert 0 < score < 100
 
 
@@ -93,26 +96,28 @@ class TestPolicyFilter:
     def setup_method(self):
         self.ranker = Ranker()
 
+    def _passed(self, news_list):
+        return [n for n in news_list if not self.ranker._excluded_by_policy(n)]
+
     def test_pass_filter(self):
         news_list = [_make_scored(integrity_score=0.8, credibility_score=0.7, spam_score=0.1)]
-        result = self.ranker._apply_policy_filter(news_list)
+        result = self._passed(news_list)
         assert len(result) == 1
+        assert self.ranker._policy_flags(result[0]) == []
 
     def test_low_integrity_filtered(self):
         news_list = [_make_scored(integrity_score=0.3, credibility_score=0.7, spam_score=0.1)]
-        result = self.ranker._apply_policy_filter(news_list)
-        assert len(result) == 0
+        assert len(self._passed(news_list)) == 0
 
     def test_high_spam_filtered(self):
         news_list = [_make_scored(integrity_score=0.8, credibility_score=0.7, spam_score=0.8)]
-        result = self.ranker._apply_policy_filter(news_list)
-        assert len(result) == 0
+        assert len(self._passed(news_list)) == 0
 
     def test_low_credibility_flagged_but_kept(self):
         news_list = [_make_scored(integrity_score=0.8, credibility_score=0.3, spam_score=0.1)]
-        result = self.ranker._apply_policy_filter(news_list)
+        result = self._passed(news_list)
         assert len(result) == 1
-        assert "suspicious_credibility" in result[0].policy_flags
+        assert "suspicious_credibility" in self.ranker._policy_flags(result[0])
 
     def test_mixed_filtering(self):
         news_list = [
@@ -120,7 +125,7 @@ class TestPolicyFilter:
             _make_scored(id="bad_integrity", integrity_score=0.2, credibility_score=0.7, spam_score=0.1),
             _make_scored(id="spam", integrity_score=0.8, credibility_score=0.7, spam_score=0.9),
         ]
-        result = self.ranker._apply_policy_filter(news_list)
+        result = self._passed(news_list)
         assert len(result) == 1
         assert result[0].id == "good"
 
@@ -176,6 +181,18 @@ class TestDiversity:
         result = self.ranker._ensure_diversity(news_list)
         assert len(result) == 5  # BBC 3개 + CNN 1개 + Reuters 1개
 
+    def test_sorted_diverse_reaches_past_dominant_source(self):
+        """상위권을 한 소스가 독점해도 전체 정렬과 같은 결과 (후보 범위 확장)."""
+        news_list = [
+            _make_scored(id=f"a{i}", source_id="src_a", final_score=90.0 - i * 0.1)
+            for i in range(50)
+        ] + [
+            _make_scored(id=f"b{i}", source_id=f"src_b{i}", final_score=10.0 - i)
+            for i in range(5)
+        ]
+        result = self.ranker._sorted_diverse(news_list, lambda n: n.final_score, limit=5)[:5]
+        assert [n.id for n in result] == ["a0", "a1", "a2", "b0", "b1"]
+
 
 # ═══════════════════════════════════════════════════════════
 # rank() 전체 파이프라인 테스트
@@ -225,6 +242,56 @@ class TestRankPipeline:
         results = self.ranker.rank(news_list, preset="nonexistent")
         assert len(results) > 0
 
+    def test_policy_flags_on_results(self):
+        """반환 기사에는 신뢰도 미달 시 suspicious_credibility 플래그."""
+        news_list = [
+            _make_news(id="1", source_id="src_a", source_tier="tier1", url="https://a.com/1"),
+            _make_news(id="2", source_id="src_b", source_tier="tier3", url="https://b.com/2"),
+        ]
+        results = self.ranker.rank(news_list, limit=10)
+        assert {r.id for r in results} == {"1", "2"}
+        for r in results:
+            expected = ["suspicious_credibility"] if r.credibility_score < 0.6 else []
+            assert r.policy_flags == expected
+        assert any(r.policy_flags for r in results)
+
+    def test_policy_gate_skips_scoring_excluded_news(self):
+        """정책 필터 제외 대상은 무결성 평가 후 신뢰도 점수를 계산하지 않음."""
+        good = _make_news(id="good", source_id="src_a", url="https://a.com/1")
+        spam = _make_news(
+            id="spam", source_id="src_b", url="https://b.com/2",
+            title="[충격] 카지노 도박 무료배송 특가",
+            body="클릭 클릭. 클릭 클릭. 클릭 클릭. 클릭 클릭. 지금구매 광고 할인",
+        )
+        assert self.ranker._excluded_by_policy(self.ranker._score_all([spam])[0])
+
+        scorer = self.ranker._credibility_scorer
+        with patch.object(scorer, "score_batch", wraps=scorer.score_batch) as score_batch:
+            scored = self.ranker._score_all([good, spam], policy_gate=True)
+        assert [n.id for n in scored] == ["good"]
+        # 신뢰도는 통과한 기사만 채점하되, 크로스 소스 비교는 배치 전체와
+        (scored_news, all_news), _ = score_batch.call_args
+        assert [n.id for n in scored_news] == ["good"]
+        assert [n.id for n in all_news] == ["good", "spam"]
+
+    def test_final_score_matches_preset_weights(self):
+        """rank()의 최종 점수는 프리셋 가중치 딕셔너리로 직접 계산한 가중 합과 동일."""
+        news_list = [
+            _make_news(id=str(i), source_id=f"src_{i}", url=f"https://example.com/{i}",
+                       source_tier=tier)
+            for i, tier in enumerate(["whitelist", "tier1", "tier2", "tier3"])
+        ]
+        for preset in list(RANKING_PRESETS) + ["nonexistent"]:
+            weights = RANKING_PRESETS.get(preset, DEFAULT_WEIGHTS)
+            for r in self.ranker.rank(news_list, preset=preset, keywords=["경제"]):
+                expected = round((
+                    r.popularity_score * weights["popularity"]
+                    + r.relevance_score * weights["relevance"]
+                    + r.quality_score * weights["quality"]
+                    + r.credibility_score * weights["credibility"]
+                ) * 100, 1)
+                assert r.final_score == expected
+
     def test_ranking_order(self):
         """점수 높은 기사가 먼저 와야 함."""
         news_list = [
@@ -265,3 +332,97 @@ class TestPresets:
         expected_keys = {"popularity", "relevance", "quality", "credibility"}
         for name, weights in RANKING_PRESETS.items():
             assert set(weights.keys()) == expected_keys, f"프리셋 {name} 키 불일치"
+
+
+# ═══════════════════════════════════════════════════════════
+# NewsWithScores 변환 테스트
+# ═══════════════════════════════════════════════════════════
+
+class TestFromNormalized:
+    """NewsWithScores.from_normalized() 테스트."""
+
+    def test_copies_all_normalized_fields(self):
+        news = _make_news(category="경제", tags=["a"], image_urls=["https://img/1"], cluster_id="c1")
+        nws = NewsWithScores.from_normalized(news)
+        for name in NormalizedNews.__dataclass_fields__:
+            assert getattr(nws, name) == getattr(news, name), name
+
+    def test_scores_start_at_defaults(self):
+        nws = NewsWithScores.from_normalized(_make_news())
+        assert nws.final_score == 0.0
+        assert nws.rank_position == 0
+        assert nws.integrity_flags == []
+        assert nws.policy_flags == []
+
+
+# ═══════════════════════════════════════════════════════════
+# 관련성 점수 테스트
+# ═══════════════════════════════════════════════════════════
+
+class TestCalculateRelevance:
+    """키워드 관련성 점수 테스트."""
+
+    def setup_method(self):
+        self.ranker = Ranker()
+
+    def test_title_and_body_match(self):
+        """제목 0.6 + 본문 0.3 + 본문 빈도 보너스(회당 0.05)."""
+        news = _make_news(title="반도체 수출", body="반도체 반도체 호조", category=None)
+        assert self.ranker._calculate_relevance(news, ["반도체"]) == pytest.approx(1.0)
+        news = _make_news(title="수출 호조", body="반도체 업황", category=None)
+        assert self.ranker._calculate_relevance(news, ["반도체"]) == pytest.approx(0.35)
+
+    def test_synonym_match(self):
+        """동의어로만 매칭되어도 점수 부여."""
+        news = _make_news(title="파운드리 투자 확대", body="업계 동향", category=None)
+        assert self.ranker._calculate_relevance(news, ["반도체"]) == pytest.approx(0.6)
+
+    def test_title_term_beats_body_only_synonym(self):
+        """제목 매칭(0.6)은 본문에만 많이 나온 관련어(최대 0.6)보다 낮지 않음."""
+        news = _make_news(title="반도체 전망", body="칩 " * 10, category=None)
+        assert self.ranker._calculate_relevance(news, ["반도체"]) == pytest.approx(0.6)
+        news = _make_news(title="반도체 전망", body="반도체 칩 " * 10, category=None)
+        assert self.ranker._calculate_relevance(news, ["반도체"]) == pytest.approx(1.0)
+
+    def test_uppercase_synonym_key(self):
+        """대문자 키("IT")의 관련어도 소문자 키워드로 조회됨."""
+        news = _make_news(title="소프트웨어 업계 동향", body="", category=None)
+        assert self.ranker._calculate_relevance(news, ["IT"]) == pytest.approx(0.6)
+
+    def test_no_match(self):
+        news = _make_news(title="날씨", body="맑음", category=None)
+        assert self.ranker._calculate_relevance(news, ["반도체"]) == 0.0
+
+    def test_category_bonus(self):
+        news = _make_news(title="날씨", body="맑음", category="경제")
+        assert self.ranker._calculate_relevance(news, ["경제"]) == pytest.approx(0.1)
+
+    def test_overlapping_occurrences_counted_like_str_count(self):
+        """겹치는 등장은 str.count처럼 한 번만 셈 (오토마톤 유무와 무관)."""
+        news = _make_news(title="웃음", body="ㅋㅋㅋㅋㅋ", category=None)
+        # "ㅋㅋ"는 겹치지 않게 2회 → 0.3 + 0.1
+        assert self.ranker._calculate_relevance(news, ["ㅋㅋ"]) == pytest.approx(0.4)
+
+    def test_plan_reused_across_news(self):
+        """배치용 plan을 넘겨도 결과는 동일."""
+        keywords = ["반도체", "선거"]
+        plan = self.ranker._build_relevance_plan(keywords)
+        for news in (
+            _make_news(title="반도체 수출", body="칩 수요 증가", category=None),
+            _make_news(title="대선 후보", body="투표 일정", category=None),
+        ):
+            assert self.ranker._calculate_relevance(news, keywords, plan) == \
+                self.ranker._calculate_relevance(news, keywords)
+
+    def test_category_bonus_with_shared_plan(self):
+        """plan을 공유해도 카테고리별로 보너스 판정 (부분 문자열 양방향)."""
+        keywords = ["경제", "IT과학"]
+        plan = self.ranker._build_relevance_plan(keywords)
+        expected = {"경제": 0.1, "IT": 0.1, "국제경제": 0.1, "스포츠": 0.0}
+        for category, bonus in expected.items():
+            news = _make_news(title="날씨", body="맑음", category=category)
+            assert self.ranker._calculate_relevance(news, keywords, plan) == pytest.approx(bonus)
+
+    def test_blank_text_scores_zero(self):
+        news = _make_news(title="  ", body="\n", category="경제")
+        assert self.ranker._calculate_relevance(news, ["경제"]) == 0.0
@@ -5,6 +5,7 @@ from zoneinfo import ZoneInfo
 
 import pytest
 
+from news_collector.models.query_spec import QuerySpec
 from news_collector.parsers.request_parser import RequestParser
 from news_collector.utils.config_manager import ConfigManager
 
@@ -117,3 +118,11 @@ class TestDefaults:
         assert q.country == "KR"
         assert q.language == "ko"
         assert q.diversity is True
+
+    def test_none_fields_filled_from_config(self, parser: RequestParser) -> None:
+        """None으로 비운 필드는 설정 기본값으로 채움 (market 포함)."""
+        q = QuerySpec(locale=None, timezone=None, country=None, language=None, market=None)
+        q = parser._apply_defaults(q)
+        assert (q.locale, q.timezone, q.country, q.language, q.market) == (
+            "ko_KR", "Asia/Seoul", "KR", "ko", "ko_KR",
+        )
@@ -205,7 +205,7 @@ class TestStateManagement:
         registry.record_success("naver_news")
         naver = registry.get("naver_news")
         assert naver.last_crawled is not None
-        assert naver.last_success is not None
+        assert naver.last_success == naver.last_crawled
         assert naver.failure_count == 0
 
     def test_record_failure(self, registry: SourceRegistry) -> None:
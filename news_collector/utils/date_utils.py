@@ -0,0 +1,58 @@
+"""날짜 문자열 파싱 유틸리티"""
+
+import functools
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+from dateutil import parser as dateutil_parser
+
+
+def parse_datetime(date_str: str) -> Optional[datetime]:
+    """
+    피드/파라미터의 날짜 문자열을 datetime으로 변환.
+
+    대부분의 입력은 ISO 8601(API) 또는 RFC 2822(RSS pubDate)이므로 C로 구현된
+    표준 라이브러리 파서를 먼저 시도하고, 둘 다 실패할 때만 형식을 추측하는
+    dateutil로 처리한다.
+
+    Args:
+        date_str: 날짜 문자열.
+
+    Returns:
+        파싱된 datetime. 해석할 수 없으면 None.
+    """
+    parsed = _parse_standard_datetime(date_str)
+    if parsed is not None:
+        return parsed
+    # 그 외 형식은 dateutil로 처리 (느리지만 유연함)
+    # 빠진 필드(연도, 날짜)를 현재 시각으로 채우므로 결과를 캐시하지 않음
+    try:
+        return dateutil_parser.parse(date_str)
+    except (ValueError, TypeError, OverflowError):
+        return None
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_standard_datetime(date_str: str) -> Optional[datetime]:
+    """
+    ISO 8601 / RFC 2822 형식만 파싱. 둘 다 아니면 None.
+
+    같은 피드의 기사는 pubDate가 겹치는 경우가 많아 입력 문자열 기준으로
+    결과를 캐시한다 (두 형식 모두 결과가 입력만으로 정해지고, datetime은
+    불변이므로 공유해도 안전).
+    """
+    # ISO 8601 ("Z" 접미사는 3.10 이하에서도 읽히도록 치환)
+    try:
+        return datetime.fromisoformat(date_str.replace("Z", "+00:00"))
+    except (ValueError, TypeError):
+        pass
+    # RFC 2822
+    # "-0000" 오프셋(RSS에 흔함)은 naive로 반환되므로 UTC로 지정해 다른 기사와 비교 가능하게 함
+    try:
+        parsed = parsedate_to_datetime(date_str)
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=timezone.utc)
+        return parsed
+    except (ValueError, TypeError, IndexError):
+        return None
@@ -0,0 +1,36 @@
+"""HTML 텍스트 처리 유틸리티"""
+
+
+def strip_tags(text: str) -> str:
+    """
+    HTML 태그 제거.
+
+    정규식 ``<[^>]+>`` 치환과 동일한 결과를 내지만, ``str.find``와 슬라이스만
+    사용하는 단일 패스 스캐너로 처리한다.
+    닫히지 않은 ``<`` 와 빈 ``<>`` 는 원문 그대로 둔다.
+
+    Args:
+        text: HTML이 포함된 문자열.
+
+    Returns:
+        태그가 제거된 문자열.
+    """
+    lt = text.find("<")
+    if lt < 0:
+        return text
+
+    parts = []
+    i = 0
+    while lt >= 0:
+        gt = text.find(">", lt + 1)
+        if gt < 0:
+            break
+        if gt == lt + 1:
+            # "<>"는 태그가 아님
+            parts.append(text[i:gt + 1])
+        else:
+            parts.append(text[i:lt])
+        i = gt + 1
+        lt = text.find("<", i)
+    parts.append(text[i:])
+    return "".join(parts)